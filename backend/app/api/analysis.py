@@ -11,13 +11,13 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, UTC
 from pathlib import Path
-import json
 
 from ..config import settings
 from ..services.market_data import normalize_ticker
 from ..services.indicators import TechnicalIndicators
 from ..services.triple_trend_detector import TripleTrendDetector
 from ..services.mean_reversion_detector import MeanReversionDetector
+from ..services.stock_list import load_stock_list
 
 router = APIRouter(prefix="/api/analyze")
 
@@ -27,11 +27,9 @@ def get_stock_name(ticker: str) -> str:
     try:
         metadata_file = settings.METADATA_DIR / 'stock_list.json'
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                data = json.load(f)
-                for stock in data.get('stocks', []):
-                    if stock['ticker'] == ticker or stock['ticker'] == normalize_ticker(ticker):
-                        return stock.get('name', ticker)
+            for stock in load_stock_list(metadata_file):
+                if stock['ticker'] == ticker or stock['ticker'] == normalize_ticker(ticker):
+                    return stock.get('name', ticker)
     except Exception:
         pass
         
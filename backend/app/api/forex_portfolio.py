@@ -1270,6 +1270,10 @@ async def backfill_close_type(
 
         updated = 0
         skipped = 0
+        # Calls are spaced 1s apart start-to-start: the time spent in the
+        # previous lookup counts towards the gap, and nothing waits after the last
+        loop = asyncio.get_running_loop()
+        next_call_at = loop.time()
 
         for doc in closed_docs:
             data = doc.to_dict()
@@ -1281,13 +1285,16 @@ async def backfill_close_type(
                 skipped += 1
                 continue
 
+            wait = next_call_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)  # 1 call/sec rate limit — non-blocking
+            next_call_at = loop.time() + 1
+
             close_type = OandaPriceService.get_trade_close_type(trade_id)
             doc.reference.update({'close_type': close_type, 'updated_at': datetime.utcnow()})
             updated += 1
             logger.info(f"Backfilled close_type={close_type} for trade {trade_id}")
 
-            await asyncio.sleep(1)  # 1 call/sec rate limit — non-blocking
-
         return {
             "status": "success",
             "updated": updated,
@@ -21,6 +21,7 @@ from ..config import settings
 from ..services.market_data import get_current_prices, validate_and_get_price, normalize_ticker, get_cached_price
 from ..services.indicators import TechnicalIndicators
 from ..services.triple_trend_detector import TripleTrendDetector
+from ..services.mean_reversion_detector import MeanReversionDetector
 
 router = APIRouter(prefix="/api/portfolio")
 
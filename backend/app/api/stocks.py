@@ -6,9 +6,9 @@ Endpoints for stock discovery and metadata.
 
 from fastapi import APIRouter, Query
 from typing import List, Dict
-import json
 from ..config import settings
 from ..firebase_setup import db
+from ..services.stock_list import load_stock_list
 
 router = APIRouter(prefix="/api/stocks")
 
@@ -28,9 +28,7 @@ async def search_stocks(q: str = Query(..., min_length=1)):
     local_stocks = []
     if metadata_file.exists():
         try:
-            with open(metadata_file, 'r') as f:
-                data = json.load(f)
-                local_stocks = data.get('stocks', [])
+            local_stocks = load_stock_list(metadata_file)
         except Exception as e:
             print(f"Error loading stock list: {e}")
 
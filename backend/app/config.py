@@ -51,6 +51,7 @@ class Settings(BaseSettings):
     # Data settings
     MIN_HISTORY_DAYS: int = 365
     UPDATE_INTERVAL_MINUTES: int = 240  # 4 hours
+    SCREENER_WORKERS: int = 0  # Processes for screening stocks (0 = one per CPU core)
 
     # API settings
     API_TITLE: str = "ASX Stock Screener API"
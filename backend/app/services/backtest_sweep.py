@@ -0,0 +1,69 @@
+"""
+Backtest Sweep Helpers
+
+SL/TP exit scanning, compounded equity and background data loading shared by
+the scripts/ parameter sweeps.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+
+EXIT_SCAN_WINDOW = 256  # initial bars checked per vectorized exit scan
+IO_WORKERS = 8          # threads loading data ahead of a sweep
+
+
+def find_exit(highs: np.ndarray, lows: np.ndarray, start: int,
+              sl: float, tp: float, is_buy: bool) -> Tuple[int, bool]:
+    """
+    Index of the first bar from `start` whose range touches SL or TP, and
+    whether it was TP. SL wins when a bar touches both (conservative).
+
+    Bars are tested in growing windows with array comparisons, so an early
+    exit never touches the rest of the series. Returns (-1, False) if the
+    trade is still open at the end.
+    """
+    n = len(highs)
+    window = EXIT_SCAN_WINDOW
+    while start < n:
+        end = min(start + window, n)
+        if is_buy:
+            sl_hit = lows[start:end] <= sl
+            tp_hit = highs[start:end] >= tp
+        else:
+            sl_hit = highs[start:end] >= sl
+            tp_hit = lows[start:end] <= tp
+        hits = np.flatnonzero(sl_hit | tp_hit)
+        if hits.size:
+            k = hits[0]
+            return start + k, not sl_hit[k]
+        start = end
+        window *= 2
+    return -1, False
+
+
+def compound(wins: np.ndarray, rr: float, risk_pct: float,
+             initial_balance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-trade P&L and balance after each trade, risking risk_pct of the
+    running balance: a win adds rr times the risk, a loss takes the risk.
+    """
+    growth = 1.0 + risk_pct * np.where(wins, rr, -1.0)
+    balance = initial_balance * np.cumprod(growth)
+    return np.diff(balance, prepend=initial_balance), balance
+
+
+def prefetch(load: Callable, keys: Iterable, workers: int = IO_WORKERS) -> Dict[object, Future]:
+    """
+    Start load(key) for every key on a thread pool and return key -> Future,
+    so later inputs load while earlier ones are swept.
+
+    The overlap comes mainly from disk reads: indicator passes inside `load`
+    hold the GIL for most of their work. Load errors surface from .result().
+    Wait on every future before forking worker processes.
+    """
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {key: executor.submit(load, key) for key in keys}
+    executor.shutdown(wait=False)
+    return futures
@@ -8,7 +8,7 @@ and realistic position sizing.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
@@ -16,7 +16,7 @@ from .signal_detector import SignalDetector
 from .indicators import TechnicalIndicators
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an open trading position."""
 
@@ -44,7 +44,7 @@ class Position:
         return self.entry_price * self.shares
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClosedTrade:
     """Represents a completed trade."""
 
@@ -122,6 +122,8 @@ class Backtester:
         self.open_positions: List[Position] = []
         self.closed_trades: List[ClosedTrade] = []
         self.equity_curve: List[Dict] = []
+        self._equity_peak: Optional[float] = None  # max portfolio_value in equity_curve
+        self._entry_candidates: Dict[pd.Timestamp, List[Tuple[str, int]]] = {}
 
     def run(self, stock_data: Dict[str, pd.DataFrame]) -> 'BacktestResults':
         """
@@ -143,6 +145,11 @@ class Backtester:
         all_dates = self._create_timeline(stock_data)
         print(f"Trading days in backtest: {len(all_dates)}")
 
+        # One long (date, ticker) panel of the bars that can signal, built
+        # with a single concat/groupby, so each day's entry scan only visits
+        # those bars instead of probing every ticker's index
+        self._entry_candidates = self._build_entry_candidates(stock_data, all_dates)
+
         # Event-driven simulation: process each date chronologically
         for i, current_date in enumerate(all_dates):
             if i % 50 == 0:
@@ -185,6 +192,45 @@ class Backtester:
 
         return sorted(list(all_dates))
 
+    def _build_entry_candidates(
+        self,
+        stock_data: Dict[str, pd.DataFrame],
+        all_dates: List[pd.Timestamp]
+    ) -> Dict[pd.Timestamp, List[Tuple[str, int]]]:
+        """
+        Map each trading day to the (ticker, row position) pairs worth scanning.
+
+        Detectors with a vectorized entry_signal_mask() are evaluated for
+        every bar up front, so detect_entry_signal() only runs to build the
+        details of bars that signal; other detectors get every bar. Tickers
+        keep their stock_data order within a day, so equal-score ties
+        resolve as before.
+        """
+        if not stock_data or not all_dates:
+            return {}
+
+        use_mask = hasattr(self.detector, 'entry_signal_mask')
+        panel = pd.concat(
+            {
+                ticker: pd.DataFrame(
+                    {
+                        'row': np.arange(len(df)),
+                        'candidate': self.detector.entry_signal_mask(df) if use_mask else True
+                    },
+                    index=df.index
+                )
+                for ticker, df in stock_data.items()
+            },
+            names=['ticker', 'date']
+        )
+        dates = panel.index.get_level_values('date')
+        panel = panel[panel['candidate'].to_numpy() & dates.isin(all_dates)]
+
+        candidates = {}
+        for date, day in panel.groupby(level='date', sort=False):
+            candidates[date] = list(zip(day.index.get_level_values('ticker'), day['row']))
+        return candidates
+
     def _check_exits(self, current_date: pd.Timestamp, stock_data: Dict[str, pd.DataFrame]):
         """
         Check all open positions for exit conditions.
@@ -205,28 +251,22 @@ class Backtester:
             if current_date not in df.index:
                 continue
 
-            # Get data up to current date (no lookahead)
-            df_current = df.loc[:current_date]
+            # Position of current date; the detector reads nothing past it,
+            # so the full frame is passed instead of a df.loc[:current_date] copy
+            current_index = df.index.get_loc(current_date)
 
             # CRITICAL FIX: Find entry_index in the dataframe
-            entry_index = None
-            try:
-                # Get position of entry_date in df_current's index
-                entry_index = df_current.index.get_loc(position.entry_date)
-            except KeyError:
-                # Entry date might not be in index (e.g., weekend, holiday)
-                # Find nearest previous date
-                mask = df_current.index <= position.entry_date
-                if mask.any():
-                    entry_dates = df_current.index[mask]
-                    if len(entry_dates) > 0:
-                        entry_index = len(entry_dates) - 1
+            # (entry date itself, or the nearest previous date if it is
+            # not in the index, e.g. weekend or holiday)
+            entry_index = int(df.index[:current_index + 1].searchsorted(position.entry_date, side='right')) - 1
+            if entry_index < 0:
+                entry_index = None
 
             # Use detector's exit logic with entry_index
             exit_info = self.detector.detect_exit_signal(
-                df_current,
+                df,
                 entry_price=position.entry_price,
-                current_index=-1,  # Latest bar
+                current_index=current_index,
                 entry_index=entry_index  # NEW - pass entry position
             )
 
@@ -256,18 +296,15 @@ class Backtester:
 
         # Collect all valid signals for this date
         signals = []
+        held = {p.ticker for p in self.open_positions}
 
-        for ticker, df in stock_data.items():
-            # Check if this stock has data for current date
-            if current_date not in df.index:
-                continue
-
+        for ticker, current_index in self._entry_candidates.get(current_date, ()):
             # Skip if already holding this stock
-            if any(p.ticker == ticker for p in self.open_positions):
+            if ticker in held:
                 continue
 
             # Get data up to current date (no lookahead)
-            df_current = df.loc[:current_date]
+            df_current = stock_data[ticker].iloc[:current_index + 1]
 
             # Check for entry signal
             signal_info = self.detector.detect_entry_signal(df_current)
@@ -465,16 +502,13 @@ class Backtester:
             if position.ticker in stock_data:
                 df = stock_data[position.ticker]
                 if date in df.index:
-                    current_price = df.loc[date, 'Close']
+                    current_price = float(df.loc[date, 'Close'])
                     positions_value += current_price * position.shares
 
         total_equity = self.current_capital + positions_value
 
         # Calculate drawdown
-        if self.equity_curve:
-            peak = max(e['portfolio_value'] for e in self.equity_curve)
-        else:
-            peak = self.initial_capital
+        peak = self._equity_peak if self._equity_peak is not None else self.initial_capital
 
         drawdown_pct = ((total_equity - peak) / peak) * 100 if peak > 0 else 0
 
@@ -486,6 +520,8 @@ class Backtester:
             'drawdown_pct': drawdown_pct,
             'num_positions': len(self.open_positions)
         })
+        if self._equity_peak is None or total_equity > self._equity_peak:
+            self._equity_peak = total_equity
 
     def _close_all_positions(self, date: pd.Timestamp, stock_data: Dict[str, pd.DataFrame]):
         """Close all remaining positions at end of backtest."""
@@ -502,22 +538,17 @@ class Backtester:
             df = stock_data[ticker]
 
             # Find the last available date for this stock (use date-only comparison)
-            # Filter to dates <= end_date
-            # Simple approach: compare date strings to avoid timezone complexities
-            end_date_str = date.strftime('%Y-%m-%d')
-            available_indices = []
-            for idx in df.index:
-                try:
-                    idx_str = idx.strftime('%Y-%m-%d')
-                    if idx_str <= end_date_str:
-                        available_indices.append(idx)
-                except:
-                    pass
-            available_dates = pd.Index(available_indices)
+            # Filter to dates <= end_date, comparing local calendar days so
+            # tz-aware and naive dates mix (NaT compares False and is skipped)
+            index = df.index
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            end_day = (date.tz_localize(None) if date.tz is not None else date).normalize()
+            available_dates = df.index[index.normalize() <= end_day]
 
             if len(available_dates) > 0:
                 last_date = available_dates[-1]  # Get last available date
-                exit_price = df.loc[last_date, 'Close']
+                exit_price = float(df.loc[last_date, 'Close'])
                 trade = self._close_position(position, last_date, exit_price, 'end_of_backtest')
                 self.closed_trades.append(trade)
                 print(f"DEBUG: Closed {ticker} at ${exit_price:.2f}, P&L: ${trade.pnl:.2f}")
@@ -33,6 +33,10 @@ class CommoditySniperDetector(ForexStrategy):
         'BCO_USD': [8, 14, 15]     # 41% of losses occurred in these hours
     }
 
+    # Columns read by the entry rules on each timeframe
+    BASE_COLUMNS = ('Close', 'BB_Upper', 'BB_Lower', 'BB_Middle', 'BB_Width', 'Bull_FVG', 'Bear_FVG')
+    HTF_COLUMNS = ('ADX', 'DIPlus', 'DIMinus')
+
     def __init__(self):
         """
         Initialize Commodity Sniper detector.
@@ -109,9 +113,7 @@ class CommoditySniperDetector(ForexStrategy):
         if 'Bull_FVG' not in df_5m.columns:
             df_5m = TechnicalIndicators.add_all_indicators(df_5m)
 
-        latest_5m = df_5m.iloc[-1]
-        prev_5m = df_5m.iloc[-2]
-        current_time = latest_5m.name
+        current_time = df_5m.index[-1]
 
         # === CRITICAL: Candle Freshness Check ===
         # Don't generate signals from stale candles (prevents trading on old data)
@@ -133,6 +135,146 @@ class CommoditySniperDetector(ForexStrategy):
             # If timestamp parsing fails, continue (don't block on this check)
             pass
 
+        if df_15m is None or len(df_15m) < 20:
+            # FILTER 5 needs a 15m trend reading
+            return None
+        if 'ADX' not in df_15m.columns:
+            df_15m = TechnicalIndicators.calculate_adx(df_15m)
+
+        return self._evaluate(
+            self.column_arrays(df_5m, self.BASE_COLUMNS), len(df_5m) - 1,
+            self.column_arrays(df_15m, self.HTF_COLUMNS), len(df_15m) - 1,
+            current_time, symbol, target_rr, spread,
+            squeeze_threshold, adx_min, require_fvg, cooldown_hours, high_loss_hours
+        )
+
+    @staticmethod
+    def column_arrays(df: pd.DataFrame, columns) -> Dict[str, np.ndarray]:
+        """Extract the given indicator columns as NumPy arrays."""
+        return {col: df[col].to_numpy() for col in columns}
+
+    def raw_candidates(self, df_base: pd.DataFrame, df_htf: pd.DataFrame, symbol: str, spread: float = 0.0,
+                       high_loss_hours: Optional[List[int]] = None,
+                       htf_positions: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Vectorized analyze() filters for grid searches over whole frames.
+
+        Keeps every breakout bar that passes the time filter, the 15m trend
+        direction and the stop loss and history checks, together with the
+        values the squeeze, ADX and FVG settings are tested against, so each
+        setting is a select_candidates() mask over the same candidates.
+
+        Returns:
+            Dict of arrays aligned with 'index' (bar positions in `df_base`):
+            'is_buy', 'price', 'stop_loss', 'bb_width', 'min_width_96',
+            'adx_15m', 'has_fvg'.
+        """
+        bars = self._breakout_arrays(df_base, df_htf, symbol, spread, high_loss_hours, htf_positions)
+        index = np.flatnonzero(bars['candidate'])
+        raw = {key: bars[key][index] for key in
+               ('is_buy', 'stop_loss', 'bb_width', 'min_width_96', 'adx_15m', 'has_fvg')}
+        raw['index'] = index
+        raw['price'] = df_base['Close'].to_numpy()[index]
+        return raw
+
+    @staticmethod
+    def select_candidates(candidates: Dict[str, np.ndarray], params: Optional[Dict] = None) -> np.ndarray:
+        """Mask of the raw_candidates() entries that pass the squeeze, ADX and FVG settings in `params`."""
+        if params is None:
+            params = {}
+        squeeze_threshold = params.get("squeeze_threshold", 1.3)
+        adx_min = params.get("adx_min", 20.0)
+        require_fvg = params.get("require_fvg", False)
+
+        # FILTER 3: Squeeze against the narrowest width of the previous 96 candles
+        mask = candidates['bb_width'] <= candidates['min_width_96'] * squeeze_threshold
+        # FILTER 5: 15m trend strength
+        mask &= ~(candidates['adx_15m'] < adx_min)
+        # FILTER 6: FVG in the 5 candles before the breakout (optional)
+        if require_fvg:
+            mask &= candidates['has_fvg']
+        return mask
+
+    def _breakout_arrays(self, df_base: pd.DataFrame, df_htf: pd.DataFrame, symbol: str, spread: float,
+                         high_loss_hours: Optional[List[int]], htf_positions: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Whole-column inputs of raw_candidates(). 'candidate' marks the bars that
+        pass every filter except the squeeze, ADX and FVG settings.
+        """
+        n = len(df_base)
+        close = df_base['Close'].to_numpy()
+        bb_upper = df_base['BB_Upper'].to_numpy()
+        bb_lower = df_base['BB_Lower'].to_numpy()
+        bb_width = df_base['BB_Width'].to_numpy()
+
+        # Narrowest BB width of the previous 96 candles (read from a
+        # precomputed BB_Width_Min96 column when the frame has one)
+        if 'BB_Width_Min96' in df_base.columns:
+            min_width_96 = df_base['BB_Width_Min96'].to_numpy().astype(bb_width.dtype)
+        else:
+            min_width_96 = (
+                df_base['BB_Width'].rolling(96, min_periods=1).min().shift(1)
+                .to_numpy().astype(bb_width.dtype)
+            )
+
+        # FILTER 4: Breakout (initial cross only)
+        breakout_up = np.zeros(n, dtype=bool)
+        breakout_down = np.zeros(n, dtype=bool)
+        breakout_up[1:] = (close[1:] > bb_upper[1:]) & (close[:-1] <= bb_upper[:-1])
+        breakout_down[1:] = (close[1:] < bb_lower[1:]) & (close[:-1] >= bb_lower[:-1])
+        candidate = breakout_up | breakout_down
+
+        # FILTER 1: Time filter
+        blocked_hours = high_loss_hours
+        if blocked_hours is None:
+            blocked_hours = self.HIGH_LOSS_HOURS.get(symbol, [])
+        if blocked_hours:
+            candidate &= ~np.isin(df_base.index.hour, blocked_hours)
+
+        # FILTER 5: 15m trend direction at the last closed 15m candle
+        if htf_positions is None:
+            htf_positions = df_htf.index.searchsorted(df_base.index, side='right') - 1
+        idx = np.clip(htf_positions, 0, None)
+        adx_15m = df_htf['ADX'].to_numpy()[idx]
+        di_plus_15m = df_htf['DIPlus'].to_numpy()[idx]
+        di_minus_15m = df_htf['DIMinus'].to_numpy()[idx]
+        candidate &= ~(breakout_up & (di_plus_15m < di_minus_15m))
+        candidate &= ~(~breakout_up & (di_minus_15m < di_plus_15m))
+
+        # FILTER 6 input: FVG of the breakout's direction in the 5 candles before it
+        recent = {}
+        for col in ('Bull_FVG', 'Bear_FVG'):
+            seen = np.concatenate(([0], np.cumsum(df_base[col].to_numpy().astype(bool))))
+            recent[col] = np.zeros(n, dtype=bool)
+            recent[col][5:] = seen[5:n] > seen[:n - 5]
+        has_fvg = np.where(breakout_up, recent['Bull_FVG'], recent['Bear_FVG'])
+
+        # Stop loss beyond the BB middle, at least 0.5% away plus padding
+        price = close.astype(np.float64)
+        bb_middle = df_base['BB_Middle'].to_numpy().astype(np.float64)
+        padding = spread if spread > 0 else price * 0.0005
+        min_dist = price * 0.005
+        stop_loss = np.where(
+            breakout_up,
+            np.minimum(bb_middle, price - min_dist) - padding,
+            np.maximum(bb_middle, price + min_dist) + padding
+        )
+        candidate &= stop_loss != price
+
+        # History requirements: 100 base bars and 20 closed 15m candles
+        candidate[:100] = False
+        candidate &= htf_positions >= 19
+
+        return {
+            'candidate': candidate, 'is_buy': breakout_up, 'stop_loss': stop_loss,
+            'bb_width': bb_width, 'min_width_96': min_width_96,
+            'adx_15m': adx_15m, 'has_fvg': has_fvg
+        }
+
+    def _evaluate(self, base: Dict[str, np.ndarray], i: int, htf: Dict[str, np.ndarray], htf_idx: int,
+                  current_time, symbol: str, target_rr: float, spread: float,
+                  squeeze_threshold: float, adx_min: float, require_fvg: bool,
+                  cooldown_hours: int, high_loss_hours: Optional[List[int]]) -> Optional[Dict]:
         # FILTER 1: Time Filter (Block high-loss hours)
         if not self._check_time_filter(current_time, symbol, high_loss_hours):
             return None
@@ -141,52 +283,50 @@ class CommoditySniperDetector(ForexStrategy):
         if not self._check_cooldown(current_time, symbol, cooldown_hours):
             return None
 
+        close = base['Close']
+        bb_upper = base['BB_Upper']
+        bb_lower = base['BB_Lower']
+        bb_width = base['BB_Width']
+
         # FILTER 3: 5m Squeeze Detection
-        min_width_96 = df_5m['BB_Width'].iloc[-97:-1].min()
-        is_squeeze = latest_5m['BB_Width'] <= min_width_96 * squeeze_threshold
+        min_width_96 = np.nanmin(bb_width[i - 96:i])
+        is_squeeze = bb_width[i] <= min_width_96 * squeeze_threshold
 
         if not is_squeeze:
             return None
 
         # FILTER 4: 5m Breakout Detection
-        breakout_up = (latest_5m['Close'] > latest_5m['BB_Upper']) and (prev_5m['Close'] <= prev_5m['BB_Upper'])
-        breakout_down = (latest_5m['Close'] < latest_5m['BB_Lower']) and (prev_5m['Close'] >= prev_5m['BB_Lower'])
+        breakout_up = (close[i] > bb_upper[i]) and (close[i - 1] <= bb_upper[i - 1])
+        breakout_down = (close[i] < bb_lower[i]) and (close[i - 1] >= bb_lower[i - 1])
 
         if not (breakout_up or breakout_down):
             return None
 
         # FILTER 5: 15m HTF Trend Confirmation
-        if df_15m is not None and len(df_15m) >= 20:
-            if 'ADX' not in df_15m.columns:
-                df_15m = TechnicalIndicators.calculate_adx(df_15m)
-
-            latest_15m = df_15m.iloc[-1]
-
-            if breakout_up:
-                if latest_15m['DIPlus'] < latest_15m['DIMinus'] or latest_15m['ADX'] < adx_min:
-                    return None
-            elif breakout_down:
-                if latest_15m['DIMinus'] < latest_15m['DIPlus'] or latest_15m['ADX'] < adx_min:
-                    return None
-        else:
-            return None
+        adx_15m = htf['ADX'][htf_idx]
+        di_plus_15m = htf['DIPlus'][htf_idx]
+        di_minus_15m = htf['DIMinus'][htf_idx]
+
+        if breakout_up:
+            if di_plus_15m < di_minus_15m or adx_15m < adx_min:
+                return None
+        elif breakout_down:
+            if di_minus_15m < di_plus_15m or adx_15m < adx_min:
+                return None
 
         # FILTER 6: FVG Mitigation Check (Optional)
         has_recent_fvg = True
         if require_fvg:
-            recent_5m = df_5m.iloc[-6:-1]
-            if breakout_up:
-                has_recent_fvg = recent_5m['Bull_FVG'].any()
-            else:
-                has_recent_fvg = recent_5m['Bear_FVG'].any()
+            fvg = base['Bull_FVG'] if breakout_up else base['Bear_FVG']
+            has_recent_fvg = bool(fvg[i - 5:i].any())
 
             if not has_recent_fvg:
                 return None
 
         # All filters passed
         signal = "BUY" if breakout_up else "SELL"
-        price = float(latest_5m['Close'])
-        bb_middle = float(latest_5m['BB_Middle'])
+        price = float(close[i])
+        bb_middle = float(base['BB_Middle'][i])
 
         # Calculate Stop Loss
         stop_loss = bb_middle
@@ -217,8 +357,8 @@ class CommoditySniperDetector(ForexStrategy):
             "stop_loss": stop_loss,
             "take_profit": take_profit,
             "indicators": {
-                "ADX_15m": round(float(latest_15m['ADX']), 1),
-                "BB_Width": round(float(latest_5m['BB_Width']), 4),
+                "ADX_15m": round(float(adx_15m), 1),
+                "BB_Width": round(float(bb_width[i]), 4),
                 "is_squeeze": True,
                 "has_fvg": has_recent_fvg,
                 "squeeze_threshold": squeeze_threshold,
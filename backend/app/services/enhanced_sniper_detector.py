@@ -17,6 +17,14 @@ class EnhancedSniperDetector(ForexStrategy):
     - Configurable Time Filters and Squeeze
     """
     
+    # Columns read by the entry rules on each timeframe
+    # (Volume_SMA and BB_Width_Min20 are the 20-bar rolling volume mean and
+    # BB width minimum, read from precomputed columns when the frame has them)
+    BASE_COLUMNS = ('Close', 'Volume', 'Volume_SMA', 'DIPlus', 'DIMinus', 'EMA13',
+                    'BB_Upper', 'BB_Lower', 'BB_Middle', 'BB_Width', 'BB_Width_Min20')
+    HTF_COLUMNS = ('Close', 'ADX', 'DIPlus', 'DIMinus', 'EMA13', 'EMA34')
+    HTF2_COLUMNS = ('Close', 'SMA200')
+
     def __init__(self):
         self.name = "EnhancedSniper"
         
@@ -39,32 +47,31 @@ class EnhancedSniperDetector(ForexStrategy):
     def _check_htf_trend(self, df_1h: pd.DataFrame, lookback: int = 60) -> int:
         if df_1h is None or len(df_1h) < lookback:
             return 0
-            
-        latest = df_1h.iloc[-1]
-        
-        if latest['ADX'] < 25:
+        return self._htf_trend_at(self.column_arrays(df_1h, self.HTF_COLUMNS), len(df_1h) - 1)
+
+    def _htf_trend_at(self, htf: Dict[str, np.ndarray], j: int) -> int:
+        if htf['ADX'][j] < 25:
             return 0
-            
-        if 'EMA34' not in df_1h.columns:
+
+        if 'EMA34' not in htf:
             return 0
-            
-        if latest['Close'] > latest['EMA34'] and latest['DIPlus'] > latest['DIMinus']:
+
+        close = htf['Close'][j]
+        ema34 = htf['EMA34'][j]
+        di_plus = htf['DIPlus'][j]
+        di_minus = htf['DIMinus'][j]
+
+        if close > ema34 and di_plus > di_minus:
             return 1
-        elif latest['Close'] < latest['EMA34'] and latest['DIMinus'] > latest['DIPlus']:
+        elif close < ema34 and di_minus > di_plus:
             return -1
-            
+
         return 0
 
     def analyze(self, data: Dict[str, pd.DataFrame], symbol: str, target_rr: float = 2.0, spread: float = 0.0, params: Optional[Dict] = None) -> Optional[Dict]:
         if params is None:
             params = {}
             
-        high_loss_hours = params.get("high_loss_hours", params.get("time_blocks", []))
-        use_squeeze = params.get("use_squeeze", False)
-        squeeze_threshold = params.get("squeeze_threshold", 1.5)
-        
-        casket_type = self._get_casket_type(symbol)
-
         df_15m = data.get('base')
         df_1h = data.get('htf')
         df_4h = data.get('htf2')
@@ -81,14 +88,10 @@ class EnhancedSniperDetector(ForexStrategy):
         if 'ADX' not in df_1h.columns:
             df_1h = TechnicalIndicators.add_all_indicators(df_1h)
 
-        latest = df_15m.iloc[-1]
-        prev = df_15m.iloc[-2]
-        latest_1h = df_1h.iloc[-1]
-        
         # ---------------------------------------------------------------------
         # 0. TIME FILTERS
         # ---------------------------------------------------------------------
-        current_time = latest['time'] if 'time' in latest else latest.name
+        current_time = df_15m['time'].iat[-1] if 'time' in df_15m.columns else df_15m.index[-1]
         if not hasattr(current_time, 'hour'):
              current_time = pd.to_datetime(current_time)
 
@@ -112,127 +115,178 @@ class EnhancedSniperDetector(ForexStrategy):
             # If timestamp parsing fails, continue (don't block on this check)
             pass
 
+        htf2 = None
+        if df_4h is not None and len(df_4h) >= 200:
+            if 'SMA200' not in df_4h.columns:
+                df_4h = df_4h.copy()
+                df_4h['SMA200'] = df_4h['Close'].rolling(window=200).mean()
+            htf2 = self.column_arrays(df_4h, self.HTF2_COLUMNS)
+
+        return self._evaluate(
+            self.column_arrays(df_15m, self.BASE_COLUMNS), len(df_15m) - 1,
+            self.column_arrays(df_1h, self.HTF_COLUMNS), len(df_1h) - 1,
+            htf2, len(df_4h) - 1 if htf2 is not None else -1,
+            current_time, symbol, target_rr, params
+        )
+
+    @staticmethod
+    def column_arrays(df: pd.DataFrame, columns) -> Dict[str, np.ndarray]:
+        """Extract the given columns (those present) as NumPy arrays."""
+        return {col: df[col].to_numpy() for col in columns if col in df.columns}
+
+    def analyze_precomputed(self, base: Dict[str, np.ndarray], i: int, htf: Dict[str, np.ndarray], htf_idx: int,
+                            htf2: Optional[Dict[str, np.ndarray]], htf2_idx: int, timestamp, symbol: str,
+                            target_rr: float = 2.0, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Backtest variant of analyze() that evaluates bar `i` of column arrays
+        built once with column_arrays() from frames that already have
+        indicators added (plus SMA200 on the 4H frame), instead of slicing
+        DataFrames up to every bar. `htf_idx`/`htf2_idx` are the positions of
+        the last closed 1H/4H candles and `timestamp` the time of bar `i`.
+        Pass htf2=None to skip the 4H filter. The live candle freshness
+        check is skipped.
+        """
+        if i < 219 or htf_idx < 59:
+            return None
+        if htf2 is not None and htf2_idx < 199:
+            htf2 = None
+        if params is None:
+            params = {}
+        return self._evaluate(base, i, htf, htf_idx, htf2, htf2_idx, timestamp, symbol, target_rr, params)
+
+    def _evaluate(self, base: Dict[str, np.ndarray], i: int, htf: Dict[str, np.ndarray], j: int,
+                  htf2: Optional[Dict[str, np.ndarray]], k: int, current_time, symbol: str,
+                  target_rr: float, params: Dict) -> Optional[Dict]:
+        high_loss_hours = params.get("high_loss_hours", params.get("time_blocks", []))
+        use_squeeze = params.get("use_squeeze", False)
+        squeeze_threshold = params.get("squeeze_threshold", 1.5)
+
+        casket_type = self._get_casket_type(symbol)
+
+        close = base['Close']
+        di_plus = base['DIPlus']
+        di_minus = base['DIMinus']
+        bb_width = base.get('BB_Width')
+
         if current_time.hour in high_loss_hours:
             return None
 
         # ---------------------------------------------------------------------
         # 0.5. SQUEEZE DETECTION
         # ---------------------------------------------------------------------
-        if use_squeeze and 'BB_Width' in df_15m.columns:
-            lookback_96 = min(96, len(df_15m) - 1)
-            min_width_24h = df_15m['BB_Width'].iloc[-lookback_96:-1].min()
-            current_width = df_15m.iloc[-1]['BB_Width']
-            
-            is_squeeze = current_width <= (min_width_24h * squeeze_threshold)
-            
+        if use_squeeze and bb_width is not None:
+            min_width_24h = np.nanmin(bb_width[i - 95:i])
+            is_squeeze = bb_width[i] <= (min_width_24h * squeeze_threshold)
+
             if not is_squeeze:
-                return None  
-        
+                return None
+
         # ---------------------------------------------------------------------
         # 1. HTF TREND CHECKS (1H & 4H)
         # ---------------------------------------------------------------------
-        htf_trend = self._check_htf_trend(df_1h)
+        htf_trend = self._htf_trend_at(htf, j)
         if htf_trend == 0:
             return None
-            
-        if df_4h is not None and len(df_4h) >= 200:
-            if 'SMA200' not in df_4h.columns:
-                df_4h = df_4h.copy()
-                df_4h['SMA200'] = df_4h['Close'].rolling(window=200).mean()
-            
-            latest_4h = df_4h.iloc[-1]
-            
-            if htf_trend > 0 and latest_4h['Close'] < latest_4h['SMA200']:
-                return None  
-            if htf_trend < 0 and latest_4h['Close'] > latest_4h['SMA200']:
-                return None  
-                
+
+        if htf2 is not None:
+            close_4h = htf2['Close'][k]
+            sma200_4h = htf2['SMA200'][k]
+
+            if htf_trend > 0 and close_4h < sma200_4h:
+                return None
+            if htf_trend < 0 and close_4h > sma200_4h:
+                return None
+
         # ---------------------------------------------------------------------
         # 2. MOMENTUM CONFIRMATION
         # ---------------------------------------------------------------------
-        prev_1h = df_1h.iloc[-2]
-        adx_rising = latest_1h['ADX'] > prev_1h['ADX']
-        
+        adx_1h = htf['ADX']
+        adx_rising = adx_1h[j] > adx_1h[j - 1]
+
         if not adx_rising:
-            return None  
-            
+            return None
+
         # ---------------------------------------------------------------------
         # 3. BASE TIMEFRAME ENTRY SIGNAL (15m)
         # ---------------------------------------------------------------------
         signal = None
-        di_cross_up = (prev['DIPlus'] <= prev['DIMinus']) and (latest['DIPlus'] > latest['DIMinus'])
-        di_cross_down = (prev['DIMinus'] <= prev['DIPlus']) and (latest['DIMinus'] > latest['DIPlus'])
-        
+        di_cross_up = (di_plus[i - 1] <= di_minus[i - 1]) and (di_plus[i] > di_minus[i])
+        di_cross_down = (di_minus[i - 1] <= di_plus[i - 1]) and (di_minus[i] > di_plus[i])
+
         if htf_trend == 1 and di_cross_up:
             signal = "BUY"
         elif htf_trend == -1 and di_cross_down:
             signal = "SELL"
-            
+
         if not signal:
             return None
-            
+
         # ---------------------------------------------------------------------
         # 4. CASKET-SPECIFIC FILTERS
         # ---------------------------------------------------------------------
         if casket_type == "Momentum":
-            di_spread = abs(latest['DIPlus'] - latest['DIMinus'])
-            di_jump = di_spread - abs(prev['DIPlus'] - prev['DIMinus'])
-            avg_vol = df_15m['Volume'].rolling(20).mean().iloc[-1]
-            vol_surge = latest['Volume'] > (avg_vol * 2.0)
-            
+            di_spread = abs(di_plus[i] - di_minus[i])
+            di_jump = di_spread - abs(di_plus[i - 1] - di_minus[i - 1])
+            volume = base['Volume']
+            avg_vol = base['Volume_SMA'][i] if 'Volume_SMA' in base else volume[i - 19:i + 1].mean()
+            vol_surge = volume[i] > (avg_vol * 2.0)
+
             if di_jump < 7.0 or not vol_surge:
                 return None
-                
+
         elif casket_type == "Steady":
-            if signal == "BUY" and latest['Close'] < latest['EMA13']:
+            ema13 = base['EMA13']
+            if signal == "BUY" and close[i] < ema13[i]:
                 return None
-            if signal == "SELL" and latest['Close'] > latest['EMA13']:
+            if signal == "SELL" and close[i] > ema13[i]:
                 return None
-                
-            dist_to_15m_ema = abs(latest['Close'] - latest['EMA13']) / latest['Close']
-            dist_to_1h_ema = abs(latest_1h['Close'] - latest_1h['EMA13']) / latest_1h['Close']
-            
+
+            close_1h = htf['Close'][j]
+            dist_to_15m_ema = abs(close[i] - ema13[i]) / close[i]
+            dist_to_1h_ema = abs(close_1h - htf['EMA13'][j]) / close_1h
+
             if dist_to_15m_ema > 0.0050 or dist_to_1h_ema > 0.0100:
                 return None
-                
+
         elif casket_type == "Cyclical":
-            bb_width = (latest['BB_Upper'] - latest['BB_Lower']) / latest['BB_Middle']
-            if 'BB_Width' in df_15m.columns:
-                min_width = df_15m['BB_Width'].rolling(window=20).min().iloc[-1]
-                if bb_width < (min_width * 1.5):
+            bb_middle = base['BB_Middle']
+            width = (base['BB_Upper'][i] - base['BB_Lower'][i]) / bb_middle[i]
+            if bb_width is not None:
+                min_width = base['BB_Width_Min20'][i] if 'BB_Width_Min20' in base else bb_width[i - 19:i + 1].min()
+                if width < (min_width * 1.5):
                     return None
 
         # ---------------------------------------------------------------------
         # 5. RISK MANAGEMENT CALCULATION
         # ---------------------------------------------------------------------
-        price = float(latest['Close'])
-        stop_loss = float(latest['BB_Middle'])  
-        
+        price = float(close[i])
+        stop_loss = float(base['BB_Middle'][i])
+
         min_risk = price * 0.0005
         if abs(price - stop_loss) < min_risk:
             if signal == "BUY":
                 stop_loss = price - min_risk
             else:
                 stop_loss = price + min_risk
-                
+
         risk = abs(price - stop_loss)
         take_profit = price + (risk * target_rr) if signal == "BUY" else price - (risk * target_rr)
-        
+
         return {
             "signal": signal,
-            "score": 85.0,  
+            "score": 85.0,
             "strategy": self.name,
             "symbol": symbol,
             "price": price,
             "entry": price,
             "direction": signal,
-            "timestamp": latest['time'] if 'time' in latest else latest.name,
+            "timestamp": current_time,
             "stop_loss": stop_loss,
             "take_profit": take_profit,
             "indicators": {
-                "adx_1h": round(latest_1h['ADX'], 1),
-                "di_plus": round(latest['DIPlus'], 1),
-                "di_minus": round(latest['DIMinus'], 1)
+                "adx_1h": round(float(adx_1h[j]), 1),
+                "di_plus": round(float(di_plus[i]), 1),
+                "di_minus": round(float(di_minus[i]), 1)
             }
         }
 
@@ -16,7 +16,7 @@ from typing import List, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
-from .indicators import TechnicalIndicators
+from .indicators import TechnicalIndicators, load_forex_csv
 from .strategy_interface import ForexStrategy
 from .forex_detector import ForexDetector
 from .sniper_detector import SniperDetector
@@ -93,12 +93,8 @@ class ForexScreener:
             path = self.data_dir / fname
             if path.exists():
                 try:
-                    df = pd.read_csv(path)
-                    col = 'Date' if 'Date' in df.columns else 'Datetime'
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], utc=True)
-                        df.set_index(col, inplace=True)
-                        df.sort_index(inplace=True)
+                    df = load_forex_csv(path)
+                    if df is not None:
                         data[tf] = df
                 except Exception:
                     pass
@@ -5,9 +5,25 @@ Implements ADX, DI+, DI-, and SMA calculations.
 ADX/DI implementation matches Pine Script logic exactly using Wilder's smoothing.
 """
 
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
 import pandas as pd
 import numpy as np
-from typing import Optional
+
+# pyarrow parses CSVs multithreaded; fall back to the C parser when it isn't installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Part of every cached_indicator_frame key: bump it when an indicator's
+# implementation changes, so frames cached by the old code are rebuilt
+CACHE_VERSION = 1
 
 
 class TechnicalIndicators:
@@ -19,14 +35,18 @@ class TechnicalIndicators:
         Calculate True Range.
         TR = max(high - low, abs(high - prev_close), abs(low - prev_close))
         """
-        df = df.copy()
-        df['prev_close'] = df['Close'].shift(1)
+        # Work on the three columns only: this runs for every ATR/ADX on
+        # frames that already carry dozens of indicator columns
+        high, low = df['High'], df['Low']
+        prev_close = df['Close'].shift(1)
 
-        tr1 = df['High'] - df['Low']
-        tr2 = abs(df['High'] - df['prev_close'])
-        tr3 = abs(df['Low'] - df['prev_close'])
+        tr1 = high - low
+        tr2 = abs(high - prev_close)
+        tr3 = abs(low - prev_close)
 
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        # fmax skips NaN like DataFrame.max (first bar has no prev_close)
+        true_range = np.fmax(tr1, np.fmax(tr2, tr3))
+        true_range.name = None
         return true_range
 
     @staticmethod
@@ -43,24 +63,18 @@ class TechnicalIndicators:
         Returns:
             tuple: (dm_plus, dm_minus)
         """
-        df = df.copy()
-        df['prev_high'] = df['High'].shift(1)
-        df['prev_low'] = df['Low'].shift(1)
-
-        df['high_diff'] = df['High'] - df['prev_high']
-        df['low_diff'] = df['prev_low'] - df['Low']
+        high_diff = (df['High'] - df['High'].shift(1)).to_numpy(dtype=float)
+        low_diff = (df['Low'].shift(1) - df['Low']).to_numpy(dtype=float)
 
         # DM+ = high_diff > low_diff ? max(high_diff, 0) : 0
-        dm_plus = pd.Series(0.0, index=df.index)
-        dm_plus[df['high_diff'] > df['low_diff']] = df.loc[
-            df['high_diff'] > df['low_diff'], 'high_diff'
-        ].clip(lower=0)
+        dm_plus = pd.Series(
+            np.where(high_diff > low_diff, np.maximum(high_diff, 0.0), 0.0), index=df.index
+        )
 
         # DM- = low_diff > high_diff ? max(low_diff, 0) : 0
-        dm_minus = pd.Series(0.0, index=df.index)
-        dm_minus[df['low_diff'] > df['high_diff']] = df.loc[
-            df['low_diff'] > df['high_diff'], 'low_diff'
-        ].clip(lower=0)
+        dm_minus = pd.Series(
+            np.where(low_diff > high_diff, np.maximum(low_diff, 0.0), 0.0), index=df.index
+        )
 
         return dm_plus, dm_minus
 
@@ -276,19 +290,19 @@ class TechnicalIndicators:
         Calculate Ehler's Instantaneous Trend.
         A recursive filter that identifies short-term momentum triggers.
         """
-        src = (df['High'] + df['Low']) / 2
+        # Recursive filter: index a plain array, not src.iloc, on every bar
+        src = ((df['High'] + df['Low']) / 2).to_numpy()
         it = np.zeros(len(df))
         
         # Initial values
-        for i in range(min(3, len(df))):
-            it[i] = src.iloc[i]
+        it[:3] = src[:3]
             
         # Recursive calculation
         a2 = alpha * alpha
         for i in range(2, len(df)):
-            it[i] = (alpha - a2 / 4.0) * src.iloc[i] + \
-                    0.5 * a2 * src.iloc[i-1] - \
-                    (alpha - 0.75 * a2) * src.iloc[i-2] + \
+            it[i] = (alpha - a2 / 4.0) * src[i] + \
+                    0.5 * a2 * src[i-1] - \
+                    (alpha - 0.75 * a2) * src[i-2] + \
                     2 * (1 - alpha) * it[i-1] - \
                     (1 - alpha) * (1 - alpha) * it[i-2]
                     
@@ -306,51 +320,70 @@ class TechnicalIndicators:
         """
         df = df.copy()
         
-        # Calculate Pivot Highs and Lows
-        df['ph'] = df['High'].rolling(window=prd*2+1, center=True).apply(lambda x: x.iloc[prd] if all(x.iloc[prd] >= i for i in x) else np.nan)
-        df['pl'] = df['Low'].rolling(window=prd*2+1, center=True).apply(lambda x: x.iloc[prd] if all(x.iloc[prd] <= i for i in x) else np.nan)
-        
-        # Calculate Center Line
+        # Calculate Pivot Highs and Lows: the centre bar of each full
+        # 2*prd+1 window that is its highest high / lowest low
+        df['ph'] = TechnicalIndicators._pivot_points(df['High'].to_numpy(dtype=float), prd, np.greater_equal)
+        df['pl'] = TechnicalIndicators._pivot_points(df['Low'].to_numpy(dtype=float), prd, np.less_equal)
+
+        # Calculate Center Line: weighted update at each pivot, carried forward
+        last_pp = np.where(np.isnan(df['ph'].to_numpy()), df['pl'].to_numpy(), df['ph'].to_numpy())
+        pivots = np.flatnonzero(~np.isnan(last_pp))
+        centers = np.full(len(df), np.nan)
         center = np.nan
-        centers = []
-        for i in range(len(df)):
-            last_pp = df['ph'].iloc[i] if not pd.isna(df['ph'].iloc[i]) else (df['pl'].iloc[i] if not pd.isna(df['pl'].iloc[i]) else np.nan)
-            if not pd.isna(last_pp):
-                if pd.isna(center):
-                    center = last_pp
-                else:
-                    center = (center * 2 + last_pp) / 3.0
-            centers.append(center)
-        df['PP_Center'] = centers
-        
+        for i in pivots.tolist():
+            center = last_pp[i] if np.isnan(center) else (center * 2 + last_pp[i]) / 3.0
+            centers[i] = center
+        df['PP_Center'] = pd.Series(centers, index=df.index).ffill()
+
         # Bands
         atr = TechnicalIndicators.calculate_atr(df, period)
         df['PP_Up'] = df['PP_Center'] - (factor * atr)
         df['PP_Dn'] = df['PP_Center'] + (factor * atr)
-        
-        # Trend tracking
+
+        # Trend tracking over plain lists (builtin max/min keep their NaN
+        # behaviour), instead of .iloc lookups on every bar
+        close = df['Close'].tolist()
+        up = df['PP_Up'].tolist()
+        dn = df['PP_Dn'].tolist()
         trend = 1
         t_up = np.zeros(len(df))
         t_dn = np.zeros(len(df))
         trends = []
-        
+
         for i in range(1, len(df)):
             # TUp := close[1] > TUp[1] ? max(Up, TUp[1]) : Up
-            t_up[i] = max(df['PP_Up'].iloc[i], t_up[i-1]) if df['Close'].iloc[i-1] > t_up[i-1] else df['PP_Up'].iloc[i]
+            t_up[i] = max(up[i], t_up[i-1]) if close[i-1] > t_up[i-1] else up[i]
             # TDown := close[1] < TDown[1] ? min(Dn, TDown[1]) : Dn
-            t_dn[i] = min(df['PP_Dn'].iloc[i], t_dn[i-1]) if df['Close'].iloc[i-1] < t_dn[i-1] else df['PP_Dn'].iloc[i]
-            
+            t_dn[i] = min(dn[i], t_dn[i-1]) if close[i-1] < t_dn[i-1] else dn[i]
+
             # Trend := close > TDown[1] ? 1: close < TUp[1]? -1: nz(Trend[1], 1)
-            if df['Close'].iloc[i] > t_dn[i-1]:
+            if close[i] > t_dn[i-1]:
                 trend = 1
-            elif df['Close'].iloc[i] < t_up[i-1]:
+            elif close[i] < t_up[i-1]:
                 trend = -1
             trends.append(trend)
-            
+
         df['PP_Trend'] = [1] + trends
         df['PP_TrailingSL'] = [t_up[i] if trends[i-1] == 1 else t_dn[i] for i in range(len(df))]
         return df
 
+    @staticmethod
+    def _pivot_points(values: np.ndarray, prd: int, compare) -> np.ndarray:
+        """
+        Pivot values for calculate_pivot_supertrend(): values[i] where
+        compare(values[i], x) holds for every x in values[i-prd:i+prd+1],
+        NaN elsewhere (including the first and last prd bars).
+        """
+        width = 2 * prd + 1
+        pivots = np.full(len(values), np.nan)
+        if len(values) < width:
+            return pivots
+        windows = np.lib.stride_tricks.sliding_window_view(values, width)
+        centre = windows[:, prd]
+        is_pivot = compare(centre[:, None], windows).all(axis=1)
+        pivots[prd:len(values) - prd] = np.where(is_pivot, centre, np.nan)
+        return pivots
+
     @staticmethod
     def calculate_fibonacci_structure_trend(df: pd.DataFrame, period: int = 50, fib: float = 0.382) -> pd.DataFrame:
         """
@@ -358,33 +391,34 @@ class TechnicalIndicators:
         Tracks high/low structure over a rolling window.
         """
         df = df.copy()
-        hi = df['High'].rolling(window=period).max()
-        lo = df['Low'].rolling(window=period).min()
+        # The structure walk indexes plain arrays, not .iloc, on every bar
+        high = df['High'].to_numpy()
+        low = df['Low'].to_numpy()
         
         pos = 0
         poss = []
         retrace = 0.0
         retraces = []
         
-        current_hi = df['High'].iloc[0]
-        current_lo = df['Low'].iloc[0]
+        current_hi = high[0]
+        current_lo = low[0]
         
         for i in range(len(df)):
             if pos >= 0:
-                if df['High'].iloc[i] > current_hi:
-                    current_hi = df['High'].iloc[i]
+                if high[i] > current_hi:
+                    current_hi = high[i]
                     retrace = current_hi - (current_hi - current_lo) * fib
-                if df['High'].iloc[i] < retrace:
+                if high[i] < retrace:
                     pos = -1
-                    current_lo = df['Low'].iloc[i]
+                    current_lo = low[i]
                     retrace = current_lo + (current_hi - current_lo) * fib
             else: # pos <= 0
-                if df['Low'].iloc[i] < current_lo:
-                    current_lo = df['Low'].iloc[i]
+                if low[i] < current_lo:
+                    current_lo = low[i]
                     retrace = current_lo + (current_hi - current_lo) * fib
-                if df['Low'].iloc[i] > retrace:
+                if low[i] > retrace:
                     pos = 1
-                    current_hi = df['High'].iloc[i]
+                    current_hi = high[i]
                     retrace = current_hi - (current_hi - current_lo) * fib
             
             poss.append(pos)
@@ -640,7 +674,11 @@ class TechnicalIndicators:
         """
         Add all indicators to DataFrame in one call.
         """
-        # Optimized: Skip if already calculated
+        # Optimized: Skip if already calculated. Frames produced here carry a
+        # marker (their column count, which rules out column subsets) that
+        # slices inherit through attrs, so the common case is one dict lookup
+        if df.attrs.get('indicator_columns') == len(df.columns):
+            return df
         if 'ADX' in df.columns and 'BB_Width' in df.columns and 'KC_Upper' in df.columns and 'PP_Trend' in df.columns:
             return df
 
@@ -698,6 +736,7 @@ class TechnicalIndicators:
         # Add PVT Indicators
         df = TechnicalIndicators.calculate_pvt(df)
 
+        df.attrs['indicator_columns'] = len(df.columns)
         return df
 
 
@@ -717,14 +756,179 @@ def load_and_calculate_indicators(
     Returns:
         DataFrame with all indicators calculated
     """
-    df = pd.read_csv(csv_path)
+    df = load_price_csv(csv_path)
+    df = TechnicalIndicators.add_all_indicators(df, adx_period, sma_period)
+    return df
+
+
+def load_price_csv(csv_path: Path) -> pd.DataFrame:
+    """
+    Load a daily OHLCV CSV indexed by naive, day-floored dates, oldest first.
+
+    Parsing uses the pyarrow engine when it is installed.
+    """
+    df = pd.read_csv(csv_path, engine=CSV_ENGINE)
     if 'Date' in df.columns:
-        df['Date'] = pd.to_datetime(df['Date'], utc=True)
+        # Use utc=True to handle mixed offsets, then strip TZ to match our normalized CSVs
+        df['Date'] = pd.to_datetime(df['Date'], utc=True, format='ISO8601')
+        df.set_index('Date', inplace=True)
+        df.index = df.index.tz_convert(None).floor('D')
+
+    # Sort to be absolutely sure latest is at the bottom
+    df.sort_index(inplace=True)
+    return df
+
+
+# The only columns kept from OANDA candle CSVs (data/forex_raw)
+CANDLE_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def load_candle_csv(csv_path: Path, cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Load an intraday candle CSV indexed by naive UTC time, oldest first,
+    keeping only the Date/OHLCV columns.
+
+    With cache_dir, the parsed frame is memoized there (see
+    cached_indicator_frame) until the CSV changes, so repeated script runs
+    skip CSV and date parsing.
+    """
+    def read() -> pd.DataFrame:
+        # The pyarrow engine takes an explicit column list, so intersect with the header
+        header = pd.read_csv(csv_path, nrows=0).columns
+        df = pd.read_csv(csv_path, usecols=[c for c in CANDLE_COLUMNS if c in header],
+                         parse_dates=['Date'], engine=CSV_ENGINE)
         df.set_index('Date', inplace=True)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         if df.index.tz is not None:
             df.index = df.index.tz_convert(None)
-        df.index = df.index.floor('D')
-    
-    df.sort_index(inplace=True)
-    df = TechnicalIndicators.add_all_indicators(df, adx_period, sma_period)
+        return df
+
+    if cache_dir is None:
+        return read()
+    return cached_indicator_frame(csv_path, cache_dir, {'columns': CANDLE_COLUMNS}, read)
+
+
+def load_candle_indicators(csv_path: Path, cache_dir: Optional[Path] = None, **params) -> pd.DataFrame:
+    """
+    Load an intraday candle CSV (see load_candle_csv) with add_all_indicators
+    applied; params are passed through to add_all_indicators.
+
+    With cache_dir, the enriched frame is memoized there until the CSV or the
+    parameters change, so re-running a sweep skips the indicator passes.
+    """
+    def build() -> pd.DataFrame:
+        return TechnicalIndicators.add_all_indicators(load_candle_csv(csv_path), **params)
+
+    if cache_dir is None:
+        return build()
+    return cached_indicator_frame(
+        csv_path, cache_dir, {'columns': CANDLE_COLUMNS, 'indicators': params}, build
+    )
+
+
+# Latest parsed version of each forex_raw CSV: path -> ((mtime_ns, size), frame)
+_forex_frames: Dict[Path, Tuple[Tuple[int, int], Optional[pd.DataFrame]]] = {}
+
+
+def load_forex_csv(path: Path) -> Optional[pd.DataFrame]:
+    """
+    Load a data/forex_raw candle CSV with all of its columns, indexed by UTC
+    time, oldest first; None if it has neither a Date nor a Datetime column.
+
+    The parsed frame is kept until the file's mtime or size changes. The
+    forex screener and portfolio monitor reload every timeframe each cycle,
+    while the 1h and 4h files gain a candle only every few cycles. Callers
+    get their own copy.
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _forex_frames.get(path)
+    if cached is None or cached[0] != key:
+        df = pd.read_csv(path)
+        col = 'Date' if 'Date' in df.columns else 'Datetime'
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], utc=True, format='ISO8601')
+            df.set_index(col, inplace=True)
+            df.sort_index(inplace=True)
+        else:
+            df = None
+        cached = _forex_frames[path] = (key, df)
+    return None if cached[1] is None else cached[1].copy()
+
+
+def drop_warmup_rows(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Drop rows where any of `columns` is NaN, like df.dropna(subset=columns).
+
+    Rolling indicators are only NaN over their warm-up prefix, so the common
+    case is a single slice past the first fully valid row; dropna() is used
+    only if a NaN remains after it.
+    """
+    valid = df[columns].notna().to_numpy().all(axis=1)
+    first_valid = int(valid.argmax()) if valid.any() else len(df)
+    if valid[first_valid:].all():
+        return df.iloc[first_valid:]
+    return df.dropna(subset=columns)
+
+
+def downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store every float64 column (OHLCV and indicators) as float32.
+
+    Halves the memory held by a universe-wide backtest and the bytes each
+    column scan touches. Prices keep ~7 significant digits, ample for ASX
+    quotes; callers that accumulate cash should convert values with float().
+    """
+    floats = df.select_dtypes('float64').columns
+    return df.astype(dict.fromkeys(floats, 'float32'))
+
+
+def cached_indicator_frame(
+    csv_path: Path,
+    cache_dir: Path,
+    params: Dict,
+    build: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Memoize an indicator-augmented DataFrame on disk.
+
+    The cache file is keyed by the CSV's name and modification time and by
+    a hash of the indicator parameters and CACHE_VERSION, so editing the
+    CSV, changing any parameter or bumping the version rebuilds it. Older
+    entries for the same CSV and parameters are removed when a new one is
+    written.
+
+    Args:
+        csv_path: Source CSV the frame is built from
+        cache_dir: Directory holding the cached frames
+        params: Indicator parameters passed to build (must be JSON-serializable)
+        build: Loads the CSV and calculates indicators on a cache miss
+
+    Returns:
+        DataFrame with indicators calculated
+    """
+    csv_path = Path(csv_path)
+    cache_dir = Path(cache_dir)
+    key = json.dumps({'version': CACHE_VERSION, 'params': params}, sort_keys=True)
+    params_key = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    cache_path = cache_dir / f"{csv_path.stem}_{csv_path.stat().st_mtime_ns}_{params_key}.pkl"
+
+    if cache_path.exists():
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            pass  # Unreadable - rebuild below
+
+    df = build()
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Match the name exactly: a glob on the stem would also catch CSVs whose
+    # stem merely starts with this one (EURUSD=X vs EURUSD=X_15_Min)
+    stale_name = re.compile(rf"{re.escape(csv_path.stem)}_\d+_{params_key}\.pkl")
+    for stale in cache_dir.glob(f"*_{params_key}.pkl"):
+        if stale_name.fullmatch(stale.name):
+            stale.unlink(missing_ok=True)
+    df.to_pickle(cache_path)
     return df
@@ -99,6 +99,34 @@ class MeanReversionDetector:
             'date': latest.name
         }
 
+    def entry_signal_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized detect_entry_signal() over every bar of `df`.
+
+        Element i is True when detect_entry_signal(df.iloc[:i+1]) signals,
+        including the optional volume filter.
+        """
+        close = df['Close'].to_numpy(dtype=float)
+
+        # Comparisons with NaN are False, matching the missing-indicator check
+        mask = (
+            (close < df['BB_Lower'].to_numpy(dtype=float)) &
+            (df['RSI'].to_numpy(dtype=float) < self.rsi_threshold) &
+            (close > df['SMA200'].to_numpy(dtype=float)) &
+            (close >= 1.0) &
+            df['BB_Middle'].notna().to_numpy()
+        )
+
+        if self.volume_filter_enabled and {'Volume', 'Volume_SMA'} <= set(df.columns):
+            volume = df['Volume'].to_numpy(dtype=float)
+            volume_sma = df['Volume_SMA'].to_numpy(dtype=float)
+            mask &= (
+                np.isnan(volume) | np.isnan(volume_sma) |
+                (volume > volume_sma * self.volume_multiplier)
+            )
+
+        return mask
+
     def calculate_score(self, signal_info: Dict, df: pd.DataFrame) -> float:
         """
         Calculate signal score (0-100).
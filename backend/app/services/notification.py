@@ -9,7 +9,8 @@ import json
 import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from pathlib import Path
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -18,6 +19,14 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _read_signal_state(path: Path, file_key: Tuple[int, int]) -> Dict[str, Dict]:
+    """Parse the last-sent signals file; cached per (mtime_ns, size) version."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class EmailService:
     """Service for sending email notifications."""
     
@@ -134,14 +143,24 @@ class EmailService:
                 json.dump(signal_map, f, indent=2)
         except Exception as e:
             logger.error(f"Failed to save last sent signals: {e}")
+        finally:
+            # A rewrite within the filesystem's mtime resolution keeps the old key
+            _read_signal_state.cache_clear()
 
     @classmethod
     def load_last_sent_signals(cls) -> Dict[str, Dict]:
-        """Load the active signals."""
+        """
+        Load the active signals.
+
+        The parsed file is reused until it changes on disk. Callers annotate
+        the signal dicts they get (exit_reason, pnl, ...), so each call
+        returns fresh copies of them.
+        """
         if cls._last_sent_file.exists():
             try:
-                with open(cls._last_sent_file, 'r') as f:
-                    return json.load(f)
+                stat = cls._last_sent_file.stat()
+                state = _read_signal_state(cls._last_sent_file, (stat.st_mtime_ns, stat.st_size))
+                return {symbol: dict(sig) for symbol, sig in state.items()}
             except Exception as e:
                 logger.error(f"Failed to load last sent signals: {e}")
         return {}
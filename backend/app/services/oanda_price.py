@@ -13,11 +13,19 @@ import oandapyV20.endpoints.instruments as instruments
 import oandapyV20.endpoints.accounts as accounts
 import oandapyV20.endpoints.orders as orders
 import oandapyV20.endpoints.trades as trades
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Concurrent OANDA calls the shared client keeps connections open for
+OANDA_POOL_SIZE = 8
+
 def retry_oanda(retries=3, delay=2):
     """Decorator to retry OANDA API calls on timeout or connection errors."""
     def decorator(func: Callable):
@@ -47,6 +55,8 @@ def retry_oanda(retries=3, delay=2):
 
 class OandaPriceService:
     _api: Optional[API] = None
+    # symbol -> (displayPrecision, tradeUnitsPrecision); fixed per instrument
+    _precisions: Dict[str, Tuple[int, int]] = {}
 
     @classmethod
     @retry_oanda(retries=2, delay=1)
@@ -98,7 +108,22 @@ class OandaPriceService:
             
         try:
             # Increased timeout from 10s to 20s
-            cls._api = API(access_token=token, environment=settings.OANDA_ENV, request_params={"timeout": 20})
+            api = API(access_token=token, environment=settings.OANDA_ENV, request_params={"timeout": 20})
+            # The client is shared by the API's worker threads: keep a few
+            # connections to OANDA alive instead of a TLS handshake per call.
+            # Gateway errors on reads are retried at the socket level; 429s and
+            # connection failures are still left to retry_oanda.
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=OANDA_POOL_SIZE,
+                max_retries=Retry(total=3, connect=0, read=0, backoff_factor=0.2,
+                                  status_forcelist=[502, 503, 504],
+                                  allowed_methods=["GET"], raise_on_status=False),
+            )
+            api.client.mount("https://", adapter)
+            api.client.mount("http://", adapter)
+            api.client.headers["Connection"] = "keep-alive"
+            cls._api = api
             return cls._api
         except Exception as e:
             logger.error(f"Error initializing OANDA API: {e}")
@@ -212,6 +237,49 @@ class OandaPriceService:
             # Return None if request fails (instrument doesn't exist, network error, etc.)
             return None
 
+    @classmethod
+    @retry_oanda(retries=3, delay=2)
+    def get_candle_frame(cls, symbol: str, granularity: str = 'H1', count: int = 250) -> Optional[pd.DataFrame]:
+        """
+        Fetch live candles as a DataFrame of float Open/High/Low/Close/Volume
+        columns indexed by candle time (UTC).
+
+        Same request as get_candles(), but each column is filled straight
+        from the response instead of going through a dict per candle.
+
+        Returns:
+            DataFrame of completed candles, or None if request fails
+        """
+        api = cls.get_api()
+        if not api:
+            return None
+
+        params = {
+            "count": min(count, 5000),  # Oanda max is 5000
+            "granularity": granularity,
+            "price": "M"  # Midpoint prices
+        }
+
+        try:
+            r = instruments.InstrumentsCandles(instrument=symbol, params=params)
+            api.request(r)
+            candles = [c for c in r.response.get('candles', []) if c.get('complete')]
+            if not candles:
+                return None
+
+            n = len(candles)
+            mids = [c.get('mid', {}) for c in candles]
+            columns = {
+                name: np.fromiter((float(m.get(key, 0)) for m in mids), np.float64, n)
+                for name, key in (('Open', 'o'), ('High', 'h'), ('Low', 'l'), ('Close', 'c'))
+            }
+            columns['Volume'] = np.fromiter((int(c.get('volume', 0)) for c in candles), np.float64, n)
+            index = pd.DatetimeIndex(pd.to_datetime([c['time'] for c in candles]), name='time')
+            return pd.DataFrame(columns, index=index)
+
+        except Exception:
+            return None
+
     @classmethod
     @retry_oanda(retries=3, delay=1)
     def get_current_spread(cls, symbol: str) -> Optional[float]:
@@ -330,7 +398,11 @@ class OandaPriceService:
         r = accounts.AccountInstruments(accountID=account_id, params={"instruments": symbol})
         api.request(r)
         instruments_list = r.response.get('instruments', [])
-        return instruments_list[0] if instruments_list else None
+        if not instruments_list:
+            return None
+        info = instruments_list[0]
+        cls._precisions[symbol] = (int(info.get('displayPrecision', 5)), int(info.get('tradeUnitsPrecision', 0)))
+        return info
 
     @classmethod
     @retry_oanda(retries=2, delay=1)
@@ -393,16 +465,18 @@ class OandaPriceService:
         if not api or not account_id:
             return None
 
-        # Format SL/TP and Units based on instrument precision
-        try:
-            inst_info = cls.get_instrument_details(symbol)
-        except Exception:
-            inst_info = None
-        
+        # Format SL/TP and Units based on instrument precision. Position
+        # sizing has usually looked the instrument up already, so the order
+        # goes out without another round trip.
+        if symbol not in cls._precisions:
+            try:
+                cls.get_instrument_details(symbol)
+            except Exception:
+                pass
+
         # Fallback precision logic
-        if inst_info:
-            precision = int(inst_info.get('displayPrecision', 5))
-            unit_precision = int(inst_info.get('tradeUnitsPrecision', 0))
+        if symbol in cls._precisions:
+            precision, unit_precision = cls._precisions[symbol]
         else:
             precision = 3 if "JPY" in symbol else 5
             unit_precision = 0
@@ -265,8 +265,6 @@ class OandaTradeService:
                 if strategy_obj and hasattr(strategy_obj, 'check_exit'):
                     # Fetch LIVE market data from Oanda to check exit conditions
                     try:
-                        import pandas as pd
-
                         # Determine timeframe from strategy
                         timeframe_used = signal.get('timeframe_used', '1h')
 
@@ -281,16 +279,9 @@ class OandaTradeService:
 
                         # Fetch live candles from Oanda (last 250 candles for indicator calculation)
                         logger.info(f"Fetching live {granularity} data from Oanda for exit check on {symbol}...")
-                        live_candles = OandaPriceService.get_candles(symbol, granularity=granularity, count=250)
-
-                        if live_candles and len(live_candles) > 0:
-                            # Convert to DataFrame
-                            df = pd.DataFrame(live_candles)
-                            df['time'] = pd.to_datetime(df['time'])
-                            df.set_index('time', inplace=True)
-                            df = df.rename(columns={'o': 'Open', 'h': 'High', 'l': 'Low', 'c': 'Close', 'volume': 'Volume'})
-                            df = df.astype(float)
+                        df = OandaPriceService.get_candle_frame(symbol, granularity=granularity, count=250)
 
+                        if df is not None:
                             # Add indicators (required for exit check)
                             from .indicators import TechnicalIndicators
                             df = TechnicalIndicators.add_all_indicators(df)
@@ -0,0 +1,17 @@
+"""
+Startup Pipeline Status
+
+Exit status bits and forex budget of run_startup_pipeline. start.py imports
+them under the system Python, before the backend venv is checked, so this
+module must only ever hold plain constants.
+
+The exit status is a bitmask of the failed stages. The bits stay clear of
+1 and 2, which Python itself uses for crashes and usage errors.
+"""
+
+STOCKS_FAILED = 16
+FOREX_FAILED = 32
+FOREX_TIMED_OUT = 64
+
+# Same budget start.py gave the forex refresh when it ran as its own process
+FOREX_TIMEOUT = 300  # seconds
@@ -27,6 +27,7 @@ from .notification import EmailService
 from .trade_closer import TradeCloserService
 from .oanda_price import OandaPriceService
 from .sma_scalping_detector import SmaScalpingDetector
+from .indicators import load_forex_csv
 
 class PortfolioMonitor:
     def __init__(self):
@@ -62,12 +63,8 @@ class PortfolioMonitor:
             path = self.data_dir / fname
             if path.exists():
                 try:
-                    df = pd.read_csv(path)
-                    col = 'Date' if 'Date' in df.columns else 'Datetime'
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], utc=True)
-                        df.set_index(col, inplace=True)
-                        df.sort_index(inplace=True)
+                    df = load_forex_csv(path)
+                    if df is not None:
                         data[tf] = df
                 except Exception as e:
                     print(f"Error loading {fname}: {e}")
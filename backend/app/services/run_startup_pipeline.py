@@ -0,0 +1,90 @@
+"""
+Startup Pipeline
+
+Runs the screeners needed by start.py in a single interpreter, so the
+backend stack (pandas, OANDA client, Firestore) is imported once instead
+of once per subprocess:
+1. Stock screener (writes data/processed/signals.json)
+2. Forex refresh task (forex screener + auto-trade check)
+
+Usage:
+    python -m app.services.run_startup_pipeline [--skip-stocks] [--forex-mode MODE]
+
+The exit status is a bitmask of the failed stages (see pipeline_status),
+so the caller can report each stage separately.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import traceback
+
+from .pipeline_status import FOREX_FAILED, FOREX_TIMED_OUT, FOREX_TIMEOUT, STOCKS_FAILED
+
+
+def run_stock_screener() -> bool:
+    """Run the stock screener. Returns True on success."""
+    # Imported here, not at module level: the screener's spawned workers
+    # re-import this module and should not pay for the forex stack
+    from .screener import main as screener_main
+
+    try:
+        screener_main()
+        return True
+    except Exception:
+        traceback.print_exc()
+        return False
+
+
+def run_forex_refresh(mode: str, timeout: int = FOREX_TIMEOUT) -> int:
+    """
+    Run the forex refresh task in a daemon thread, bounded by timeout.
+
+    Returns 0 on success, FOREX_FAILED or FOREX_TIMED_OUT otherwise.
+    """
+    from .tasks import run_forex_refresh_task
+
+    error = []
+
+    def _run():
+        try:
+            run_forex_refresh_task(mode=mode)
+        except Exception:
+            traceback.print_exc()
+            error.append(True)
+
+    print(f"Triggering manual forex refresh task (mode: {mode})...")
+    t = threading.Thread(target=_run, daemon=True)
+    t.start()
+    t.join(timeout=timeout)
+    if t.is_alive():
+        return FOREX_TIMED_OUT
+    if error:
+        return FOREX_FAILED
+    print("Refresh task completed.")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the startup screeners in one process")
+    parser.add_argument('--skip-stocks', action='store_true', help="only run the forex refresh")
+    parser.add_argument('--forex-mode', default='dynamic', help="mode passed to run_forex_refresh_task")
+    args = parser.parse_args(argv)
+
+    status = 0
+    if not args.skip_stocks and not run_stock_screener():
+        status |= STOCKS_FAILED
+    status |= run_forex_refresh(args.forex_mode)
+    return status
+
+
+if __name__ == '__main__':
+    status = main()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if status & FOREX_TIMED_OUT:
+        # The refresh thread is still running; don't wait for it (or for any
+        # pool it started) on the way out
+        os._exit(status)
+    sys.exit(status)
@@ -10,18 +10,39 @@ Orchestrates the screening process:
 """
 
 import json
-import pandas as pd
+import multiprocessing
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
 import sys
 
-from .indicators import load_and_calculate_indicators, TechnicalIndicators
+from .indicators import (
+    load_and_calculate_indicators, load_price_csv, TechnicalIndicators
+)
 from .triple_trend_detector import TripleTrendDetector
 from .mean_reversion_detector import MeanReversionDetector
+from .stock_list import load_stock_list
 from ..config import settings
 
 
+# Indicator settings for both strategies (also used by scripts/run_all_strategies.py)
+INDICATOR_PARAMS = {
+    'adx_period': settings.ADX_PERIOD,
+    'sma_period': settings.SMA_PERIOD,
+    'atr_period': settings.ATR_PERIOD,
+    'volume_period': settings.VOLUME_PERIOD,
+    'rsi_period': settings.RSI_PERIOD,
+    'bb_period': settings.BB_PERIOD,
+    'bb_std_dev': settings.BB_STD_DEV,
+    'fib_period': 50,
+    'st_prd': 2,
+    'st_factor': 3.0,
+    'it_alpha': 0.07
+}
+
+
 class StockScreener:
     """Main screener orchestrator."""
 
@@ -85,10 +106,7 @@ class StockScreener:
         if not stock_list_file.exists():
             raise FileNotFoundError(f"Stock list not found: {stock_list_file}")
 
-        with open(stock_list_file, 'r') as f:
-            data = json.load(f)
-
-        stocks = data.get('stocks', [])
+        stocks = load_stock_list(stock_list_file)
         
         # Merge with portfolio stocks
         try:
@@ -155,32 +173,10 @@ class StockScreener:
                 return result
 
             # Load raw data
-            df = pd.read_csv(csv_path)
-            if 'Date' in df.columns:
-                # Use utc=True to handle mixed offsets, then strip TZ if necessary
-                df['Date'] = pd.to_datetime(df['Date'], utc=True)
-                df.set_index('Date', inplace=True)
-                # Strip timezone to match our normalized CSVs
-                df.index = df.index.tz_convert(None).floor('D')
-            
-            # Sort to be absolutely sure latest is at the bottom
-            df.sort_index(inplace=True)
+            df = load_price_csv(csv_path)
 
             # Add all indicators (ADX, SMA, ATR, RSI, BB + Triple Trend)
-            df = TechnicalIndicators.add_all_indicators(
-                df,
-                adx_period=settings.ADX_PERIOD,
-                sma_period=settings.SMA_PERIOD,
-                atr_period=settings.ATR_PERIOD,
-                volume_period=settings.VOLUME_PERIOD,
-                rsi_period=settings.RSI_PERIOD,
-                bb_period=settings.BB_PERIOD,
-                bb_std_dev=settings.BB_STD_DEV,
-                fib_period=50,
-                st_prd=2,
-                st_factor=3.0,
-                it_alpha=0.07
-            )
+            df = TechnicalIndicators.add_all_indicators(df, **INDICATOR_PARAMS)
 
             if len(df) == 0:
                 result['error'] = 'Empty data'
@@ -243,34 +239,38 @@ class StockScreener:
         trend_count = 0
         mr_count = 0
 
-        for stock in stocks:
-            ticker = stock['ticker']
-            print(f"Processing {ticker}...", end=' ')
-
-            result = self.process_stock(stock)
-            processed += 1
-
-            if result['success']:
-                if result['signals']:
-                    # Add all signals from this stock
-                    for signal in result['signals']:
-                        all_signals.append(signal)
-                        if signal.get('strategy') == 'trend_following':
-                            trend_count += 1
-                        elif signal.get('strategy') == 'mean_reversion':
-                            mr_count += 1
-
-                    # Show which strategies triggered
-                    strategies = [s.get('strategy', 'unknown') for s in result['signals']]
-                    scores = [s['score'] for s in result['signals']]
-                    strategy_str = ', '.join([f"{s[:2].upper()}:{sc:.0f}" for s, sc in zip(strategies, scores)])
-                    print(f"✓ SIGNALS ({strategy_str})")
+        # Stocks are independent and their processing (CSV parse, indicators,
+        # detectors) is CPU-bound, so it is spread across worker processes.
+        # Workers are spawned rather than forked since the screener also runs
+        # from a background thread of the API server; map() keeps list order.
+        workers = settings.SCREENER_WORKERS or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            for stock, result in zip(stocks, executor.map(self.process_stock, stocks, chunksize=8)):
+                ticker = stock['ticker']
+                print(f"Processing {ticker}...", end=' ')
+                processed += 1
+
+                if result['success']:
+                    if result['signals']:
+                        # Add all signals from this stock
+                        for signal in result['signals']:
+                            all_signals.append(signal)
+                            if signal.get('strategy') == 'trend_following':
+                                trend_count += 1
+                            elif signal.get('strategy') == 'mean_reversion':
+                                mr_count += 1
+
+                        # Show which strategies triggered
+                        strategies = [s.get('strategy', 'unknown') for s in result['signals']]
+                        scores = [s['score'] for s in result['signals']]
+                        strategy_str = ', '.join([f"{s[:2].upper()}:{sc:.0f}" for s, sc in zip(strategies, scores)])
+                        print(f"✓ SIGNALS ({strategy_str})")
+                    else:
+                        print("✓ No signal")
                 else:
-                    print("✓ No signal")
-            else:
-                error_msg = result.get('error', 'Unknown error')
-                errors.append({'ticker': ticker, 'error': error_msg})
-                print(f"✗ Error: {error_msg}")
+                    error_msg = result.get('error', 'Unknown error')
+                    errors.append({'ticker': ticker, 'error': error_msg})
+                    print(f"✗ Error: {error_msg}")
 
         # Sort ALL signals by score (highest first) - mixed strategies
         all_signals.sort(key=lambda x: x['score'], reverse=True)
@@ -10,8 +10,6 @@ import numpy as np
 from typing import Dict, Optional
 from datetime import datetime
 
-from .indicators import TechnicalIndicators
-
 
 class SignalDetector:
     """Detect trading signals and calculate scores."""
@@ -112,6 +110,43 @@ class SignalDetector:
             'date': latest.name
         }
 
+    def entry_signal_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized detect_entry_signal() over every bar of `df`.
+
+        Element i is True when detect_entry_signal(df.iloc[:i+1]) signals,
+        including the optional volume and ATR filters, so a backtest only
+        needs to build signal details for bars that enter.
+        """
+        adx = df['ADX'].to_numpy(dtype=float)
+        prev_adx = np.empty_like(adx)
+        prev_adx[0] = np.nan  # a single bar never signals
+        prev_adx[1:] = adx[:-1]
+
+        # Comparisons with NaN are False, matching the missing-indicator check
+        mask = (
+            (adx > self.adx_threshold) &
+            (df['DIPlus'].to_numpy(dtype=float) > df['DIMinus'].to_numpy(dtype=float)) &
+            (adx > prev_adx) &
+            (df['Close'].to_numpy(dtype=float) > df['BB_Middle'].to_numpy(dtype=float))
+        )
+
+        if self.volume_filter_enabled and {'Volume', 'Volume_SMA'} <= set(df.columns):
+            volume = df['Volume'].to_numpy(dtype=float)
+            volume_sma = df['Volume_SMA'].to_numpy(dtype=float)
+            elevated = volume > volume_sma * self.volume_multiplier
+            # One of the two previous bars must be elevated too (bars 0-1 have no lookback)
+            sustained = np.ones_like(elevated)
+            sustained[2:] = elevated[1:-1] | elevated[:-2]
+            missing = np.isnan(volume) | np.isnan(volume_sma)
+            mask &= missing | (elevated & sustained)
+
+        if self.atr_filter_enabled and 'ATR_PCT' in df.columns:
+            atr_pct = df['ATR_PCT'].to_numpy(dtype=float)
+            mask &= np.isnan(atr_pct) | (atr_pct >= self.atr_min_pct)
+
+        return mask
+
     def calculate_score(self, signal_info: Dict, df: pd.DataFrame) -> float:
         """
         Calculate improved signal score.
@@ -274,22 +309,19 @@ class SignalDetector:
 
         if entry_index is not None and entry_index >= 0:
             # NEW LOGIC: Scan from entry to current for any crossunder
-            # Use TechnicalIndicators.detect_crossunder helper
-            df_slice = df.iloc[entry_index:current_index+1].copy()
+            # (same rule as TechnicalIndicators.detect_crossunder), reading
+            # the window from the column arrays instead of copying a slice
+            di_plus = df['DIPlus'].to_numpy()[entry_index:current_index+1]
+            di_minus = df['DIMinus'].to_numpy()[entry_index:current_index+1]
 
-            if len(df_slice) > 1:
-                crossunders = TechnicalIndicators.detect_crossunder(
-                    df_slice['DIPlus'],
-                    df_slice['DIMinus']
-                )
+            if len(di_plus) > 1:
+                crossunders = (di_plus[:-1] >= di_minus[:-1]) & (di_plus[1:] < di_minus[1:])
 
                 # Check if any crossunder occurred
                 if crossunders.any():
                     trend_reversal = True
                     # Find first crossunder date
-                    crossunder_indices = crossunders[crossunders == True].index
-                    if len(crossunder_indices) > 0:
-                        reversal_date = crossunder_indices[0]
+                    reversal_date = df.index[entry_index + 1 + int(crossunders.argmax())]
         else:
             # FALLBACK: Old logic if entry_index not provided (backward compatibility)
             if current_index > 0:
@@ -131,9 +131,8 @@ class SqueezeDetector(ForexStrategy):
         
         if df is None or len(df) < 50: return None
 
-        # Add indicators to base timeframe
+        # Add indicators to base timeframe (read-only below, so no copy is needed)
         df = TechnicalIndicators.add_all_indicators(df)
-        df = df.copy() # Ensure we work on a copy to avoid SettingWithCopyWarning
         
         latest = df.iloc[-1]
         prev = df.iloc[-2]
@@ -169,10 +168,10 @@ class SqueezeDetector(ForexStrategy):
 
         # 1. Detect Squeeze Condition (TTM Squeeze Style)
         # Squeeze = BB inside Keltner Channel
-        df['is_sqz'] = (df['BB_Upper'] < df['KC_Upper']) & (df['BB_Lower'] > df['KC_Lower'])
-        
-        # We want to see a squeeze in the last 5 candles
-        had_squeeze = df['is_sqz'].iloc[-6:-1].any()
+        # We want to see a squeeze in the last 5 candles, so only those are evaluated
+        recent = df.iloc[-6:-1]
+        is_sqz = (recent['BB_Upper'] < recent['KC_Upper']) & (recent['BB_Lower'] > recent['KC_Lower'])
+        had_squeeze = is_sqz.any()
         
         # 2. Detect Breakout (Expansion)
         # Price breaking out of Bands (INITIAL CROSS ONLY)
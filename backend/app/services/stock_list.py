@@ -0,0 +1,41 @@
+"""
+Stock List Loader
+
+Reads metadata/stock_list.json once per file version. The screener, the API
+routes and the backtest driver all need the list; the parsed copy is reused
+until the file is regenerated (its modification time changes).
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..config import settings
+
+# orjson parses several times faster; fall back to the stdlib if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4)
+def _parse_stock_list(path: Path, mtime_ns: int) -> Tuple[Dict, ...]:
+    payload = path.read_bytes()
+    data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    return tuple(data.get('stocks', []))
+
+
+def load_stock_list(path: Optional[Path] = None) -> List[Dict]:
+    """
+    Load the stocks of a stock list file (default: metadata/stock_list.json).
+
+    Returns a new list on every call, so callers may extend it; the stock
+    dicts themselves are shared and must not be modified.
+
+    Raises:
+        FileNotFoundError: If the stock list does not exist
+    """
+    path = Path(path) if path else settings.METADATA_DIR / 'stock_list.json'
+    return list(_parse_stock_list(path, path.stat().st_mtime_ns))
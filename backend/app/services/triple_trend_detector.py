@@ -186,16 +186,45 @@ class TripleTrendDetector(ForexStrategy):
         return {
             'has_signal': has_signal,
             'is_bullish': fib_bullish or st_bullish,
+            'close': float(latest['Close']),
             'fib_pos': 0 if pd.isna(fib_pos) else fib_pos,
-            'st_trend': 0 if pd.isna(pp_trend) else pp_trend
+            'st_trend': 0 if pd.isna(pp_trend) else pp_trend,
+            'it_trend': 0 if pd.isna(it_trend) else it_trend,
+            'it_trigger': 0 if pd.isna(it_trigger) else it_trigger
         }
 
+    def entry_signal_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized detect_entry_signal() over every bar of `df`: element i is
+        True when detect_entry_signal(df.iloc[:i+1]) signals.
+        """
+        if 'Fib_Pos' not in df.columns:
+            df = TechnicalIndicators.add_all_indicators(df, fib_period=self.fib_period, st_factor=self.st_factor, it_alpha=self.it_alpha)
+
+        trigger = df['IT_Trigger'].to_numpy(dtype=float)
+        trend = df['IT_Trend'].to_numpy(dtype=float)
+        crossover_bull = np.zeros(len(df), dtype=bool)
+        crossover_bull[1:] = (trigger[:-1] <= trend[:-1]) & (trigger[1:] > trend[1:])
+
+        # Comparisons with NaN are False, matching the NaN checks
+        mask = (
+            (df['Fib_Pos'].to_numpy(dtype=float) > 0) &
+            (df['PP_Trend'].to_numpy(dtype=float) == 1) &
+            crossover_bull
+        )
+        mask[:49] = False  # detect_entry_signal() needs at least 50 bars
+        return mask
+
     def detect_exit_signal(self, df: pd.DataFrame, entry_price: float, current_index: int = -1, entry_index: int = None) -> Dict:
         """
         Backward compatibility for Portfolio API.
         """
         if df is None or len(df) < 2:
             return {'has_exit': False}
+
+        # Backtester passes the full frame with the current bar's position
+        if current_index is not None and current_index >= 0:
+            df = df.iloc[:current_index + 1]
             
         data = {'base': df}
         res = self.check_exit(data, "BUY", entry_price) # Assume BUY for portfolio trend
@@ -203,7 +232,8 @@ class TripleTrendDetector(ForexStrategy):
         if res and res.get('exit_signal'):
             return {
                 'has_exit': True,
-                'exit_reason': res.get('reason')
+                'exit_reason': res.get('reason'),
+                'current_price': float(df['Close'].iloc[-1])
             }
         return {'has_exit': False}
 
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from backend.app.services.backtest_sweep import compound, find_exit
+
+
+def reference_find_exit(highs, lows, start, sl, tp, is_buy):
+    """Bar-by-bar SL/TP walk the windowed scan replaced."""
+    for j in range(start, len(highs)):
+        if is_buy:
+            if lows[j] <= sl:
+                return j, False
+            if highs[j] >= tp:
+                return j, True
+        else:
+            if highs[j] >= sl:
+                return j, False
+            if lows[j] <= tp:
+                return j, True
+    return -1, False
+
+
+@pytest.mark.parametrize('is_buy', [True, False])
+def test_find_exit_matches_bar_by_bar(is_buy):
+    # Long random walk so exits land both inside and well past the first window
+    rng = np.random.default_rng(3)
+    closes = 100 + np.cumsum(rng.normal(0, 0.2, 5000))
+    highs = closes + rng.uniform(0, 0.3, closes.size)
+    lows = closes - rng.uniform(0, 0.3, closes.size)
+
+    for start in range(1, 4000, 37):
+        for width in (0.5, 3.0, 40.0):
+            sign = 1 if is_buy else -1
+            sl, tp = closes[start - 1] - sign * width, closes[start - 1] + sign * 2 * width
+            assert find_exit(highs, lows, start, sl, tp, is_buy) == \
+                reference_find_exit(highs, lows, start, sl, tp, is_buy)
+
+
+def test_find_exit_prefers_sl_on_a_bar_touching_both():
+    highs, lows = np.array([1.0, 1.5]), np.array([1.0, 0.5])
+    assert find_exit(highs, lows, 1, 0.8, 1.2, True) == (1, False)
+    assert find_exit(highs, lows, 1, 1.2, 0.8, False) == (1, False)
+
+
+def test_compound_matches_running_balance():
+    wins = np.array([True, False, False, True, True, False])
+    pnl, balance = compound(wins, 3.0, 0.02, 10_000.0)
+
+    running = 10_000.0
+    for win, trade_pnl, after in zip(wins, pnl, balance):
+        expected = running * 0.02 * (3.0 if win else -1.0)
+        running += expected
+        assert trade_pnl == pytest.approx(expected)
+        assert after == pytest.approx(running)
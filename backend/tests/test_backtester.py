@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backend.app.services.backtester import Backtester
+from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.mean_reversion_detector import MeanReversionDetector
+from backend.app.services.signal_detector import SignalDetector
+from backend.app.services.triple_trend_detector import TripleTrendDetector
+
+
+def make_stock(seed, n=500):
+    # Random walk with alternating up/down regimes, so trends (high ADX) and
+    # sharp pullbacks (oversold RSI) both occur; a few days are missing
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-0.004, 0.0, 0.006], size=n // 25 + 1), 25)[:n]
+    close = 20 * np.exp(np.cumsum(drift + rng.normal(0, 0.015, n)))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, n))
+    df = pd.DataFrame(
+        {'Open': open_, 'High': high, 'Low': low, 'Close': close,
+         'Volume': rng.lognormal(11, 0.5, n)},
+        index=pd.date_range('2022-01-03', periods=n, freq='B')
+    )
+    df = df.drop(df.index[rng.choice(np.arange(1, n), size=n // 20, replace=False)])
+    return TechnicalIndicators.add_all_indicators(df)
+
+
+@pytest.fixture(scope='module')
+def stock_data():
+    return {f'T{seed}': make_stock(seed) for seed in range(6)}
+
+
+DETECTORS = {
+    'adx': lambda: SignalDetector(adx_threshold=25.0),
+    'adx_filtered': lambda: SignalDetector(
+        adx_threshold=20.0, volume_filter_enabled=True, volume_multiplier=1.1,
+        atr_filter_enabled=True, atr_min_pct=2.5
+    ),
+    'mean_reversion': lambda: MeanReversionDetector(rsi_threshold=40.0),
+    'mean_reversion_filtered': lambda: MeanReversionDetector(
+        rsi_threshold=40.0, volume_filter_enabled=True, volume_multiplier=1.1
+    ),
+    'triple_trend': lambda: TripleTrendDetector(),
+}
+
+
+@pytest.mark.parametrize('name', DETECTORS)
+def test_entry_signal_mask_matches_per_bar_signals(stock_data, name):
+    detector = DETECTORS[name]()
+    signalled = 0
+    for df in stock_data.values():
+        mask = detector.entry_signal_mask(df)
+        expected = [bool(detector.detect_entry_signal(df.iloc[:i + 1])['has_signal']) for i in range(len(df))]
+        assert mask.tolist() == expected
+        signalled += sum(expected)
+    assert signalled > 0
+
+
+class ReferenceBacktester(Backtester):
+    """
+    Backtester with the per-bar scans it had before the candidate panel:
+    every ticker is sliced and checked on every date, exits get a
+    df.loc[:date] copy, and the end-of-backtest close compares date strings.
+    """
+
+    def _build_entry_candidates(self, stock_data, all_dates):
+        return {}
+
+    def _check_exits(self, current_date, stock_data):
+        for position in self.open_positions[:]:
+            ticker = position.ticker
+            if ticker not in stock_data:
+                continue
+            df = stock_data[ticker]
+            if current_date not in df.index:
+                continue
+
+            df_current = df.loc[:current_date]
+
+            entry_index = None
+            try:
+                entry_index = df_current.index.get_loc(position.entry_date)
+            except KeyError:
+                mask = df_current.index <= position.entry_date
+                if mask.any():
+                    entry_dates = df_current.index[mask]
+                    if len(entry_dates) > 0:
+                        entry_index = len(entry_dates) - 1
+
+            exit_info = self.detector.detect_exit_signal(
+                df_current,
+                entry_price=position.entry_price,
+                current_index=-1,
+                entry_index=entry_index
+            )
+
+            if exit_info['has_exit']:
+                trade = self._close_position(
+                    position, current_date, exit_info['current_price'], exit_info['exit_reason']
+                )
+                self.closed_trades.append(trade)
+                self.open_positions.remove(position)
+
+    def _check_entries(self, current_date, stock_data):
+        if len(self.open_positions) >= self.max_positions:
+            return
+
+        signals = []
+        for ticker, df in stock_data.items():
+            if current_date not in df.index:
+                continue
+            if any(p.ticker == ticker for p in self.open_positions):
+                continue
+
+            df_current = df.loc[:current_date]
+            signal_info = self.detector.detect_entry_signal(df_current)
+
+            if signal_info['has_signal']:
+                score = self.detector.calculate_score(signal_info, df_current)
+                signals.append({
+                    'ticker': ticker,
+                    'score': score,
+                    'price': signal_info['close'],
+                    'signal_info': signal_info,
+                    'df': df_current
+                })
+
+        signals.sort(key=lambda x: x['score'], reverse=True)
+
+        slots_available = self.max_positions - len(self.open_positions)
+        for signal in signals[:slots_available]:
+            position = self._open_position(current_date, signal)
+            if position:
+                self.open_positions.append(position)
+
+    def _update_equity(self, date, stock_data):
+        positions_value = 0.0
+        for position in self.open_positions:
+            if position.ticker in stock_data:
+                df = stock_data[position.ticker]
+                if date in df.index:
+                    positions_value += df.loc[date, 'Close'] * position.shares
+
+        total_equity = self.current_capital + positions_value
+
+        if self.equity_curve:
+            peak = max(e['portfolio_value'] for e in self.equity_curve)
+        else:
+            peak = self.initial_capital
+
+        drawdown_pct = ((total_equity - peak) / peak) * 100 if peak > 0 else 0
+
+        self.equity_curve.append({
+            'date': date,
+            'portfolio_value': total_equity,
+            'cash': self.current_capital,
+            'positions_value': positions_value,
+            'drawdown_pct': drawdown_pct,
+            'num_positions': len(self.open_positions)
+        })
+
+    def _close_all_positions(self, date, stock_data):
+        for position in self.open_positions[:]:
+            ticker = position.ticker
+            if ticker not in stock_data:
+                continue
+            df = stock_data[ticker]
+
+            end_date_str = date.strftime('%Y-%m-%d')
+            available_indices = []
+            for idx in df.index:
+                try:
+                    if idx.strftime('%Y-%m-%d') <= end_date_str:
+                        available_indices.append(idx)
+                except Exception:
+                    pass
+            available_dates = pd.Index(available_indices)
+
+            if len(available_dates) > 0:
+                last_date = available_dates[-1]
+                trade = self._close_position(position, last_date, df.loc[last_date, 'Close'], 'end_of_backtest')
+                self.closed_trades.append(trade)
+
+        self.open_positions.clear()
+
+
+@pytest.mark.parametrize('name', DETECTORS)
+@pytest.mark.parametrize('end_date', ['2023-06-30', '2030-01-01'])
+def test_backtest_matches_per_bar_reference(stock_data, name, end_date):
+    # A small max_positions makes the entry ranking and capacity checks matter;
+    # the first end date falls inside the data, so the end-of-backtest close
+    # has to pick the last bar on or before it
+    kwargs = dict(start_date='2022-06-01', end_date=end_date, max_positions=3)
+    results = Backtester(DETECTORS[name](), **kwargs).run(stock_data)
+    expected = ReferenceBacktester(DETECTORS[name](), **kwargs).run(stock_data)
+
+    assert len(expected.trades) > 0
+    assert results.trades == expected.trades
+    pd.testing.assert_frame_equal(results.equity_curve, expected.equity_curve)
+    assert results.final_capital == expected.final_capital
@@ -0,0 +1,192 @@
+import importlib.util
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import requests
+
+pytest.importorskip("oandapyV20")
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "download_forex.py"
+
+
+@pytest.fixture(scope="module")
+def download_forex():
+    spec = importlib.util.spec_from_file_location("download_forex", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def prepared_query(params):
+    url = requests.Request("GET", "https://api-fxtrade.oanda.com/v3/instruments/EUR_USD/candles",
+                           params=params).prepare().url
+    return url.split("?", 1)[1].split("&")
+
+
+def test_incremental_request_excludes_first_candle(download_forex):
+    params = download_forex.candle_params("M5", pd.Timestamp("2024-01-05 10:15:00"))
+    query = prepared_query(params)
+
+    assert "includeFirst=false" in query
+    assert "from=2024-01-05T10%3A15%3A00.000000000Z" in query
+    assert "count=5000" in query
+
+
+def test_initial_request_has_no_from(download_forex):
+    query = prepared_query(download_forex.candle_params("H1"))
+
+    assert "count=5000" in query
+    assert not any(q.startswith(("from=", "includeFirst=")) for q in query)
+
+
+def make_m5_candles(n, start="2024-01-05T21:40:00", seed=0):
+    # OANDA-shaped M5 candles; prices are strings as in the API payload and
+    # the last candle is still forming
+    rng = random.Random(seed)
+    t0 = datetime.strptime(start, "%Y-%m-%dT%H:%M:%S")
+    candles = []
+    price = 1.1
+    for i in range(n):
+        o = price
+        price += rng.uniform(-0.001, 0.001)
+        h, l = max(o, price) + rng.uniform(0, 0.0005), min(o, price) - rng.uniform(0, 0.0005)
+        candles.append({
+            "complete": i < n - 1,
+            "time": (t0 + timedelta(minutes=5 * i)).strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+            "mid": {"o": f"{o:.5f}", "h": f"{h:.5f}", "l": f"{l:.5f}", "c": f"{price:.5f}"},
+            "volume": rng.randint(1, 500),
+        })
+    return candles
+
+
+def reference_resample_candles(candles, minutes):
+    """The per-candle datetime/dict loop resample_candles replaced."""
+    buckets = {}
+    data_end = None
+    for c in candles:
+        start = datetime.strptime(c['time'][:19], "%Y-%m-%dT%H:%M:%S")
+        end = start + timedelta(minutes=5) if c['complete'] else start
+        data_end = end if data_end is None else max(data_end, end)
+        if not c['complete']: continue
+
+        mid = c['mid']
+        o, h, l, cl = float(mid['o']), float(mid['h']), float(mid['l']), float(mid['c'])
+        bucket_start = start - timedelta(minutes=(start.hour * 60 + start.minute) % minutes)
+        b = buckets.get(bucket_start)
+        if b is None:
+            buckets[bucket_start] = {"o": o, "h": h, "l": l, "c": cl, "volume": int(c['volume'])}
+        else:
+            b["h"] = max(b["h"], h)
+            b["l"] = min(b["l"], l)
+            b["c"] = cl
+            b["volume"] += int(c['volume'])
+
+    return [
+        {
+            "complete": bucket_start + timedelta(minutes=minutes) <= data_end,
+            "time": bucket_start.strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+            "mid": {"o": b["o"], "h": b["h"], "l": b["l"], "c": b["c"]},
+            "volume": b["volume"],
+        }
+        for bucket_start, b in sorted(buckets.items())
+    ]
+
+
+@pytest.mark.parametrize("minutes", [15, 60, 240])
+def test_resample_candles_matches_reference(download_forex, minutes):
+    candles = make_m5_candles(700)
+    # Crosses midnight, starts mid-bucket and ends on a forming candle
+    assert download_forex.resample_candles(candles, minutes) == reference_resample_candles(candles, minutes)
+
+    # Out of order and with repeated candles, bucket opens/closes follow arrival order
+    shuffled = candles + candles[100:130]
+    random.Random(1).shuffle(shuffled)
+    assert download_forex.resample_candles(shuffled, minutes) == reference_resample_candles(shuffled, minutes)
+
+
+def test_resample_candles_without_complete_candles(download_forex):
+    candles = make_m5_candles(1)
+    assert download_forex.resample_candles(candles, 15) == reference_resample_candles(candles, 15) == []
+    assert download_forex.resample_candles([], 15) == []
+
+
+def reference_update_dataset(filename, candles):
+    """The pandas merge update_dataset ran on every update before the append path."""
+    existing_df = None
+    if filename.exists():
+        existing_df = pd.read_csv(filename)
+        existing_df['Date'] = pd.to_datetime(existing_df['Date'])
+
+    new_records = []
+    for c in candles:
+        if not c['complete']: continue
+        new_records.append({
+            "Date": c['time'],
+            "Open": float(c['mid']['o']),
+            "High": float(c['mid']['h']),
+            "Low": float(c['mid']['l']),
+            "Close": float(c['mid']['c']),
+            "Volume": int(c['volume'])
+        })
+    if not new_records:
+        return
+
+    new_df = pd.DataFrame(new_records)
+    new_df['Date'] = pd.to_datetime(new_df['Date'], utc=True).dt.tz_convert(None)
+
+    if existing_df is not None:
+        combined_df = pd.concat([existing_df, new_df])
+        combined_df = combined_df.drop_duplicates(subset=['Date'], keep='last')
+        combined_df = combined_df.sort_values('Date')
+        if len(combined_df) > 20000:
+            combined_df = combined_df.tail(20000)
+        combined_df.to_csv(filename, index=False)
+    else:
+        new_df.to_csv(filename, index=False)
+
+
+@pytest.mark.parametrize("order", ["sorted", "shuffled"])
+def test_update_dataset_matches_reference_merge(download_forex, tmp_path, order):
+    candles = make_m5_candles(600)
+    first, update = candles[:300], candles[280:]
+    # The last candle of the first batch is still forming, so the update
+    # repeats it complete; shuffling forces the full-merge fallback
+    first[-1] = dict(first[-1], complete=False)
+    if order == "shuffled":
+        random.Random(2).shuffle(update)
+
+    result, expected = tmp_path / "result.csv", tmp_path / "expected.csv"
+    for batch in (first, update):
+        download_forex.update_dataset(None, result, "EUR_USD", "M5", "M5", candles=batch)
+        reference_update_dataset(expected, batch)
+
+    pd.testing.assert_frame_equal(pd.read_csv(result), pd.read_csv(expected))
+    assert len(pd.read_csv(result)) == 599
+    # Appended rows keep the "\n" line endings pandas writes
+    assert b"\r" not in result.read_bytes()
+
+
+def test_new_csv_rows(download_forex):
+    candles = make_m5_candles(5)
+    after = pd.Timestamp("2024-01-05 21:45:00")
+
+    rows = download_forex.new_csv_rows(candles, download_forex.CSV_COLUMNS, after)
+    # The forming last candle is left out; prices keep the payload's strings
+    assert rows == [
+        [c["time"][:19].replace("T", " "), c["mid"]["o"], c["mid"]["h"], c["mid"]["l"], c["mid"]["c"], c["volume"]]
+        for c in candles[2:4]
+    ]
+    assert download_forex.new_csv_rows(candles[::-1], download_forex.CSV_COLUMNS, after) is None
+
+
+def test_update_dataset_creates_file_like_pandas(download_forex, tmp_path):
+    candles = make_m5_candles(50)
+    result, expected = tmp_path / "result.csv", tmp_path / "expected.csv"
+    download_forex.update_dataset(None, result, "EUR_USD", "M5", "M5", candles=candles)
+    reference_update_dataset(expected, candles)
+
+    pd.testing.assert_frame_equal(pd.read_csv(result), pd.read_csv(expected))
+    assert b"\r" not in result.read_bytes()
@@ -0,0 +1,244 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from backend.app.services.indicators import TechnicalIndicators, cached_indicator_frame
+
+
+@pytest.fixture(params=['float64', 'float32'])
+def ohlcv(request):
+    # Random walk rounded to the cent, so equal highs/lows (pivot ties) occur
+    rng = np.random.default_rng(7)
+    n = 600
+    close = np.round(100 + np.cumsum(rng.normal(0, 0.5, n)), 2)
+    open_ = np.round(close + rng.normal(0, 0.2, n), 2)
+    high = np.maximum(open_, close) + np.round(rng.uniform(0, 0.4, n), 2)
+    low = np.minimum(open_, close) - np.round(rng.uniform(0, 0.4, n), 2)
+    df = pd.DataFrame(
+        {'Open': open_, 'High': high, 'Low': low, 'Close': close,
+         'Volume': rng.integers(1000, 5000, n).astype(float)},
+        index=pd.date_range('2023-01-02', periods=n, freq='B')
+    )
+    return df.astype(dict.fromkeys(['Open', 'High', 'Low', 'Close'], request.param))
+
+
+# Reference implementations: the per-bar versions the vectorized
+# indicators replaced, kept verbatim to check the outputs still match
+
+def reference_true_range(df):
+    df = df.copy()
+    df['prev_close'] = df['Close'].shift(1)
+
+    tr1 = df['High'] - df['Low']
+    tr2 = abs(df['High'] - df['prev_close'])
+    tr3 = abs(df['Low'] - df['prev_close'])
+
+    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    return true_range
+
+
+def reference_directional_movement(df):
+    df = df.copy()
+    df['prev_high'] = df['High'].shift(1)
+    df['prev_low'] = df['Low'].shift(1)
+
+    df['high_diff'] = df['High'] - df['prev_high']
+    df['low_diff'] = df['prev_low'] - df['Low']
+
+    dm_plus = pd.Series(0.0, index=df.index)
+    dm_plus[df['high_diff'] > df['low_diff']] = df.loc[
+        df['high_diff'] > df['low_diff'], 'high_diff'
+    ].clip(lower=0)
+
+    dm_minus = pd.Series(0.0, index=df.index)
+    dm_minus[df['low_diff'] > df['high_diff']] = df.loc[
+        df['low_diff'] > df['high_diff'], 'low_diff'
+    ].clip(lower=0)
+
+    return dm_plus, dm_minus
+
+
+def reference_pivot_supertrend(df, prd=2, factor=3.0, period=10):
+    df = df.copy()
+
+    df['ph'] = df['High'].rolling(window=prd*2+1, center=True).apply(lambda x: x.iloc[prd] if all(x.iloc[prd] >= i for i in x) else np.nan)
+    df['pl'] = df['Low'].rolling(window=prd*2+1, center=True).apply(lambda x: x.iloc[prd] if all(x.iloc[prd] <= i for i in x) else np.nan)
+
+    center = np.nan
+    centers = []
+    for i in range(len(df)):
+        last_pp = df['ph'].iloc[i] if not pd.isna(df['ph'].iloc[i]) else (df['pl'].iloc[i] if not pd.isna(df['pl'].iloc[i]) else np.nan)
+        if not pd.isna(last_pp):
+            if pd.isna(center):
+                center = last_pp
+            else:
+                center = (center * 2 + last_pp) / 3.0
+        centers.append(center)
+    df['PP_Center'] = centers
+
+    atr = TechnicalIndicators.calculate_atr(df, period)
+    df['PP_Up'] = df['PP_Center'] - (factor * atr)
+    df['PP_Dn'] = df['PP_Center'] + (factor * atr)
+
+    trend = 1
+    t_up = np.zeros(len(df))
+    t_dn = np.zeros(len(df))
+    trends = []
+
+    for i in range(1, len(df)):
+        t_up[i] = max(df['PP_Up'].iloc[i], t_up[i-1]) if df['Close'].iloc[i-1] > t_up[i-1] else df['PP_Up'].iloc[i]
+        t_dn[i] = min(df['PP_Dn'].iloc[i], t_dn[i-1]) if df['Close'].iloc[i-1] < t_dn[i-1] else df['PP_Dn'].iloc[i]
+
+        if df['Close'].iloc[i] > t_dn[i-1]:
+            trend = 1
+        elif df['Close'].iloc[i] < t_up[i-1]:
+            trend = -1
+        trends.append(trend)
+
+    df['PP_Trend'] = [1] + trends
+    df['PP_TrailingSL'] = [t_up[i] if trends[i-1] == 1 else t_dn[i] for i in range(len(df))]
+    return df
+
+
+def reference_ehlers_instant_trend(df, alpha=0.07):
+    src = (df['High'] + df['Low']) / 2
+    it = np.zeros(len(df))
+
+    for i in range(min(3, len(df))):
+        it[i] = src.iloc[i]
+
+    a2 = alpha * alpha
+    for i in range(2, len(df)):
+        it[i] = (alpha - a2 / 4.0) * src.iloc[i] + \
+                0.5 * a2 * src.iloc[i-1] - \
+                (alpha - 0.75 * a2) * src.iloc[i-2] + \
+                2 * (1 - alpha) * it[i-1] - \
+                (1 - alpha) * (1 - alpha) * it[i-2]
+
+    df = df.copy()
+    df['IT_Trend'] = it
+    df['IT_Trigger'] = 2.0 * df['IT_Trend'] - df['IT_Trend'].shift(2)
+    return df
+
+
+def reference_fibonacci_structure_trend(df, period=50, fib=0.382):
+    df = df.copy()
+
+    pos = 0
+    poss = []
+    retrace = 0.0
+    retraces = []
+
+    current_hi = df['High'].iloc[0]
+    current_lo = df['Low'].iloc[0]
+
+    for i in range(len(df)):
+        if pos >= 0:
+            if df['High'].iloc[i] > current_hi:
+                current_hi = df['High'].iloc[i]
+                retrace = current_hi - (current_hi - current_lo) * fib
+            if df['High'].iloc[i] < retrace:
+                pos = -1
+                current_lo = df['Low'].iloc[i]
+                retrace = current_lo + (current_hi - current_lo) * fib
+        else:
+            if df['Low'].iloc[i] < current_lo:
+                current_lo = df['Low'].iloc[i]
+                retrace = current_lo + (current_hi - current_lo) * fib
+            if df['Low'].iloc[i] > retrace:
+                pos = 1
+                current_hi = df['High'].iloc[i]
+                retrace = current_hi - (current_hi - current_lo) * fib
+
+        poss.append(pos)
+        retraces.append(retrace)
+
+    df['Fib_Pos'] = poss
+    df['Fib_Retrace'] = retraces
+    return df
+
+
+@pytest.mark.parametrize('prd', [1, 2, 3])
+def test_pivot_supertrend_matches_reference(ohlcv, prd):
+    expected = reference_pivot_supertrend(ohlcv, prd=prd)
+    result = TechnicalIndicators.calculate_pivot_supertrend(ohlcv, prd=prd)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_pivot_supertrend_short_frame_matches_reference(ohlcv):
+    short = ohlcv.iloc[:4]
+    pd.testing.assert_frame_equal(
+        TechnicalIndicators.calculate_pivot_supertrend(short),
+        reference_pivot_supertrend(short)
+    )
+
+
+@pytest.mark.parametrize('alpha', [0.07, 0.2])
+def test_ehlers_instant_trend_matches_reference(ohlcv, alpha):
+    pd.testing.assert_frame_equal(
+        TechnicalIndicators.calculate_ehlers_instant_trend(ohlcv, alpha=alpha),
+        reference_ehlers_instant_trend(ohlcv, alpha=alpha)
+    )
+
+
+@pytest.mark.parametrize('fib', [0.382, 0.618])
+def test_fibonacci_structure_trend_matches_reference(ohlcv, fib):
+    pd.testing.assert_frame_equal(
+        TechnicalIndicators.calculate_fibonacci_structure_trend(ohlcv, fib=fib),
+        reference_fibonacci_structure_trend(ohlcv, fib=fib)
+    )
+
+
+def test_true_range_matches_reference(ohlcv):
+    pd.testing.assert_series_equal(
+        TechnicalIndicators.calculate_true_range(ohlcv), reference_true_range(ohlcv)
+    )
+
+
+def test_directional_movement_matches_reference(ohlcv):
+    dm_plus, dm_minus = TechnicalIndicators.calculate_directional_movement(ohlcv)
+    ref_plus, ref_minus = reference_directional_movement(ohlcv)
+    pd.testing.assert_series_equal(dm_plus, ref_plus)
+    pd.testing.assert_series_equal(dm_minus, ref_minus)
+
+
+def test_add_all_indicators_matches_reference(ohlcv, monkeypatch):
+    result = TechnicalIndicators.add_all_indicators(ohlcv)
+
+    # Same pipeline with every rewritten step swapped for its reference
+    for name, reference in [
+        ('calculate_true_range', reference_true_range),
+        ('calculate_directional_movement', reference_directional_movement),
+        ('calculate_ehlers_instant_trend', reference_ehlers_instant_trend),
+        ('calculate_pivot_supertrend', reference_pivot_supertrend),
+        ('calculate_fibonacci_structure_trend', reference_fibonacci_structure_trend),
+    ]:
+        monkeypatch.setattr(TechnicalIndicators, name, staticmethod(reference))
+    expected = TechnicalIndicators.add_all_indicators(ohlcv)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_cached_indicator_frame_keeps_other_csvs_entries(tmp_path):
+    # One stem is a prefix of the other, as with EURUSD=X and EURUSD=X_15_Min
+    cache_dir = tmp_path / 'cache'
+    daily, intraday = tmp_path / 'EURUSD=X.csv', tmp_path / 'EURUSD=X_15_Min.csv'
+    frame = pd.DataFrame({'Close': [1.0, 2.0]})
+    for path in (daily, intraday):
+        path.write_text('Close\n1\n2\n')
+        cached_indicator_frame(path, cache_dir, {}, lambda: frame)
+
+    entries = sorted(p.name for p in cache_dir.iterdir())
+    assert len(entries) == 2
+
+    # Rewriting the daily CSV replaces its own entry only
+    daily.write_text('Close\n1\n2\n3\n')
+    os.utime(daily, ns=(daily.stat().st_mtime_ns + 10**9,) * 2)
+    pd.testing.assert_frame_equal(cached_indicator_frame(daily, cache_dir, {}, lambda: frame), frame)
+
+    remaining = sorted(p.name for p in cache_dir.iterdir())
+    assert len(remaining) == 2
+    assert [n for n in entries if n.startswith('EURUSD=X_15_Min_')] == \
+        [n for n in remaining if n.startswith('EURUSD=X_15_Min_')]
+    assert set(entries) != set(remaining)
@@ -0,0 +1,86 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from backend.app.config import settings
+from backend.app.services.screener import StockScreener
+
+
+def write_stock_csv(path, seed, n=400):
+    # Random walk with a sharp late sell-off in some stocks, so the
+    # mean-reversion strategy signals on the last bar of a few of them
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.003, 0.012, n)
+    if seed % 3 == 0:
+        returns[-5:] = -0.025
+    close = 20 * np.exp(np.cumsum(returns))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    df = pd.DataFrame({
+        'Date': pd.date_range('2022-01-03', periods=n, freq='B').strftime('%Y-%m-%d'),
+        'Open': open_,
+        'High': np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, n)),
+        'Low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, n)),
+        'Close': close,
+        'Volume': rng.integers(10_000, 50_000, n),
+    })
+    df.to_csv(path, index=False)
+
+
+@pytest.fixture
+def screener(tmp_path, monkeypatch):
+    stocks = [{'ticker': f'S{seed}.AX', 'name': f'Stock {seed}', 'sector': 'Test'} for seed in range(12)]
+    for seed, stock in enumerate(stocks):
+        write_stock_csv(tmp_path / f"{stock['ticker']}.csv", seed)
+    # A stock without a CSV and one whose CSV cannot be screened
+    stocks.append({'ticker': 'MISSING.AX', 'name': 'Missing', 'sector': 'Test'})
+    stocks.append({'ticker': 'BROKEN.AX', 'name': 'Broken', 'sector': 'Test'})
+    (tmp_path / 'BROKEN.AX.csv').write_text('Date,Price\n2024-01-02,1.0\n')
+    (tmp_path / 'stock_list.json').write_text(json.dumps({'stocks': stocks}))
+
+    monkeypatch.setattr(settings, 'SCREENER_WORKERS', 2)
+    return StockScreener(data_dir=tmp_path, metadata_dir=tmp_path, output_dir=tmp_path)
+
+
+def reference_screen_all_stocks(screener):
+    """The sequential per-stock loop screen_all_stocks ran before the process pool."""
+    stocks = screener.load_stock_list()
+
+    all_signals = []
+    errors = []
+    trend_count = 0
+    mr_count = 0
+
+    for stock in stocks:
+        result = screener.process_stock(stock)
+
+        if result['success']:
+            for signal in result['signals']:
+                all_signals.append(signal)
+                if signal.get('strategy') == 'trend_following':
+                    trend_count += 1
+                elif signal.get('strategy') == 'mean_reversion':
+                    mr_count += 1
+        else:
+            errors.append({'ticker': stock['ticker'], 'error': result.get('error', 'Unknown error')})
+
+    all_signals.sort(key=lambda x: x['score'], reverse=True)
+
+    return {
+        'total_stocks': len(stocks),
+        'signals_count': len(all_signals),
+        'trend_following_count': trend_count,
+        'mean_reversion_count': mr_count,
+        'signals': all_signals,
+        'errors': errors if errors else None
+    }
+
+
+def test_screen_all_stocks_matches_sequential_reference(screener):
+    results = screener.screen_all_stocks()
+    expected = reference_screen_all_stocks(screener)
+
+    results.pop('generated_at')
+    assert results == expected
+    assert expected['mean_reversion_count'] > 0
+    assert [e['ticker'] for e in expected['errors']] == ['MISSING.AX', 'BROKEN.AX']
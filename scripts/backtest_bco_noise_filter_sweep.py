@@ -23,9 +23,10 @@ import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 DATA_DIR        = Path("data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 OUT_FILE        = Path("data/backtest_bco_noise_filter_sweep.csv")
 INITIAL_BALANCE = 10_000.0
 RISK_PCT        = 0.01
@@ -42,17 +43,10 @@ BASE_ADX_MIN = 15.0
 
 def load_and_prep():
     csv = DATA_DIR / "BCO_USD_15_Min.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = load_candle_indicators(csv, CACHE_DIR)
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
-    df.dropna(subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"],
-              inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"])
 
 
 def _close(balance, rr, win):
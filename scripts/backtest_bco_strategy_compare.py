@@ -17,13 +17,15 @@ import sys
 import itertools
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.indicators import TechnicalIndicators, drop_warmup_rows, load_candle_indicators
 
 # ---------------------------------------------------------------------------
 DATA_DIR        = Path("data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 OUT_FILE        = Path("data/backtest_bco_strategy_compare.csv")
 INITIAL_BALANCE = 10_000.0
 RISK_PCT        = 0.01
@@ -38,36 +40,23 @@ TF_SUFFIX       = {"5m": "5_Min", "15m": "15_Min", "1h": "1_Hour"}
 def load_df(tf: str) -> pd.DataFrame:
     suffix = TF_SUFFIX[tf]
     csv = DATA_DIR / f"BCO_USD_{suffix}.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = load_candle_indicators(csv, CACHE_DIR)
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
-    df.dropna(subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"],
-              inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"])
 
 
 def load_df_pvt(tf: str = "1h") -> pd.DataFrame:
     """Load and add PVT-specific indicators."""
     suffix = TF_SUFFIX[tf]
     csv = DATA_DIR / f"BCO_USD_{suffix}.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = load_candle_indicators(csv, CACHE_DIR)
     # EMA50, SMA100
     df["EMA50"]  = df["Close"].ewm(span=50, adjust=False).mean()
     df["SMA100"] = df["Close"].rolling(100).mean()
     # PVT
     df = TechnicalIndicators.calculate_pvt(df)
-    df.dropna(subset=["EMA50", "SMA100", "RSI", "PVT", "ATR"], inplace=True)
-    return df
+    return drop_warmup_rows(df, ["EMA50", "SMA100", "RSI", "PVT", "ATR"])
 
 
 # ---------------------------------------------------------------------------
@@ -98,6 +87,45 @@ def run_sma_backtest(df: pd.DataFrame, rr: float, di: float, adx_min: float,
     # ATR 20-bar rolling average for atr_ratio filter
     atr_ma20 = pd.Series(atr_arr).rolling(20).mean().values
 
+    # Entry conditions for every bar at once; the loop below only manages
+    # the open position and looks up these masks
+    adx_ok = adx_arr >= adx_min
+    if adx_rising:
+        adx_ok[1:] &= ~(adx_arr[1:] <= adx_arr[:-1])
+
+    di_plus_pers  = np.zeros(len(df), dtype=bool)
+    di_minus_pers = np.zeros(len(df), dtype=bool)
+    di_plus_pers[di_persist - 1:]  = sliding_window_view(di_plus > di, di_persist).all(axis=1)
+    di_minus_pers[di_persist - 1:] = sliding_window_view(di_minus > di, di_persist).all(axis=1)
+
+    di_plus_rising  = np.ones(len(df), dtype=bool)
+    di_minus_rising = np.ones(len(df), dtype=bool)
+    if di_slope:
+        di_plus_rising[1:]  = di_plus[1:]  > di_plus[:-1]
+        di_minus_rising[1:] = di_minus[1:] > di_minus[:-1]
+
+    # Structural validity: previous two bars' range
+    prev_low  = np.full(len(df), np.nan)
+    prev_high = np.full(len(df), np.nan)
+    prev_low[2:]  = np.minimum(lows[:-2],  lows[1:-1])
+    prev_high[2:] = np.maximum(highs[:-2], highs[1:-1])
+
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_pers & (di_plus > di_minus)
+               & adx_ok & di_plus_rising & ~(closes < prev_low))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_pers & (di_minus > di_plus)
+               & adx_ok & di_minus_rising & ~(closes > prev_high))
+    entry = is_buy | is_sell
+
+    # --- Time filter ---
+    if avoid_hours:
+        entry &= ~np.isin(times.hour, avoid_hours)
+
+    # ATR ratio
+    if atr_ratio > 0:
+        entry &= ~((atr_ma20 > 0) & (atr_arr < atr_ratio * atr_ma20))
+
     balance  = INITIAL_BALANCE
     trades   = []
     in_trade = False
@@ -105,7 +133,6 @@ def run_sma_backtest(df: pd.DataFrame, rr: float, di: float, adx_min: float,
 
     for i in range(max(3, di_persist), len(df)):
         c, h, l = closes[i], highs[i], lows[i]
-        hour = times[i].hour
 
         # --- Exit ---
         if in_trade:
@@ -117,59 +144,19 @@ def run_sma_backtest(df: pd.DataFrame, rr: float, di: float, adx_min: float,
                 elif l <= tp: trades.append(_close(balance, rr, True));  balance = trades[-1]["balance"]; in_trade = False
             continue
 
-        # --- Time filter ---
-        if avoid_hours and hour in avoid_hours:
+        if not entry[i]:
             continue
 
-        # --- Entry filters ---
-        adx_val = adx_arr[i]
-        adx_ok  = adx_val >= adx_min
-
-        # ADX rising
-        if adx_rising and i > 0 and adx_arr[i] <= adx_arr[i - 1]:
-            adx_ok = False
-
-        # ATR ratio
-        if atr_ratio > 0 and not np.isnan(atr_ma20[i]) and atr_ma20[i] > 0:
-            if atr_arr[i] < atr_ratio * atr_ma20[i]:
-                continue
-
-        di_plus_pers  = all(di_plus[i - j]  > di for j in range(di_persist))
-        di_minus_pers = all(di_minus[i - j] > di for j in range(di_persist))
-
-        # DI slope
-        if di_slope and i > 0:
-            di_plus_rising  = di_plus[i]  > di_plus[i - 1]
-            di_minus_rising = di_minus[i] > di_minus[i - 1]
-        else:
-            di_plus_rising = di_minus_rising = True
-
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_pers and di_plus[i] > di_minus[i]
-                   and adx_ok and di_plus_rising)
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_pers and di_minus[i] > di_plus[i]
-                   and adx_ok and di_minus_rising)
-
-        if not (is_buy or is_sell):
-            continue
-
-        # Structural validity
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
         # ATR floor SL
         atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
+        if is_buy[i]:
+            stop_dist = max(c - prev_low[i], atr_val)
             sl_p = c - stop_dist - spread
             risk = c - sl_p
             if risk <= 0: continue
             direction = "BUY";  sl = sl_p;  tp = c + risk * rr
         else:
-            stop_dist = max(prev_high - c, atr_val)
+            stop_dist = max(prev_high[i] - c, atr_val)
             sl_p = c + stop_dist + spread
             risk = sl_p - c
             if risk <= 0: continue
@@ -198,10 +185,19 @@ def run_sma_backtest(df: pd.DataFrame, rr: float, di: float, adx_min: float,
 # PVT Scalping backtest (1H)
 # ---------------------------------------------------------------------------
 
+def daily_sma200(df: pd.DataFrame) -> np.ndarray:
+    """Daily SMA200 aligned to df's bars, forward-filled from the daily closes."""
+    df_daily = df.resample("D").agg({"Close": "last"}).dropna()
+    df_daily["SMA200"] = df_daily["Close"].rolling(200).mean()
+    return df_daily["SMA200"].reindex(df.index, method="ffill").to_numpy()
+
+
 def run_pvt_backtest(df: pd.DataFrame, rr: float, spread: float,
                      pvt_threshold: float = 0.05,
                      pvt_consec: int = 1,
-                     avoid_hours: list = None) -> dict | None:
+                     avoid_hours: list = None,
+                     sma200: np.ndarray = None) -> dict | None:
+    """Backtest one PVT config; `sma200` lets sweeps reuse daily_sma200(df)."""
     closes   = df["Close"].values
     highs    = df["High"].values
     lows     = df["Low"].values
@@ -213,20 +209,41 @@ def run_pvt_backtest(df: pd.DataFrame, rr: float, spread: float,
     times    = df.index
 
     # Daily SMA200 — forward-filled from daily resampled series
-    df_daily = df.resample("D").agg({"Close": "last"}).dropna()
-    df_daily["SMA200"] = df_daily["Close"].rolling(200).mean()
-    sma200_daily = df_daily["SMA200"].reindex(df.index, method="ffill")
+    if sma200 is None:
+        sma200 = daily_sma200(df)
+
+    min_history = max(pvt_consec, 2)
+
+    # Entry conditions for every bar at once; the loop below only manages
+    # the open position and looks up these masks
+    pvt_buy_consec  = np.zeros(len(df), dtype=bool)
+    pvt_sell_consec = np.zeros(len(df), dtype=bool)
+    pvt_buy_consec[pvt_consec - 1:]  = sliding_window_view(pvt_arr >  pvt_threshold, pvt_consec).all(axis=1)
+    pvt_sell_consec[pvt_consec - 1:] = sliding_window_view(pvt_arr < -pvt_threshold, pvt_consec).all(axis=1)
+
+    # --- Full entry conditions (a missing daily SMA200 fails both sides) ---
+    is_buy = ((closes > ema50) & (closes > sma100)
+              & (rsi_arr > 20)
+              & pvt_buy_consec
+              & (closes > sma200))
+
+    is_sell = ((closes < ema50) & (closes < sma100)
+               & (rsi_arr < 80)
+               & pvt_sell_consec
+               & (closes < sma200))
+    entry = is_buy | is_sell
+
+    # --- Time filter ---
+    if avoid_hours:
+        entry &= ~np.isin(times.hour, avoid_hours)
 
     balance  = INITIAL_BALANCE
     trades   = []
     in_trade = False
     sl = tp = direction = None
 
-    min_history = max(pvt_consec, 2)
-
     for i in range(min_history, len(df)):
         c, h, l = closes[i], highs[i], lows[i]
-        hour = times[i].hour
 
         # --- Exit ---
         if in_trade:
@@ -238,31 +255,7 @@ def run_pvt_backtest(df: pd.DataFrame, rr: float, spread: float,
                 elif l <= tp: trades.append(_close(balance, rr, True));  balance = trades[-1]["balance"]; in_trade = False
             continue
 
-        # --- Time filter ---
-        if avoid_hours and hour in avoid_hours:
-            continue
-
-        # --- Daily SMA200 trend ---
-        sma200_val = sma200_daily.iloc[i]
-        if np.isnan(sma200_val):
-            continue
-
-        # --- PVT consecutive ---
-        pvt_buy_consec  = all(pvt_arr[i - j] >  pvt_threshold for j in range(pvt_consec))
-        pvt_sell_consec = all(pvt_arr[i - j] < -pvt_threshold for j in range(pvt_consec))
-
-        # --- Full entry conditions ---
-        is_buy = (c > ema50[i] and c > sma100[i]
-                  and rsi_arr[i] > 20
-                  and pvt_buy_consec
-                  and c > sma200_val)
-
-        is_sell = (c < ema50[i] and c < sma100[i]
-                   and rsi_arr[i] < 80
-                   and pvt_sell_consec
-                   and c < sma200_val)
-
-        if not (is_buy or is_sell):
+        if not entry[i]:
             continue
 
         # ATR-based SL
@@ -270,7 +263,7 @@ def run_pvt_backtest(df: pd.DataFrame, rr: float, spread: float,
         min_sl    = c * 0.002
         sl_dist   = max(atr_val + spread, min_sl)
 
-        if is_buy:
+        if is_buy[i]:
             sl_p = c - sl_dist
             risk = c - sl_p
             if risk <= 0: continue
@@ -335,9 +328,12 @@ def sweep_pvt(df: pd.DataFrame) -> list:
         [0.01, 0.05, 0.10],           # pvt_threshold
         [1, 2, 3],                    # pvt_consec
     ))
+    # The daily trend filter does not depend on the config: align it once
+    sma200 = daily_sma200(df)
     for (rr, pvt_thresh, pvt_consec) in grid:
         r = run_pvt_backtest(df, rr=rr, spread=BCO_SPREAD,
-                             pvt_threshold=pvt_thresh, pvt_consec=pvt_consec)
+                             pvt_threshold=pvt_thresh, pvt_consec=pvt_consec,
+                             sma200=sma200)
         if r:
             results.append({
                 "strategy": "PVTScalping", "tf": "1h", "label": "1H (Feb 2025+)",
@@ -18,10 +18,14 @@ import numpy as np
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import find_exit
+from backend.app.services.indicators import (
+    CSV_ENGINE, TechnicalIndicators, cached_indicator_frame, drop_warmup_rows
+)
 
 # ── Config ────────────────────────────────────────────────────────────────────
 CSV_PATH    = PROJECT_ROOT / "data" / "forex_raw" / "JP225_USD_5_Min.csv"
+CACHE_DIR   = PROJECT_ROOT / "data" / "forex_cache"
 SPREAD      = 10.0          # ~10 pt spread on JP225
 INITIAL_BAL = 10_000.0
 RISK_PCT    = 0.015         # 1.5% per trade (deployed risk)
@@ -39,21 +43,44 @@ DI_SPREAD_MIN = 15.0
 # Sydney morning = 8–11am AEDT = UTC 21,22,23,0
 SYDNEY_MORNING_UTC = {21, 22, 23, 0}
 
+# Candle CSV schema (as written by download_forex.py); declared up front so
+# the reader skips type inference
+CANDLE_DTYPES = {"Open": "float64", "High": "float64", "Low": "float64",
+                 "Close": "float64", "Volume": "int64"}
+SMA_COLUMNS = [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]
+
 
 # ── Data loading ──────────────────────────────────────────────────────────────
-def load_data():
-    df = pd.read_csv(CSV_PATH, parse_dates=["Date"])
+def read_bars():
+    df = pd.read_csv(CSV_PATH, usecols=["Date", *CANDLE_DTYPES], dtype=CANDLE_DTYPES,
+                     parse_dates=["Date"], engine=CSV_ENGINE)
     df["Date"] = pd.to_datetime(df["Date"], utc=True)
     df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    df = TechnicalIndicators.add_all_indicators(df)
-    for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
+    # Downloaded candles are already in time order; only sort when they aren't
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+    return df
+
+
+def build_frame():
+    """Bars with indicators, SMAs and the ATR average, warm-up rows dropped."""
+    df = TechnicalIndicators.add_all_indicators(read_bars())
+    for p, col in SMA_COLUMNS:
         df[col] = df["Close"].rolling(p).mean()
     atr_avg = df["ATR"].rolling(20).mean()
     df["ATR_avg20"] = atr_avg
-    df.dropna(subset=["SMA20", "SMA50", "SMA100",
-                      "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"], inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100",
+                                 "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"])
+
+
+def load_data():
+    """build_frame() memoized under CACHE_DIR until the source CSV changes."""
+    return cached_indicator_frame(
+        CSV_PATH, CACHE_DIR,
+        {"dtypes": CANDLE_DTYPES, "indicators": "add_all_indicators",
+         "sma": SMA_COLUMNS, "atr_avg": 20},
+        build_frame
+    )
 
 
 # ── Backtest engine ───────────────────────────────────────────────────────────
@@ -71,100 +98,80 @@ def run_backtest(df: pd.DataFrame, avoid_hours: set = None, label: str = ""):
     atr_avg  = df["ATR_avg20"].values
     idx      = df.index  # DatetimeIndex (UTC-aware)
 
+    n = len(df)
+
+    # ── Entry mask: every filter evaluated for all bars at once, so the
+    #    trade loop below only visits bars where an entry can fire ──
+    entry = np.zeros(n, dtype=bool)
+    entry[max(3, PERSIST):] = True
+
+    # Time filter
+    if avoid_hours:
+        entry &= ~np.isin(idx.hour, list(avoid_hours))
+
+    # DI persist
+    di_plus_ok  = np.ones(n, dtype=bool)
+    di_minus_ok = np.ones(n, dtype=bool)
+    for j in range(PERSIST):
+        di_plus_ok[j:]  &= di_plus[:n - j]  > DI_THRESHOLD
+        di_minus_ok[j:] &= di_minus[:n - j] > DI_THRESHOLD
+
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_ok & (di_plus > di_minus))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_ok & (di_minus > di_plus))
+    entry &= is_buy | is_sell
+
+    # ADX min / ADX rising (index 0 is never an entry bar, so the wrap is unused)
+    entry &= ~(adx_arr < ADX_MIN)
+    if ADX_RISING:
+        entry &= ~(adx_arr <= np.roll(adx_arr, 1))
+
+    # DI slope (DI+ rising for BUY, DI- rising for SELL)
+    if DI_SLOPE:
+        entry &= ~(is_buy  & (di_plus  <= np.roll(di_plus, 1)))
+        entry &= ~(is_sell & (di_minus <= np.roll(di_minus, 1)))
+
+    # ATR ratio / DI spread
+    entry &= ~(atr_arr < ATR_RATIO_MIN * atr_avg)
+    entry &= ~(np.abs(di_plus - di_minus) < DI_SPREAD_MIN)
+
+    # Entry not below/above 2-candle extremes
+    prev_low  = np.minimum(np.roll(lows, 2),  np.roll(lows, 1))
+    prev_high = np.maximum(np.roll(highs, 2), np.roll(highs, 1))
+    entry &= ~(is_buy  & (closes < prev_low))
+    entry &= ~(is_sell & (closes > prev_high))
+
+    # SL / TP
+    sl_arr = np.where(
+        is_buy,
+        closes - np.maximum(closes - prev_low, atr_arr) - SPREAD,
+        closes + np.maximum(prev_high - closes, atr_arr) + SPREAD,
+    )
+    risk = np.where(is_buy, closes - sl_arr, sl_arr - closes)
+    entry &= ~(risk <= 0)
+
     balance  = INITIAL_BAL
     trades   = []
-    in_trade = False
-    sl = tp = direction = None
-    entry_bar = None
-
-    for i in range(max(3, PERSIST), len(df)):
-        c, h, l = closes[i], highs[i], lows[i]
-
-        if in_trade:
-            if direction == "BUY":
-                if l <= sl:
-                    pnl = -balance * RISK_PCT
-                    trades.append({"result": "LOSS", "pnl": pnl, "balance": balance + pnl,
-                                   "direction": direction, "ts": idx[entry_bar]})
-                    balance += pnl; in_trade = False
-                elif h >= tp:
-                    pnl = balance * RISK_PCT * RR
-                    trades.append({"result": "WIN", "pnl": pnl, "balance": balance + pnl,
-                                   "direction": direction, "ts": idx[entry_bar]})
-                    balance += pnl; in_trade = False
-            else:
-                if h >= sl:
-                    pnl = -balance * RISK_PCT
-                    trades.append({"result": "LOSS", "pnl": pnl, "balance": balance + pnl,
-                                   "direction": direction, "ts": idx[entry_bar]})
-                    balance += pnl; in_trade = False
-                elif l <= tp:
-                    pnl = balance * RISK_PCT * RR
-                    trades.append({"result": "WIN", "pnl": pnl, "balance": balance + pnl,
-                                   "direction": direction, "ts": idx[entry_bar]})
-                    balance += pnl; in_trade = False
-            continue
+    next_bar = 0
 
-        # ── Time filter ──
-        if avoid_hours and idx[i].hour in avoid_hours:
+    for i in np.flatnonzero(entry):
+        if i < next_bar:
             continue
-
-        # ── DI persist ──
-        di_plus_ok  = all(di_plus[i - j]  > DI_THRESHOLD for j in range(PERSIST))
-        di_minus_ok = all(di_minus[i - j] > DI_THRESHOLD for j in range(PERSIST))
-
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_ok and di_plus[i] > di_minus[i])
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_ok and di_minus[i] > di_plus[i])
-
-        if not (is_buy or is_sell):
-            continue
-
-        # ── ADX min ──
-        if adx_arr[i] < ADX_MIN:
-            continue
-
-        # ── ADX rising ──
-        if ADX_RISING and adx_arr[i] <= adx_arr[i - 1]:
-            continue
-
-        # ── DI slope (DI+ rising for BUY, DI- rising for SELL) ──
-        if DI_SLOPE:
-            if is_buy  and di_plus[i]  <= di_plus[i - 1]:  continue
-            if is_sell and di_minus[i] <= di_minus[i - 1]: continue
-
-        # ── ATR ratio ──
-        if atr_arr[i] < ATR_RATIO_MIN * atr_avg[i]:
-            continue
-
-        # ── DI spread ──
-        if abs(di_plus[i] - di_minus[i]) < DI_SPREAD_MIN:
-            continue
-
-        # ── Entry not below/above 2-candle extremes ──
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
-        # ── Build SL / TP ──
-        atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
-            sl_price  = c - stop_dist - SPREAD
-            risk      = c - sl_price
-            if risk <= 0: continue
-            direction = "BUY"; sl = sl_price; tp = c + risk * RR
-        else:
-            stop_dist = max(prev_high - c, atr_val)
-            sl_price  = c + stop_dist + SPREAD
-            risk      = sl_price - c
-            if risk <= 0: continue
-            direction = "SELL"; sl = sl_price; tp = c - risk * RR
-
-        in_trade = True
-        entry_bar = i
+        buy = is_buy[i]
+        sl  = sl_arr[i]
+        tp  = closes[i] + risk[i] * RR if buy else closes[i] - risk[i] * RR
+
+        exit_idx, win = find_exit(highs, lows, i + 1, sl, tp, buy)
+        if exit_idx < 0:
+            break  # still open at the end of the data
+
+        pnl = balance * RISK_PCT * RR if win else -balance * RISK_PCT
+        trades.append({"result": "WIN" if win else "LOSS", "pnl": pnl,
+                       "balance": balance + pnl,
+                       "direction": "BUY" if buy else "SELL", "ts": idx[i]})
+        balance += pnl
+        next_bar = exit_idx + 1
 
     if not trades:
         return None, []
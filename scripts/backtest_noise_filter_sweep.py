@@ -20,16 +20,21 @@ Base configs (best from sweep):
 Output: data/backtest_noise_filter_sweep.csv
 """
 
+import os
 import sys
 import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import compound, find_exit, prefetch
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 DATA_DIR        = Path("data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 OUT_FILE        = Path("data/backtest_noise_filter_sweep.csv")
 INITIAL_BALANCE = 10_000.0
 RISK_PCT        = 0.01
@@ -89,25 +94,26 @@ DI_SLOPE_VALS  = [False, True]
 ADX_RISING_VALS = [False, True]
 
 
-def load_and_prep(symbol: str) -> pd.DataFrame:
+def read_bars(symbol: str) -> pd.DataFrame:
     csv = DATA_DIR / f"{symbol}_15_Min.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    return load_candle_indicators(csv, CACHE_DIR)
+
+
+def prep_bars(df: pd.DataFrame) -> pd.DataFrame:
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
     df["ATR_avg20"] = df["ATR"].rolling(20).mean()
-    df.dropna(subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"],
-              inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"])
 
 
-def run_backtest(df, rr, di, adx_min, spread, di_persist,
+def entry_setups(df, di, adx_min, spread, di_persist,
                  di_slope=False, adx_rising=False,
                  atr_ratio=0.0, avoid_hours=None):
+    """
+    Evaluate the base entry rules and noise filters for every bar at once.
+
+    Returns (entry, is_buy, sl, risk) arrays; TP is entry close +/- risk * rr.
+    """
     closes   = df["Close"].values
     highs    = df["High"].values
     lows     = df["Low"].values
@@ -119,105 +125,112 @@ def run_backtest(df, rr, di, adx_min, spread, di_persist,
     adx_arr  = df["ADX"].values
     atr_arr  = df["ATR"].values
     atr_ma   = df["ATR_avg20"].values
-    times    = df.index
-    ah_set   = set(avoid_hours) if avoid_hours else set()
-
-    balance  = INITIAL_BALANCE
-    trades   = []
-    in_trade = False
-    sl = tp = direction = None
-
-    for i in range(max(3, di_persist), len(df)):
-        c, h, l = closes[i], highs[i], lows[i]
-
-        # --- Exit ---
-        if in_trade:
-            if direction == "BUY":
-                if l <= sl:   trades.append(_close(balance, rr, False)); balance = trades[-1]["balance"]; in_trade = False
-                elif h >= tp: trades.append(_close(balance, rr, True));  balance = trades[-1]["balance"]; in_trade = False
-            else:
-                if h >= sl:   trades.append(_close(balance, rr, False)); balance = trades[-1]["balance"]; in_trade = False
-                elif l <= tp: trades.append(_close(balance, rr, True));  balance = trades[-1]["balance"]; in_trade = False
-            continue
 
-        # --- Time filter ---
-        if ah_set and times[i].hour in ah_set:
-            continue
+    n = len(df)
+    entry = np.zeros(n, dtype=bool)
+    entry[max(3, di_persist):] = True
+
+    # --- Time filter ---
+    if avoid_hours:
+        entry &= ~np.isin(df.index.hour, avoid_hours)
+
+    # previous-bar values (index 0 is never an entry bar)
+    prev_adx      = np.roll(adx_arr, 1)
+    prev_di_plus  = np.roll(di_plus, 1)
+    prev_di_minus = np.roll(di_minus, 1)
+
+    # --- ADX ---
+    entry &= ~(adx_arr < adx_min)
+    if adx_rising:
+        entry &= ~(adx_arr <= prev_adx)
+
+    # --- ATR ratio ---
+    if atr_ratio > 0:
+        with np.errstate(invalid="ignore"):
+            weak_atr = (atr_ma > 0) & (atr_arr < atr_ratio * atr_ma)
+        entry &= ~weak_atr
+
+    # --- DI persist ---
+    di_plus_pers  = np.ones(n, dtype=bool)
+    di_minus_pers = np.ones(n, dtype=bool)
+    for j in range(di_persist):
+        di_plus_pers[j:]  &= di_plus[:n - j]  > di
+        di_minus_pers[j:] &= di_minus[:n - j] > di
+
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_pers & (di_plus > di_minus))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_pers & (di_minus > di_plus))
+
+    # --- DI slope ---
+    if di_slope:
+        is_buy  &= ~(di_plus  <= prev_di_plus)
+        is_sell &= ~(di_minus <= prev_di_minus)
+
+    # --- Structural validity ---
+    prev_low  = np.minimum(np.roll(lows, 2),  np.roll(lows, 1))
+    prev_high = np.maximum(np.roll(highs, 2), np.roll(highs, 1))
+    is_buy  &= ~(closes < prev_low)
+    is_sell &= ~(closes > prev_high)
+
+    # --- ATR floor SL ---
+    sl = np.where(
+        is_buy,
+        closes - np.maximum(closes - prev_low, atr_arr) - spread,
+        closes + np.maximum(prev_high - closes, atr_arr) + spread,
+    )
+    risk = np.where(is_buy, closes - sl, sl - closes)
+
+    entry &= (is_buy | is_sell) & (risk > 0)
+    return entry, is_buy, sl, risk
 
-        # --- ADX ---
-        adx_val = adx_arr[i]
-        if adx_val < adx_min:
-            continue
-        if adx_rising and i > 0 and adx_val <= adx_arr[i - 1]:
-            continue
 
-        # --- ATR ratio ---
-        if atr_ratio > 0 and not np.isnan(atr_ma[i]) and atr_ma[i] > 0:
-            if atr_arr[i] < atr_ratio * atr_ma[i]:
-                continue
+def run_backtest(df, rr, di, adx_min, spread, di_persist,
+                 di_slope=False, adx_rising=False,
+                 atr_ratio=0.0, avoid_hours=None):
+    closes   = df["Close"].values
+    highs    = df["High"].values
+    lows     = df["Low"].values
 
-        # --- DI persist ---
-        di_plus_pers  = all(di_plus[i - j]  > di for j in range(di_persist))
-        di_minus_pers = all(di_minus[i - j] > di for j in range(di_persist))
+    entry, is_buy, sl, risk = entry_setups(
+        df, di, adx_min, spread, di_persist,
+        di_slope=di_slope, adx_rising=adx_rising,
+        atr_ratio=atr_ratio, avoid_hours=avoid_hours,
+    )
 
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_pers and di_plus[i] > di_minus[i])
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_pers and di_minus[i] > di_plus[i])
+    outcomes = []
+    next_bar = 0
 
-        if not (is_buy or is_sell):
+    # Only bars that pass every filter are visited; an open trade's exit is
+    # found with one vectorized scan and the loop resumes after it
+    for i in np.flatnonzero(entry):
+        if i < next_bar:
             continue
+        buy = is_buy[i]
+        tp  = closes[i] + risk[i] * rr if buy else closes[i] - risk[i] * rr
 
-        # --- DI slope ---
-        if di_slope and i > 0:
-            if is_buy  and di_plus[i]  <= di_plus[i - 1]:  continue
-            if is_sell and di_minus[i] <= di_minus[i - 1]: continue
-
-        # --- Structural validity ---
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
-        # --- ATR floor SL ---
-        atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
-            sl_p = c - stop_dist - spread
-            risk = c - sl_p
-            if risk <= 0: continue
-            direction = "BUY";  sl = sl_p;  tp = c + risk * rr
-        else:
-            stop_dist = max(prev_high - c, atr_val)
-            sl_p = c + stop_dist + spread
-            risk = sl_p - c
-            if risk <= 0: continue
-            direction = "SELL"; sl = sl_p;  tp = c - risk * rr
-
-        in_trade = True
-
-    if len(trades) < MIN_TRADES:
+        exit_idx, win = find_exit(highs, lows, i + 1, sl[i], tp, buy)
+        if exit_idx < 0:
+            break
+        outcomes.append(win)
+        next_bar = exit_idx + 1
+
+    if len(outcomes) < MIN_TRADES:
         return None
 
-    df_t   = pd.DataFrame(trades)
-    n      = len(df_t)
-    wins   = (df_t["result"] == "WIN").sum()
+    pnl, equity = compound(np.array(outcomes), rr, RISK_PCT, INITIAL_BALANCE)
+    n      = len(outcomes)
+    wins   = np.count_nonzero(outcomes)
     wr     = wins / n * 100
-    roi    = df_t["pnl"].sum() / INITIAL_BALANCE * 100
-    rets   = df_t["pnl"] / INITIAL_BALANCE
+    roi    = pnl.sum() / INITIAL_BALANCE * 100
+    rets   = pd.Series(pnl / INITIAL_BALANCE)
     sharpe = float(rets.mean() / rets.std() * np.sqrt(252)) if rets.std() > 0 else 0.0
-    equity = df_t["balance"].values
     peak   = np.maximum.accumulate(equity)
     max_dd = float(((equity - peak) / peak * 100).min())
     return {"trades": n, "win_rate": round(wr, 1), "roi": round(roi, 2),
             "sharpe": round(sharpe, 2), "max_dd": round(max_dd, 2)}
 
 
-def _close(balance, rr, win):
-    pnl = balance * RISK_PCT * (rr if win else -1)
-    return {"result": "WIN" if win else "LOSS", "pnl": pnl, "balance": balance + pnl}
-
-
 def label_filters(di_slope, adx_rising, adx_min, atr_ratio, avoid_hours):
     parts = []
     if di_slope:    parts.append("di_slope")
@@ -228,8 +241,31 @@ def label_filters(di_slope, adx_rising, adx_min, atr_ratio, avoid_hours):
     return ", ".join(parts) if parts else "base (no filters)"
 
 
+# Per-worker sweep inputs, set once by _init_sweep_worker
+_sweep_inputs = None
+
+
+def _init_sweep_worker(df, cfg):
+    """Process pool initializer: keep the pair's frame and base config for every combination."""
+    global _sweep_inputs
+    _sweep_inputs = (df, cfg)
+
+
+def _run_filter_combo(combo):
+    di_slope, adx_rising, adx_min, atr_ratio, avoid_hours = combo
+    df, cfg = _sweep_inputs
+    return run_backtest(
+        df,
+        rr=cfg["rr"], di=cfg["di"], adx_min=adx_min,
+        spread=cfg["spread"], di_persist=cfg["persist"],
+        di_slope=di_slope, adx_rising=adx_rising,
+        atr_ratio=atr_ratio, avoid_hours=avoid_hours,
+    )
+
+
 if __name__ == "__main__":
     all_rows = []
+    bars = prefetch(read_bars, PAIRS)
 
     for symbol, cfg in PAIRS.items():
         print(f"\n{'='*80}")
@@ -237,7 +273,7 @@ if __name__ == "__main__":
         print(f"{'='*80}")
 
         try:
-            df = load_and_prep(symbol)
+            df = prep_bars(bars.pop(symbol).result())
         except Exception as e:
             print(f"  Load error: {e}")
             continue
@@ -247,21 +283,27 @@ if __name__ == "__main__":
 
         results = []
 
-        # Sweep: all combinations of single filters + avoid_hours candidates
-        for di_slope, adx_rising, adx_min, atr_ratio, avoid_hours in itertools.product(
+        # Sweep: all combinations of single filters + avoid_hours candidates.
+        # Each combination is an independent CPU-bound backtest: run them
+        # across all cores, handing each worker the pair's frame once.
+        # Workers are spawned rather than forked since prefetch threads may
+        # still be loading the other pairs
+        combos = list(itertools.product(
             DI_SLOPE_VALS,
             ADX_RISING_VALS,
             ADX_MIN_VALS,
             ATR_RATIO_VALS,
             cfg["avoid_candidates"],
-        ):
-            r = run_backtest(
-                df,
-                rr=cfg["rr"], di=cfg["di"], adx_min=adx_min,
-                spread=cfg["spread"], di_persist=cfg["persist"],
-                di_slope=di_slope, adx_rising=adx_rising,
-                atr_ratio=atr_ratio, avoid_hours=avoid_hours,
-            )
+        ))
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_sweep_worker,
+            initargs=(df, cfg),
+        ) as executor:
+            sweep = list(executor.map(_run_filter_combo, combos, chunksize=4))
+
+        for (di_slope, adx_rising, adx_min, atr_ratio, avoid_hours), r in zip(combos, sweep):
             if r is None:
                 continue
             lbl = label_filters(di_slope, adx_rising, adx_min, atr_ratio, avoid_hours)
@@ -12,15 +12,18 @@ Output:
 """
 
 import sys
+from functools import lru_cache
+from itertools import product
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path("/mnt/d/VSProjects/Stock Scanner/asx-screener")))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 DATA_DIR        = Path("/mnt/d/VSProjects/Stock Scanner/asx-screener/data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 INITIAL_BALANCE = 10_000.0
 MIN_TRADES      = 5   # relaxed for the 31-day window
 RISK_PCT_DEFAULT = 0.01
@@ -83,27 +86,26 @@ PROD_CONFIGS = {
     ),
 }
 
+# Closed-trade record layout for run_backtest's preallocated buffer
+TRADE_DTYPE = [("win", "?"), ("pnl", "f8"), ("balance", "f8")]
+
 LIVE_START = pd.Timestamp("2026-03-10")
 LIVE_END   = pd.Timestamp("2026-04-10")
 
 
 # ── Data loading ──────────────────────────────────────────────────────────────
+# Tasks 1-3 all load USD_JPY and NAS100_USD; read and enrich each CSV once.
+# Callers must not modify the returned frame (slice with .copy() instead)
+@lru_cache(maxsize=None)
 def load_and_prep(symbol: str, tf: str) -> pd.DataFrame:
     csv = DATA_DIR / f"{symbol}_{tf}.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = load_candle_indicators(csv, CACHE_DIR)
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
     df["ATR_avg20"] = df["ATR"].rolling(20).mean()
-    df.dropna(
-        subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"],
-        inplace=True,
+    return drop_warmup_rows(
+        df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"],
     )
-    return df
 
 
 # ── Core backtest ─────────────────────────────────────────────────────────────
@@ -135,7 +137,9 @@ def run_backtest(df: pd.DataFrame, cfg: dict, min_trades: int = MIN_TRADES) -> d
     times    = df.index
 
     balance  = INITIAL_BALANCE
-    trades   = []
+    # At most one trade closes per bar
+    trades   = np.empty(len(df), dtype=TRADE_DTYPE)
+    n_trades = 0
     in_trade = False
     sl = tp = direction = None
     start = max(3, persist)
@@ -143,26 +147,18 @@ def run_backtest(df: pd.DataFrame, cfg: dict, min_trades: int = MIN_TRADES) -> d
     for i in range(start, len(df)):
         c, h, l = closes[i], highs[i], lows[i]
 
-        # Exit
+        # Exit (SL checked first when both hit one candle)
         if in_trade:
             if direction == "BUY":
-                if l <= sl:
-                    pnl = balance * risk_pct * -1
-                    trades.append({"result": "LOSS", "pnl": pnl, "balance": balance + pnl, "ts": times[i]})
-                    balance += pnl; in_trade = False
-                elif h >= tp:
-                    pnl = balance * risk_pct * rr
-                    trades.append({"result": "WIN", "pnl": pnl, "balance": balance + pnl, "ts": times[i]})
-                    balance += pnl; in_trade = False
+                hit_sl, hit_tp = l <= sl, h >= tp
             else:
-                if h >= sl:
-                    pnl = balance * risk_pct * -1
-                    trades.append({"result": "LOSS", "pnl": pnl, "balance": balance + pnl, "ts": times[i]})
-                    balance += pnl; in_trade = False
-                elif l <= tp:
-                    pnl = balance * risk_pct * rr
-                    trades.append({"result": "WIN", "pnl": pnl, "balance": balance + pnl, "ts": times[i]})
-                    balance += pnl; in_trade = False
+                hit_sl, hit_tp = h >= sl, l <= tp
+            if hit_sl or hit_tp:
+                pnl = balance * risk_pct * (-1 if hit_sl else rr)
+                balance += pnl
+                trades[n_trades] = (not hit_sl, pnl, balance)
+                n_trades += 1
+                in_trade = False
             continue
 
         # Time filter
@@ -227,12 +223,12 @@ def run_backtest(df: pd.DataFrame, cfg: dict, min_trades: int = MIN_TRADES) -> d
 
         in_trade = True
 
-    if len(trades) < min_trades:
+    if n_trades < min_trades:
         return None
 
-    df_t   = pd.DataFrame(trades)
-    n      = len(df_t)
-    wins   = (df_t["result"] == "WIN").sum()
+    df_t   = pd.DataFrame(trades[:n_trades])
+    n      = n_trades
+    wins   = df_t["win"].sum()
     wr     = wins / n * 100
     roi    = df_t["pnl"].sum() / INITIAL_BALANCE * 100
     rets   = df_t["pnl"] / INITIAL_BALANCE
@@ -250,6 +246,57 @@ def run_backtest(df: pd.DataFrame, cfg: dict, min_trades: int = MIN_TRADES) -> d
     }
 
 
+# ── Retuning sweep ────────────────────────────────────────────────────────────
+SWEEP_METRICS = ("trades", "win_rate", "roi", "sharpe", "max_dd")
+
+
+def sweep_grid(symbol: str, df_win: pd.DataFrame, df_full: pd.DataFrame, base: dict,
+               di_grid, adx_grid, avoid_variants: dict, prod: tuple) -> pd.DataFrame:
+    """
+    Backtest every (di, adx_min, avoid_hours) cell on the live window and the
+    full period. Metrics are filled into preallocated arrays indexed by grid
+    position (NaN where a run had too few trades) and turned into one row per
+    cell, in grid order. `prod` is the (di, adx_min, avoid label) production cell.
+    """
+    di_grid, adx_grid = np.asarray(di_grid), np.asarray(adx_grid)
+    labels = np.array(list(avoid_variants), dtype=object)
+    shape = (len(di_grid), len(adx_grid), len(labels))
+    live = np.full(shape + (len(SWEEP_METRICS),), np.nan)
+    full = np.full_like(live, np.nan)
+
+    for (di_i, di_val), (adx_i, adx_val), (ah_i, ah_label) in product(
+        enumerate(di_grid), enumerate(adx_grid), enumerate(labels)
+    ):
+        cfg_test = dict(base, di=float(di_val), adx_min=float(adx_val),
+                        avoid_hours=avoid_variants[ah_label])
+        r_live = run_backtest(df_win, cfg_test, min_trades=1)
+        r_full = run_backtest(df_full, cfg_test, min_trades=MIN_TRADES)
+        if r_live:
+            live[di_i, adx_i, ah_i] = [r_live[m] for m in SWEEP_METRICS]
+        if r_full:
+            full[di_i, adx_i, ah_i] = [r_full[m] for m in SWEEP_METRICS]
+
+    # Flatten in C order: the same order as the product() loop above
+    di_idx, adx_idx, ah_idx = np.indices(shape).reshape(3, -1)
+    live = live.reshape(-1, len(SWEEP_METRICS))
+    full = full.reshape(-1, len(SWEEP_METRICS))
+    rows = pd.DataFrame({
+        "symbol":      symbol,
+        "di":          di_grid[di_idx],
+        "adx_min":     adx_grid[adx_idx],
+        "avoid_hours": labels[ah_idx],
+        "rr":          base["rr"],
+    })
+    for prefix, res in (("live", live), ("full", full)):
+        for j, name in enumerate(("trades", "wr", "roi", "sharpe", "maxdd")):
+            rows[f"{prefix}_{name}"] = res[:, j]
+    rows["live_trades"] = np.nan_to_num(live[:, 0]).astype(int)
+    rows["full_trades"] = pd.array(full[:, 0], dtype="Int64")
+    rows["is_prod"] = ((rows["di"] == prod[0]) & (rows["adx_min"] == prod[1])
+                       & (rows["avoid_hours"] == prod[2]))
+    return rows
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TASK 1 — Full-dataset backtest, all 8 pairs
 # ─────────────────────────────────────────────────────────────────────────────
@@ -326,7 +373,7 @@ print("\n" + "=" * 80)
 print("TASK 3 — Retuning sweep (live period Mar10–Apr10): USD_JPY + NAS100_USD")
 print("=" * 80)
 
-sweep_rows = []
+sweep_frames = []
 
 # ── USD_JPY sweep ─────────────────────────────────────────────────────────────
 print("\n  [USD_JPY] — sweeping di_threshold, adx_min, avoid_hours")
@@ -347,37 +394,11 @@ avoid_variants_jpy = {
     "NY+eve [13-22]":  {13, 14, 15, 16, 17, 18, 19, 20, 21, 22},
 }
 
-for di_val in [25.0, 30.0, 35.0]:
-    for adx_val in [0.0, 10.0, 15.0, 20.0]:
-        for ah_label, ah_set in avoid_variants_jpy.items():
-            cfg_test = dict(jpy_base, di=di_val, adx_min=adx_val, avoid_hours=ah_set)
-
-            # live window
-            r_live = run_backtest(df_jpy_win, cfg_test, min_trades=1)
-            # full period
-            r_full = run_backtest(df_jpy_full, cfg_test, min_trades=MIN_TRADES)
-
-            row = {
-                "symbol":      "USD_JPY",
-                "di":          di_val,
-                "adx_min":     adx_val,
-                "avoid_hours": ah_label,
-                "rr":          jpy_base["rr"],
-                # live window
-                "live_trades":   r_live["trades"]   if r_live else 0,
-                "live_wr":       r_live["win_rate"]  if r_live else None,
-                "live_roi":      r_live["roi"]       if r_live else None,
-                "live_sharpe":   r_live["sharpe"]    if r_live else None,
-                "live_maxdd":    r_live["max_dd"]    if r_live else None,
-                # full period
-                "full_trades":   r_full["trades"]   if r_full else None,
-                "full_wr":       r_full["win_rate"]  if r_full else None,
-                "full_roi":      r_full["roi"]       if r_full else None,
-                "full_sharpe":   r_full["sharpe"]    if r_full else None,
-                "full_maxdd":    r_full["max_dd"]    if r_full else None,
-                "is_prod":       (di_val == 30.0 and adx_val == 0.0 and ah_label == "prod [15-21]"),
-            }
-            sweep_rows.append(row)
+sweep_frames.append(sweep_grid(
+    "USD_JPY", df_jpy_win, df_jpy_full, jpy_base,
+    di_grid=[25.0, 30.0, 35.0], adx_grid=[0.0, 10.0, 15.0, 20.0],
+    avoid_variants=avoid_variants_jpy, prod=(30.0, 0.0, "prod [15-21]"),
+))
 
 # ── NAS100 sweep ──────────────────────────────────────────────────────────────
 print("\n  [NAS100_USD] — sweeping di_threshold, adx_min, avoid_hours")
@@ -395,35 +416,13 @@ avoid_variants_nas = {
     "extended [6,7,8,20-23]": {6, 7, 8, 20, 21, 22, 23},
 }
 
-for di_val in [25.0, 30.0, 35.0]:
-    for adx_val in [0.0, 15.0, 20.0, 25.0]:
-        for ah_label, ah_set in avoid_variants_nas.items():
-            cfg_test = dict(nas_base, di=di_val, adx_min=adx_val, avoid_hours=ah_set)
-
-            r_live = run_backtest(df_nas_win, cfg_test, min_trades=1)
-            r_full = run_backtest(df_nas_full, cfg_test, min_trades=MIN_TRADES)
-
-            row = {
-                "symbol":      "NAS100_USD",
-                "di":          di_val,
-                "adx_min":     adx_val,
-                "avoid_hours": ah_label,
-                "rr":          nas_base["rr"],
-                "live_trades":   r_live["trades"]   if r_live else 0,
-                "live_wr":       r_live["win_rate"]  if r_live else None,
-                "live_roi":      r_live["roi"]       if r_live else None,
-                "live_sharpe":   r_live["sharpe"]    if r_live else None,
-                "live_maxdd":    r_live["max_dd"]    if r_live else None,
-                "full_trades":   r_full["trades"]   if r_full else None,
-                "full_wr":       r_full["win_rate"]  if r_full else None,
-                "full_roi":      r_full["roi"]       if r_full else None,
-                "full_sharpe":   r_full["sharpe"]    if r_full else None,
-                "full_maxdd":    r_full["max_dd"]    if r_full else None,
-                "is_prod":       (di_val == 30.0 and adx_val == 25.0 and ah_label == "prod [7,8,21-23]"),
-            }
-            sweep_rows.append(row)
-
-df_sweep = pd.DataFrame(sweep_rows)
+sweep_frames.append(sweep_grid(
+    "NAS100_USD", df_nas_win, df_nas_full, nas_base,
+    di_grid=[25.0, 30.0, 35.0], adx_grid=[0.0, 15.0, 20.0, 25.0],
+    avoid_variants=avoid_variants_nas, prod=(30.0, 25.0, "prod [7,8,21-23]"),
+))
+
+df_sweep = pd.concat(sweep_frames, ignore_index=True)
 df_sweep.to_csv(
     "/mnt/d/VSProjects/Stock Scanner/asx-screener/data/backtest_prod_retune_sweep.csv",
     index=False
@@ -27,9 +27,11 @@ import pandas as pd
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import compound, find_exit, prefetch
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 DATA_DIR        = Path("data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 OUT_FILE        = Path("data/backtest_rr_sweep.csv")
 INITIAL_BALANCE = 10_000.0
 MIN_TRADES      = 10
@@ -93,26 +95,29 @@ PAIRS = {
 }
 
 
-def load_and_prep(symbol: str, timeframe: str) -> pd.DataFrame:
+def read_bars(symbol: str, timeframe: str) -> pd.DataFrame:
     tf_str = "15_Min" if timeframe == "15m" else "5_Min"
     csv = DATA_DIR / f"{symbol}_{tf_str}.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    return load_candle_indicators(csv, CACHE_DIR)
+
+
+def prep_bars(df: pd.DataFrame) -> pd.DataFrame:
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
     df["ATR_avg20"] = df["ATR"].rolling(20).mean()
-    df.dropna(
-        subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"],
-        inplace=True,
+    return drop_warmup_rows(
+        df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR", "ATR_avg20"],
     )
-    return df
 
 
-def run_backtest(df, rr, cfg) -> dict | None:
+def entry_setups(df, cfg):
+    """
+    Evaluate the production entry filters for every bar at once.
+
+    None of the filters depend on the open position or on RR, so they are
+    computed as whole-array masks. Returns (entry, is_buy, sl, risk); TP is
+    entry close +/- risk * rr.
+    """
     closes   = df["Close"].values
     highs    = df["High"].values
     lows     = df["Low"].values
@@ -124,111 +129,117 @@ def run_backtest(df, rr, cfg) -> dict | None:
     adx_arr  = df["ADX"].values
     atr_arr  = df["ATR"].values
     atr_ma   = df["ATR_avg20"].values
-    times    = df.index
 
     di         = cfg["di"]
     persist    = cfg["persist"]
-    adx_min    = cfg["adx_min"]
-    adx_rising = cfg["adx_rising"]
     atr_ratio  = cfg["atr_ratio"]
-    di_slope   = cfg["di_slope"]
     di_spread_min = cfg["di_spread_min"]
     spread     = cfg["spread"]
-    risk_pct   = cfg["risk_pct"]
-    ah_set     = set(cfg["avoid_hours"])
-
-    balance  = INITIAL_BALANCE
-    trades   = []
-    in_trade = False
-    sl = tp = direction = None
-
-    for i in range(max(3, persist), len(df)):
-        c, h, l = closes[i], highs[i], lows[i]
-
-        # --- Exit ---
-        if in_trade:
-            if direction == "BUY":
-                if l <= sl:   trades.append(_close(balance, rr, False, risk_pct)); balance = trades[-1]["balance"]; in_trade = False
-                elif h >= tp: trades.append(_close(balance, rr, True,  risk_pct)); balance = trades[-1]["balance"]; in_trade = False
-            else:
-                if h >= sl:   trades.append(_close(balance, rr, False, risk_pct)); balance = trades[-1]["balance"]; in_trade = False
-                elif l <= tp: trades.append(_close(balance, rr, True,  risk_pct)); balance = trades[-1]["balance"]; in_trade = False
-            continue
 
-        # --- Time filter ---
-        if ah_set and times[i].hour in ah_set:
-            continue
+    n = len(df)
+    start = max(3, persist)
+    entry = np.zeros(n, dtype=bool)
+    entry[start:] = True
+
+    # --- Time filter ---
+    if cfg["avoid_hours"]:
+        entry &= ~np.isin(df.index.hour, cfg["avoid_hours"])
+
+    # --- ADX floor ---
+    entry &= ~(adx_arr < cfg["adx_min"])
+
+    # previous-bar values (index 0 is never an entry bar)
+    prev_adx      = np.roll(adx_arr, 1)
+    prev_di_plus  = np.roll(di_plus, 1)
+    prev_di_minus = np.roll(di_minus, 1)
+
+    # --- ADX rising ---
+    if cfg["adx_rising"]:
+        entry &= adx_arr > prev_adx
+
+    # --- ATR ratio ---
+    if atr_ratio > 0:
+        with np.errstate(invalid="ignore"):
+            weak_atr = (atr_ma > 0) & (atr_arr < atr_ratio * atr_ma)
+        entry &= ~weak_atr
+
+    # --- DI persist ---
+    di_plus_pers  = np.ones(n, dtype=bool)
+    di_minus_pers = np.ones(n, dtype=bool)
+    for j in range(persist):
+        di_plus_pers[j:]  &= di_plus[:n - j]  > di
+        di_minus_pers[j:] &= di_minus[:n - j] > di
+
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_pers & (di_plus > di_minus))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_pers & (di_minus > di_plus))
+
+    # --- DI spread min ---
+    if di_spread_min > 0:
+        is_buy  &= ~((di_plus  - di_minus) < di_spread_min)
+        is_sell &= ~((di_minus - di_plus)  < di_spread_min)
+
+    # --- DI slope ---
+    if cfg["di_slope"]:
+        is_buy  &= di_plus  > prev_di_plus
+        is_sell &= di_minus > prev_di_minus
+
+    # --- Structural validity (no entry below 2-candle lows) ---
+    prev_low  = np.minimum(np.roll(lows, 2),  np.roll(lows, 1))
+    prev_high = np.maximum(np.roll(highs, 2), np.roll(highs, 1))
+    is_buy  &= ~(closes < prev_low)
+    is_sell &= ~(closes > prev_high)
+
+    # --- ATR floor SL ---
+    sl = np.where(
+        is_buy,
+        closes - np.maximum(closes - prev_low, atr_arr) - spread,
+        closes + np.maximum(prev_high - closes, atr_arr) + spread,
+    )
+    risk = np.where(is_buy, closes - sl, sl - closes)
 
-        # --- ADX floor ---
-        adx_val = adx_arr[i]
-        if adx_val < adx_min:
-            continue
+    entry &= (is_buy | is_sell) & (risk > 0)
+    return entry, is_buy, sl, risk
 
-        # --- ADX rising ---
-        if adx_rising and i > 0 and adx_val <= adx_arr[i - 1]:
-            continue
 
-        # --- ATR ratio ---
-        if atr_ratio > 0 and not np.isnan(atr_ma[i]) and atr_ma[i] > 0:
-            if atr_arr[i] < atr_ratio * atr_ma[i]:
-                continue
+def run_backtest(df, rr, cfg, setups=None) -> dict | None:
+    """Backtest one RR; `setups` lets callers reuse entry_setups() across RRs."""
+    closes   = df["Close"].values
+    highs    = df["High"].values
+    lows     = df["Low"].values
+    risk_pct = cfg["risk_pct"]
 
-        # --- DI persist ---
-        di_plus_pers  = all(di_plus[i - j]  > di for j in range(persist))
-        di_minus_pers = all(di_minus[i - j] > di for j in range(persist))
+    entry, is_buy, sl, risk = setups if setups is not None else entry_setups(df, cfg)
 
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_pers and di_plus[i] > di_minus[i])
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_pers and di_minus[i] > di_plus[i])
+    outcomes = []
+    next_bar = 0
 
-        if not (is_buy or is_sell):
+    # Only bars that pass every entry filter are visited; while a trade is
+    # open the loop skips ahead to the bar after its exit
+    for i in np.flatnonzero(entry):
+        if i < next_bar:
             continue
+        buy = is_buy[i]
+        tp  = closes[i] + risk[i] * rr if buy else closes[i] - risk[i] * rr
+
+        # --- Exit: jump straight to the first SL/TP bar ---
+        exit_idx, win = find_exit(highs, lows, i + 1, sl[i], tp, buy)
+        if exit_idx < 0:
+            break
+        outcomes.append(win)
+        next_bar = exit_idx + 1
 
-        # --- DI spread min ---
-        if di_spread_min > 0:
-            if is_buy  and (di_plus[i]  - di_minus[i]) < di_spread_min: continue
-            if is_sell and (di_minus[i] - di_plus[i])  < di_spread_min: continue
-
-        # --- DI slope ---
-        if di_slope and i > 0:
-            if is_buy  and di_plus[i]  <= di_plus[i - 1]:  continue
-            if is_sell and di_minus[i] <= di_minus[i - 1]: continue
-
-        # --- Structural validity (no entry below 2-candle lows) ---
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
-        # --- ATR floor SL ---
-        atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
-            sl_p = c - stop_dist - spread
-            risk = c - sl_p
-            if risk <= 0: continue
-            direction = "BUY";  sl = sl_p;  tp = c + risk * rr
-        else:
-            stop_dist = max(prev_high - c, atr_val)
-            sl_p = c + stop_dist + spread
-            risk = sl_p - c
-            if risk <= 0: continue
-            direction = "SELL"; sl = sl_p;  tp = c - risk * rr
-
-        in_trade = True
-
-    if len(trades) < MIN_TRADES:
+    if len(outcomes) < MIN_TRADES:
         return None
 
-    df_t   = pd.DataFrame(trades)
-    n      = len(df_t)
-    wins   = (df_t["result"] == "WIN").sum()
+    pnl, equity = compound(np.array(outcomes), rr, risk_pct, INITIAL_BALANCE)
+    n      = len(outcomes)
+    wins   = np.count_nonzero(outcomes)
     wr     = wins / n * 100
-    roi    = df_t["pnl"].sum() / INITIAL_BALANCE * 100
-    rets   = df_t["pnl"] / INITIAL_BALANCE
+    roi    = pnl.sum() / INITIAL_BALANCE * 100
+    rets   = pd.Series(pnl / INITIAL_BALANCE)
     sharpe = float(rets.mean() / rets.std() * np.sqrt(252)) if rets.std() > 0 else 0.0
-    equity = df_t["balance"].values
     peak   = np.maximum.accumulate(equity)
     max_dd = float(((equity - peak) / peak * 100).min())
     return {
@@ -240,11 +251,6 @@ def run_backtest(df, rr, cfg) -> dict | None:
     }
 
 
-def _close(balance, rr, win, risk_pct):
-    pnl = balance * risk_pct * (rr if win else -1)
-    return {"result": "WIN" if win else "LOSS", "pnl": pnl, "balance": balance + pnl}
-
-
 def rr_range(current_rr: float) -> list[float]:
     """Generate RR values from 1.5 to current_rr in 0.5 steps."""
     vals = []
@@ -258,6 +264,7 @@ def rr_range(current_rr: float) -> list[float]:
 if __name__ == "__main__":
     all_rows = []
     summary  = []
+    bars     = prefetch(lambda symbol: read_bars(symbol, PAIRS[symbol]["timeframe"]), PAIRS)
 
     for symbol, cfg in PAIRS.items():
         print(f"\n{'='*70}")
@@ -266,7 +273,7 @@ if __name__ == "__main__":
         print(f"{'='*70}")
 
         try:
-            df = load_and_prep(symbol, cfg["timeframe"])
+            df = prep_bars(bars.pop(symbol).result())
         except Exception as e:
             print(f"  Load error: {e}")
             continue
@@ -281,8 +288,9 @@ if __name__ == "__main__":
         print(f"  {'RR':>5}  {'n':>4}  {'WR%':>6}  {'ROI%':>8}  {'Sharpe':>7}  {'MaxDD%':>8}  {'ΔSharpe':>8}")
         print("  " + "-" * 62)
 
+        setups = entry_setups(df, cfg)
         for rr in rr_vals:
-            r = run_backtest(df, rr, cfg)
+            r = run_backtest(df, rr, cfg, setups)
             if r is None:
                 print(f"  {rr:>5.1f}  — insufficient trades (<{MIN_TRADES})")
                 continue
@@ -19,9 +19,11 @@ import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import compound, find_exit, prefetch
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 DATA_DIR        = Path("data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 OUT_FILE        = Path("data/backtest_sma_15m_all_pairs.csv")
 INITIAL_BALANCE = 10_000.0
 RISK_PCT        = 0.01
@@ -60,22 +62,25 @@ RR_VALUES     = [2.5, 3.0, 4.0, 5.0, 6.0]
 PERSIST_VALUES = [1, 2]
 
 
-def load_and_prep(symbol: str) -> pd.DataFrame:
+def read_bars(symbol: str) -> pd.DataFrame:
     csv = DATA_DIR / f"{symbol}_15_Min.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    return load_candle_indicators(csv, CACHE_DIR)
+
+
+def prep_bars(df: pd.DataFrame) -> pd.DataFrame:
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
-    df.dropna(subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"],
-              inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"])
+
 
+def entry_setups(df, di, adx_min, spread, di_persist):
+    """
+    Evaluate the entry filters for every bar at once.
 
-def run_backtest(df, rr, di, adx_min, spread, di_persist):
+    None of the filters depend on the open position or on RR, so they are
+    computed as whole-array masks. Returns (entry, is_buy, sl, risk); TP is
+    entry close +/- risk * rr.
+    """
     closes   = df["Close"].values
     highs    = df["High"].values
     lows     = df["Low"].values
@@ -87,82 +92,85 @@ def run_backtest(df, rr, di, adx_min, spread, di_persist):
     adx_arr  = df["ADX"].values
     atr_arr  = df["ATR"].values
 
-    balance  = INITIAL_BALANCE
-    trades   = []
-    in_trade = False
-    sl = tp = direction = None
-
-    for i in range(max(3, di_persist), len(df)):
-        c, h, l = closes[i], highs[i], lows[i]
-
-        # --- Exit ---
-        if in_trade:
-            if direction == "BUY":
-                if l <= sl:   trades.append(_close(balance, rr, False)); balance = trades[-1]["balance"]; in_trade = False
-                elif h >= tp: trades.append(_close(balance, rr, True));  balance = trades[-1]["balance"]; in_trade = False
-            else:
-                if h >= sl:   trades.append(_close(balance, rr, False)); balance = trades[-1]["balance"]; in_trade = False
-                elif l <= tp: trades.append(_close(balance, rr, True));  balance = trades[-1]["balance"]; in_trade = False
-            continue
+    n = len(df)
+    entry = np.zeros(n, dtype=bool)
+    entry[max(3, di_persist):] = True
+
+    # --- Entry: DI persistence + dominance + ADX ---
+    entry &= adx_arr >= adx_min
+    di_plus_pers  = np.ones(n, dtype=bool)
+    di_minus_pers = np.ones(n, dtype=bool)
+    for j in range(di_persist):
+        di_plus_pers[j:]  &= di_plus[:n - j]  > di
+        di_minus_pers[j:] &= di_minus[:n - j] > di
+
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_pers & (di_plus > di_minus))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_pers & (di_minus > di_plus))
+
+    # --- Structural validity (index 0-1 are never entry bars) ---
+    prev_low  = np.minimum(np.roll(lows, 2),  np.roll(lows, 1))
+    prev_high = np.maximum(np.roll(highs, 2), np.roll(highs, 1))
+    is_buy  &= ~(closes < prev_low)
+    is_sell &= ~(closes > prev_high)
+
+    # --- ATR floor for SL ---
+    sl = np.where(
+        is_buy,
+        closes - np.maximum(closes - prev_low, atr_arr) - spread,
+        closes + np.maximum(prev_high - closes, atr_arr) + spread,
+    )
+    risk = np.where(is_buy, closes - sl, sl - closes)
+
+    entry &= (is_buy | is_sell) & (risk > 0)
+    return entry, is_buy, sl, risk
+
+
+def run_backtest(df, rr, di, adx_min, spread, di_persist, setups=None):
+    """Backtest one config; `setups` lets callers reuse entry_setups() across RRs."""
+    closes   = df["Close"].values
+    highs    = df["High"].values
+    lows     = df["Low"].values
 
-        # --- Entry: DI persistence + dominance + ADX ---
-        adx_ok        = adx_arr[i] >= adx_min
-        di_plus_pers  = all(di_plus[i - j]  > di for j in range(di_persist))
-        di_minus_pers = all(di_minus[i - j] > di for j in range(di_persist))
+    if setups is None:
+        setups = entry_setups(df, di, adx_min, spread, di_persist)
+    entry, is_buy, sl, risk = setups
 
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_pers and di_plus[i] > di_minus[i] and adx_ok)
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_pers and di_minus[i] > di_plus[i] and adx_ok)
+    outcomes = []
+    next_bar = 0
 
-        if not (is_buy or is_sell):
+    # Only bars that pass every entry filter are visited; while a trade is
+    # open the loop skips ahead to the bar after its exit
+    for i in np.flatnonzero(entry):
+        if i < next_bar:
             continue
+        buy = is_buy[i]
+        tp  = closes[i] + risk[i] * rr if buy else closes[i] - risk[i] * rr
+
+        # --- Exit: jump straight to the first SL/TP bar ---
+        exit_idx, win = find_exit(highs, lows, i + 1, sl[i], tp, buy)
+        if exit_idx < 0:
+            break
+        outcomes.append(win)
+        next_bar = exit_idx + 1
 
-        # --- Structural validity ---
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
-        # --- ATR floor for SL ---
-        atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
-            sl_p = c - stop_dist - spread
-            risk = c - sl_p
-            if risk <= 0: continue
-            direction = "BUY";  sl = sl_p;  tp = c + risk * rr
-        else:
-            stop_dist = max(prev_high - c, atr_val)
-            sl_p = c + stop_dist + spread
-            risk = sl_p - c
-            if risk <= 0: continue
-            direction = "SELL"; sl = sl_p;  tp = c - risk * rr
-
-        in_trade = True
-
-    if len(trades) < MIN_TRADES:
+    if len(outcomes) < MIN_TRADES:
         return None
 
-    df_t   = pd.DataFrame(trades)
-    n      = len(df_t)
-    wins   = (df_t["result"] == "WIN").sum()
+    pnl, equity = compound(np.array(outcomes), rr, RISK_PCT, INITIAL_BALANCE)
+    n      = len(outcomes)
+    wins   = np.count_nonzero(outcomes)
     wr     = wins / n * 100
-    roi    = df_t["pnl"].sum() / INITIAL_BALANCE * 100
-    rets   = df_t["pnl"] / INITIAL_BALANCE
+    roi    = pnl.sum() / INITIAL_BALANCE * 100
+    rets   = pd.Series(pnl / INITIAL_BALANCE)
     sharpe = float(rets.mean() / rets.std() * np.sqrt(252)) if rets.std() > 0 else 0.0
-    equity = df_t["balance"].values
     peak   = np.maximum.accumulate(equity)
     max_dd = float(((equity - peak) / peak * 100).min())
     return {"trades": n, "wins": int(wins), "win_rate": round(wr, 1),
             "roi": round(roi, 2), "sharpe": round(sharpe, 2), "max_dd": round(max_dd, 2)}
 
 
-def _close(balance, rr, win):
-    pnl = balance * RISK_PCT * (rr if win else -1)
-    return {"result": "WIN" if win else "LOSS", "pnl": pnl, "balance": balance + pnl}
-
-
 if __name__ == "__main__":
     # Collect all pairs with 15m data
     pairs = sorted([f.stem.replace("_15_Min", "")
@@ -173,10 +181,11 @@ if __name__ == "__main__":
     print("=" * 90)
 
     results = []
+    bars = prefetch(read_bars, pairs)
     for symbol in pairs:
         spread = SPREADS.get(symbol, 0.0002)
         try:
-            df = load_and_prep(symbol)
+            df = prep_bars(bars.pop(symbol).result())
         except Exception as e:
             print(f"  {symbol:<16} — load error: {e}")
             continue
@@ -184,8 +193,12 @@ if __name__ == "__main__":
         period = f"{df.index[0].date()} → {df.index[-1].date()}"
         best = None
 
+        # Entry filters do not depend on RR: evaluate them once per (DI, persist)
+        setups = {(di, persist): entry_setups(df, di, 0.0, spread, persist)
+                  for di, persist in itertools.product(DI_THRESHOLDS, PERSIST_VALUES)}
+
         for di, rr, persist in itertools.product(DI_THRESHOLDS, RR_VALUES, PERSIST_VALUES):
-            r = run_backtest(df, rr, di, 0.0, spread, persist)
+            r = run_backtest(df, rr, di, 0.0, spread, persist, setups[(di, persist)])
             if r is None:
                 continue
             if best is None or r["sharpe"] > best["sharpe"]:
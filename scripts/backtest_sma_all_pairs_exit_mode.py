@@ -12,12 +12,14 @@ Output: data/backtest_sma_all_pairs_exit_mode.csv
 import sys
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 DATA_DIR        = Path("data/forex_raw")
+CACHE_DIR       = DATA_DIR.parent / "forex_cache"
 OUT_FILE        = Path("data/backtest_sma_all_pairs_exit_mode.csv")
 INITIAL_BALANCE = 10_000.0
 RISK_PCT        = 0.01
@@ -56,17 +58,10 @@ PAIRS = {
 
 def load_and_prep(symbol: str, tf: str) -> pd.DataFrame:
     csv = DATA_DIR / f"{symbol}_{TF_SUFFIX[tf]}.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = load_candle_indicators(csv, CACHE_DIR)
     for period, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(period).mean()
-    df.dropna(subset=["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"],
-              inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100", "DIPlus", "DIMinus", "ADX", "ATR"])
 
 
 def run_backtest(df: pd.DataFrame, p: dict, exit_mode: str) -> dict | None:
@@ -95,14 +90,25 @@ def run_backtest(df: pd.DataFrame, p: dict, exit_mode: str) -> dict | None:
     atr_ratio    = p["atr_ratio"]
     avoid_hours  = p["avoid_hours"]
 
+    start = max(22, di_persist + 2)
+    if len(df) <= start:
+        return None
+
+    # Trailing-window filters for every bar at once, reduced over zero-copy
+    # stride views (window k covers bars k .. k + size - 1)
+    di_plus_pers_arr  = np.zeros(len(df), dtype=bool)
+    di_minus_pers_arr = np.zeros(len(df), dtype=bool)
+    di_plus_pers_arr[di_persist - 1:]  = sliding_window_view(di_plus > di_thr, di_persist).all(axis=1)
+    di_minus_pers_arr[di_persist - 1:] = sliding_window_view(di_minus > di_thr, di_persist).all(axis=1)
+    atr_avg_arr = np.full(len(df), np.nan)
+    atr_avg_arr[20:] = sliding_window_view(atr_arr, 20)[:-1].mean(axis=1)  # previous 20 bars
+
     balance    = INITIAL_BALANCE
     trades     = []
     in_trade   = False
     sl = tp = direction = entry_price = risk_amount = None
     exit_counts = {"SL": 0, "TP": 0, "SMA": 0}
 
-    start = max(22, di_persist + 2)
-
     for i in range(start, len(df)):
         c, h, l = closes[i], highs[i], lows[i]
 
@@ -142,8 +148,8 @@ def run_backtest(df: pd.DataFrame, p: dict, exit_mode: str) -> dict | None:
             continue
 
         # --- DI persistence ---
-        di_plus_pers  = all(di_plus[i - j]  > di_thr for j in range(di_persist))
-        di_minus_pers = all(di_minus[i - j] > di_thr for j in range(di_persist))
+        di_plus_pers  = di_plus_pers_arr[i]
+        di_minus_pers = di_minus_pers_arr[i]
 
         # --- ADX rising ---
         adx_rising_ok = (adx_arr[i] > adx_arr[i - 1]) if adx_rising else True
@@ -154,7 +160,7 @@ def run_backtest(df: pd.DataFrame, p: dict, exit_mode: str) -> dict | None:
 
         # --- ATR expansion ---
         if atr_ratio > 0.0:
-            atr_avg = atr_arr[i - 20:i].mean()
+            atr_avg = atr_avg_arr[i]
             atr_ok  = (atr_avg > 0) and (atr_arr[i] >= atr_ratio * atr_avg)
         else:
             atr_ok = True
@@ -12,6 +12,9 @@ Spreads (typical Oanda):
 """
 
 import os, sys, time
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -31,7 +34,8 @@ for f in [PROJECT_ROOT / ".env", PROJECT_ROOT / "backend" / ".env"]:
 
 from oandapyV20 import API
 import oandapyV20.endpoints.instruments as instruments
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import compound, find_exit
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 # ── config ────────────────────────────────────────────────────────────────────
 PAIRS = {
@@ -39,6 +43,7 @@ PAIRS = {
     "GBP_JPY": 0.018,   # ~1.8 pip spread
 }
 DATA_DIR      = PROJECT_ROOT / "data" / "forex_raw"
+CACHE_DIR     = DATA_DIR.parent / "forex_cache"
 OUT_FILE      = PROJECT_ROOT / "data" / "backtest_sma_jpy_pairs.csv"
 INITIAL_BAL   = 10_000.0
 RISK_PCT      = 0.01
@@ -46,6 +51,7 @@ RISK_PCT      = 0.01
 DI_THRESHOLDS = [25.0, 30.0, 35.0]
 RR_RATIOS     = [1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0]
 PERSIST_VALS  = [1, 2]
+DOWNLOAD_WORKERS = 4     # (symbol, timeframe) series downloaded side by side
 TF_MAP        = {"5m": "M5", "15m": "M15"}
 TF_SUFFIX     = {"5m": "5_Min", "15m": "15_Min"}
 
@@ -58,6 +64,17 @@ def get_api():
                request_params={"timeout": 30})
 
 
+# One Oanda client per download thread: requests.Session is not thread-safe
+_thread_local = threading.local()
+
+
+def get_thread_api():
+    api = getattr(_thread_local, "api", None)
+    if api is None:
+        api = _thread_local.api = get_api()
+    return api
+
+
 def fetch_candles(api, symbol, granularity, start_time=None, count=5000):
     params = {"granularity": granularity,
               "alignmentTimezone": "America/New_York"}
@@ -72,19 +89,17 @@ def fetch_candles(api, symbol, granularity, start_time=None, count=5000):
 
 
 def parse_candles(candles):
-    rows = []
-    for c in candles:
-        if not c["complete"]:
-            continue
-        rows.append({
-            "Date":   c["time"],
-            "Open":   float(c["mid"]["o"]),
-            "High":   float(c["mid"]["h"]),
-            "Low":    float(c["mid"]["l"]),
-            "Close":  float(c["mid"]["c"]),
-            "Volume": int(c["volume"]),
-        })
-    return rows
+    """Complete candles as a DataFrame, each column filled in one typed pass."""
+    done = [c for c in candles if c["complete"]]
+    n = len(done)
+    return pd.DataFrame({
+        "Date":   [c["time"] for c in done],
+        "Open":   np.fromiter((float(c["mid"]["o"]) for c in done), np.float64, n),
+        "High":   np.fromiter((float(c["mid"]["h"]) for c in done), np.float64, n),
+        "Low":    np.fromiter((float(c["mid"]["l"]) for c in done), np.float64, n),
+        "Close":  np.fromiter((float(c["mid"]["c"]) for c in done), np.float64, n),
+        "Volume": np.fromiter((int(c["volume"]) for c in done), np.int64, n),
+    })
 
 
 def download_tf(api, symbol, tf_label):
@@ -107,27 +122,27 @@ def download_tf(api, symbol, tf_label):
     if start_time is None:
         start_time = datetime.utcnow() - timedelta(days=180)
 
-    all_rows = []
+    pages = []
     cur = start_time
     while True:
         candles = fetch_candles(api, symbol, gran, cur, count=5000)
         if not candles:
             break
-        rows = parse_candles(candles)
-        if not rows:
+        page = parse_candles(candles)
+        if page.empty:
             break
-        all_rows.extend(rows)
-        last_ts = pd.to_datetime(rows[-1]["Date"])
-        if len(rows) < 5000:
+        pages.append(page)
+        last_ts = pd.to_datetime(page["Date"].iat[-1])
+        if len(page) < 5000:
             break
         cur = last_ts
         time.sleep(0.3)
 
-    if not all_rows:
+    if not pages:
         print(f"  [{symbol} {tf_label}] No new candles.")
         return
 
-    new_df = pd.DataFrame(all_rows)
+    new_df = pd.concat(pages, ignore_index=True)
     new_df["Date"] = pd.to_datetime(new_df["Date"])
 
     if existing_df is not None:
@@ -146,28 +161,20 @@ def download_tf(api, symbol, tf_label):
 def load_and_prep(symbol, tf_label):
     suffix = TF_SUFFIX[tf_label]
     csv    = DATA_DIR / f"{symbol}_{suffix}.csv"
-    df = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = load_candle_indicators(csv, CACHE_DIR)
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
-    df.dropna(subset=["SMA20", "SMA50", "SMA100",
-                      "DIPlus", "DIMinus", "ADX", "ATR"], inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20", "SMA50", "SMA100",
+                                 "DIPlus", "DIMinus", "ADX", "ATR"])
 
 
 # ── backtest engine ───────────────────────────────────────────────────────────
 
-def _close(balance, rr, win):
-    pnl = balance * RISK_PCT * (rr if win else -1.0)
-    return {"result": "WIN" if win else "LOSS", "pnl": pnl,
-            "balance": balance + pnl}
-
-
-def run_backtest(df, rr, di, persist, spread):
+def entry_setups(df, di, persist, spread):
+    """
+    Entry filters for every bar at once. They do not depend on RR, so one
+    call serves the whole RR row of the grid. Returns (entry, is_buy, sl, risk).
+    """
     closes   = df["Close"].values
     highs    = df["High"].values
     lows     = df["Low"].values
@@ -178,74 +185,72 @@ def run_backtest(df, rr, di, persist, spread):
     di_minus = df["DIMinus"].values
     atr_arr  = df["ATR"].values
 
-    balance  = INITIAL_BAL
-    trades   = []
-    in_trade = False
-    sl = tp = direction = None
-
-    for i in range(max(3, persist), len(df)):
-        c, h, l = closes[i], highs[i], lows[i]
-
-        if in_trade:
-            if direction == "BUY":
-                if l <= sl:
-                    trades.append(_close(balance, rr, False))
-                    balance = trades[-1]["balance"]; in_trade = False
-                elif h >= tp:
-                    trades.append(_close(balance, rr, True))
-                    balance = trades[-1]["balance"]; in_trade = False
-            else:
-                if h >= sl:
-                    trades.append(_close(balance, rr, False))
-                    balance = trades[-1]["balance"]; in_trade = False
-                elif l <= tp:
-                    trades.append(_close(balance, rr, True))
-                    balance = trades[-1]["balance"]; in_trade = False
-            continue
+    n = len(df)
+    entry = np.zeros(n, dtype=bool)
+    entry[max(3, persist):] = True
 
-        di_plus_pers  = all(di_plus[i - j]  > di for j in range(persist))
-        di_minus_pers = all(di_minus[i - j] > di for j in range(persist))
+    di_plus_pers  = np.ones(n, dtype=bool)
+    di_minus_pers = np.ones(n, dtype=bool)
+    for j in range(persist):
+        di_plus_pers[j:]  &= di_plus[:n - j]  > di
+        di_minus_pers[j:] &= di_minus[:n - j] > di
 
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_pers and di_plus[i] > di_minus[i])
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_pers and di_minus[i] > di_plus[i])
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_pers & (di_plus > di_minus))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_pers & (di_minus > di_plus))
 
-        if not (is_buy or is_sell):
+    # index 0-1 are never entry bars, so the wrapped values are unused
+    prev_low  = np.minimum(np.roll(lows, 2),  np.roll(lows, 1))
+    prev_high = np.maximum(np.roll(highs, 2), np.roll(highs, 1))
+    is_buy  &= ~(closes < prev_low)
+    is_sell &= ~(closes > prev_high)
+
+    sl = np.where(
+        is_buy,
+        closes - np.maximum(closes - prev_low, atr_arr) - spread,
+        closes + np.maximum(prev_high - closes, atr_arr) + spread,
+    )
+    risk = np.where(is_buy, closes - sl, sl - closes)
+
+    entry &= (is_buy | is_sell) & (risk > 0)
+    return entry, is_buy, sl, risk
+
+
+def run_backtest(df, rr, di, persist, spread, setups=None):
+    closes   = df["Close"].values
+    highs    = df["High"].values
+    lows     = df["Low"].values
+
+    if setups is None:
+        setups = entry_setups(df, di, persist, spread)
+    entry, is_buy, sl, risk = setups
+
+    outcomes = []
+    next_bar = 0
+
+    for i in np.flatnonzero(entry):
+        if i < next_bar:
             continue
+        buy = is_buy[i]
+        tp  = closes[i] + risk[i] * rr if buy else closes[i] - risk[i] * rr
 
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
-        atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
-            sl_p  = c - stop_dist - spread
-            risk  = c - sl_p
-            if risk <= 0: continue
-            direction = "BUY";  sl = sl_p;  tp = c + risk * rr
-        else:
-            stop_dist = max(prev_high - c, atr_val)
-            sl_p  = c + stop_dist + spread
-            risk  = sl_p - c
-            if risk <= 0: continue
-            direction = "SELL"; sl = sl_p;  tp = c - risk * rr
-
-        in_trade = True
-
-    if len(trades) < 5:
+        exit_idx, win = find_exit(highs, lows, i + 1, sl[i], tp, buy)
+        if exit_idx < 0:
+            break
+        outcomes.append(win)
+        next_bar = exit_idx + 1
+
+    if len(outcomes) < 5:
         return None
 
-    df_t   = pd.DataFrame(trades)
-    n      = len(df_t)
-    wins   = (df_t["result"] == "WIN").sum()
+    pnl, equity = compound(np.array(outcomes), rr, RISK_PCT, INITIAL_BAL)
+    n      = len(outcomes)
+    wins   = np.count_nonzero(outcomes)
     wr     = wins / n * 100
-    roi    = df_t["pnl"].sum() / INITIAL_BAL * 100
-    rets   = df_t["pnl"] / INITIAL_BAL
+    roi    = pnl.sum() / INITIAL_BAL * 100
+    rets   = pd.Series(pnl / INITIAL_BAL)
     sharpe = float(rets.mean() / rets.std() * np.sqrt(252)) if rets.std() > 0 else 0.0
-    equity = df_t["balance"].values
     peak   = np.maximum.accumulate(equity)
     max_dd = float(((equity - peak) / peak * 100).min())
     return {"trades": n, "wins": int(wins), "win_rate": round(wr, 1),
@@ -253,19 +258,33 @@ def run_backtest(df, rr, di, persist, spread):
             "max_dd": round(max_dd, 2)}
 
 
+# Per-worker grid inputs, set once by _init_grid_worker
+_grid_inputs = None
+
+
+def _init_grid_worker(df, spread, setups):
+    """Process pool initializer: keep the file's bars and entry setups for every cell."""
+    global _grid_inputs
+    _grid_inputs = (df, spread, setups)
+
+
+def _run_grid_cell(cell):
+    di, rr, persist = cell
+    df, spread, setups = _grid_inputs
+    return run_backtest(df, rr, di, persist, spread, setups[(di, persist)])
+
+
 # ── main ──────────────────────────────────────────────────────────────────────
 
 def main():
     print("USD_JPY & GBP_JPY — SmaScalping Backtest")
     print("=" * 80)
 
-    api = get_api()
-
-    # 1. Download
+    # 1. Download — each series writes its own CSV, so they run concurrently
     print("\n[1] Downloading data from Oanda…")
-    for symbol in PAIRS:
-        for tf in ["5m", "15m"]:
-            download_tf(api, symbol, tf)
+    series = [(symbol, tf) for symbol in PAIRS for tf in ["5m", "15m"]]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        list(executor.map(lambda job: download_tf(get_thread_api(), *job), series))
 
     # 2. Sweep
     print("\n[2] Running backtest sweep…")
@@ -289,26 +308,37 @@ def main():
                   f"{'Trades':>6} {'WR%':>6} {'ROI%':>8} {'Sharpe':>7} {'MaxDD%':>8}")
             print("  " + "-" * 57)
 
-            for di in DI_THRESHOLDS:
-                for rr in RR_RATIOS:
-                    for persist in PERSIST_VALS:
-                        r = run_backtest(df, rr, di, persist, spread)
-                        if r is None:
-                            continue
-                        tag = "✅" if r["roi"] > 0 and r["sharpe"] >= 1.0 else (
-                              "⚠️" if r["roi"] > 0 else "❌")
-                        print(f"  DI>{di:<4.0f} RR={rr:<4.1f} p={persist} | "
-                              f"n={r['trades']:>4}  "
-                              f"wr={r['win_rate']:>5.1f}%  "
-                              f"roi={r['roi']:>7.2f}%  "
-                              f"sharpe={r['sharpe']:>5.2f}  "
-                              f"dd={r['max_dd']:>7.2f}%  {tag}")
-                        results.append({
-                            "symbol": symbol, "timeframe": tf,
-                            "di_threshold": di, "rr": rr,
-                            "di_persist": persist, "spread": spread,
-                            "period": period, **r,
-                        })
+            # Indicators and entry filters are computed once per file;
+            # only the RR-dependent exits are rerun across the grid
+            setups = {(di, persist): entry_setups(df, di, persist, spread)
+                      for di in DI_THRESHOLDS for persist in PERSIST_VALS}
+
+            # Grid cells are independent: spread them over all cores
+            grid = list(itertools.product(DI_THRESHOLDS, RR_RATIOS, PERSIST_VALS))
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_grid_worker,
+                initargs=(df, spread, setups),
+            ) as executor:
+                sweep = list(executor.map(_run_grid_cell, grid, chunksize=4))
+
+            for (di, rr, persist), r in zip(grid, sweep):
+                if r is None:
+                    continue
+                tag = "✅" if r["roi"] > 0 and r["sharpe"] >= 1.0 else (
+                      "⚠️" if r["roi"] > 0 else "❌")
+                print(f"  DI>{di:<4.0f} RR={rr:<4.1f} p={persist} | "
+                      f"n={r['trades']:>4}  "
+                      f"wr={r['win_rate']:>5.1f}%  "
+                      f"roi={r['roi']:>7.2f}%  "
+                      f"sharpe={r['sharpe']:>5.2f}  "
+                      f"dd={r['max_dd']:>7.2f}%  {tag}")
+                results.append({
+                    "symbol": symbol, "timeframe": tf,
+                    "di_threshold": di, "rr": rr,
+                    "di_persist": persist, "spread": spread,
+                    "period": period, **r,
+                })
 
     if not results:
         print("\nNo results.")
@@ -24,7 +24,8 @@ from itertools import product
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import find_exit
+from backend.app.services.indicators import drop_warmup_rows, load_candle_indicators
 
 # ── constants ─────────────────────────────────────────────────────────────────
 SYMBOL      = "USD_JPY"
@@ -32,6 +33,7 @@ SPREAD      = 0.009
 INITIAL_BAL = 10_000.0
 RISK_PCT    = 0.01
 DATA_DIR    = PROJECT_ROOT / "data" / "forex_raw"
+CACHE_DIR   = DATA_DIR.parent / "forex_cache"
 OUT_TRADES  = PROJECT_ROOT / "data" / "backtest_usdjpy_trades.csv"
 OUT_SWEEP   = PROJECT_ROOT / "data" / "backtest_usdjpy_15m_vs_5m.csv"
 
@@ -75,27 +77,21 @@ AVOID_OPTS     = [
 
 def load_and_prep(tf_label):
     csv = DATA_DIR / f"{SYMBOL}_{TF_SUFFIX[tf_label]}.csv"
-    df  = pd.read_csv(csv, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df.sort_index(inplace=True)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
-    df = TechnicalIndicators.add_all_indicators(df)
+    df  = load_candle_indicators(csv, CACHE_DIR)
     for p, col in [(20, "SMA20"), (50, "SMA50"), (100, "SMA100")]:
         df[col] = df["Close"].rolling(p).mean()
-    df.dropna(subset=["SMA20","SMA50","SMA100","DIPlus","DIMinus","ADX","ATR"],
-              inplace=True)
-    return df
+    return drop_warmup_rows(df, ["SMA20","SMA50","SMA100","DIPlus","DIMinus","ADX","ATR"])
 
 
 # ── backtest engine ───────────────────────────────────────────────────────────
 
-def run_backtest(df, rr, di_threshold, di_persist,
-                 adx_min=0.0, di_spread_min=0.0, avoid_hours=None,
-                 record_trades=False):
-    if avoid_hours is None:
-        avoid_hours = []
-
+def entry_setups(df, di_threshold, di_persist,
+                 adx_min=0.0, di_spread_min=0.0, avoid_hours=None):
+    """
+    Per-bar entry filters evaluated over the whole frame. None of them
+    depend on RR, so one result serves every RR of a sweep row.
+    Returns (entries, is_buy, sl, risk); entries are ascending bar positions.
+    """
     closes   = df["Close"].values
     highs    = df["High"].values
     lows     = df["Low"].values
@@ -106,91 +102,90 @@ def run_backtest(df, rr, di_threshold, di_persist,
     di_minus = df["DIMinus"].values
     adx_arr  = df["ADX"].values
     atr_arr  = df["ATR"].values
-    idx      = df.index
-    hours    = idx.hour
-
-    balance  = INITIAL_BAL
-    trades   = []
-    in_trade = False
-    sl = tp = direction = entry_time = entry_price = None
-
-    for i in range(max(3, di_persist), len(df)):
-        c, h, l = closes[i], highs[i], lows[i]
-
-        if in_trade:
-            if direction == "BUY":
-                if l <= sl:
-                    win = False
-                elif h >= tp:
-                    win = True
-                else:
-                    continue
-            else:
-                if h >= sl:
-                    win = False
-                elif l <= tp:
-                    win = True
-                else:
-                    continue
-
-            pnl     = balance * RISK_PCT * (rr if win else -1.0)
-            balance += pnl
-            trade_rec = {
-                "entry_time":  entry_time,
-                "exit_time":   idx[i],
-                "direction":   direction,
-                "entry_price": round(entry_price, 5),
-                "sl":          round(sl, 5),
-                "tp":          round(tp, 5),
-                "result":      "WIN" if win else "LOSS",
-                "pnl":         round(pnl, 2),
-                "balance":     round(balance, 2),
-            }
-            trades.append(trade_rec)
-            in_trade = False
-            continue
 
-        if avoid_hours and hours[i] in avoid_hours:
-            continue
-        if adx_min > 0 and adx_arr[i] < adx_min:
-            continue
+    n = len(df)
+    entry = np.zeros(n, dtype=bool)
+    entry[max(3, di_persist):] = True
+    if avoid_hours:
+        entry &= ~np.isin(df.index.hour, avoid_hours)
+    if adx_min > 0:
+        entry &= ~(adx_arr < adx_min)
+
+    di_plus_pers  = np.ones(n, dtype=bool)
+    di_minus_pers = np.ones(n, dtype=bool)
+    for j in range(di_persist):
+        di_plus_pers[j:]  &= di_plus[:n - j]  > di_threshold
+        di_minus_pers[j:] &= di_minus[:n - j] > di_threshold
+
+    is_buy  = ((closes > sma20) & (closes > sma50) & (closes > sma100)
+               & di_plus_pers & (di_plus > di_minus))
+    is_sell = ((closes < sma20) & (closes < sma50) & (closes < sma100)
+               & di_minus_pers & (di_minus > di_plus))
+    entry &= is_buy | is_sell
+
+    if di_spread_min > 0:
+        entry &= ~(np.abs(di_plus - di_minus) < di_spread_min)
+
+    # index 0-1 are never entry bars, so the wrapped values are unused
+    prev_low  = np.minimum(np.roll(lows, 2),  np.roll(lows, 1))
+    prev_high = np.maximum(np.roll(highs, 2), np.roll(highs, 1))
+    entry &= ~(is_buy & (closes < prev_low))
+    entry &= ~(~is_buy & (closes > prev_high))
+
+    sl = np.where(
+        is_buy,
+        closes - np.maximum(closes - prev_low, atr_arr) - SPREAD,
+        closes + np.maximum(prev_high - closes, atr_arr) + SPREAD,
+    )
+    risk = np.where(is_buy, closes - sl, sl - closes)
+    entry &= risk > 0
+    return np.flatnonzero(entry), is_buy, sl, risk
 
-        di_plus_pers  = all(di_plus[i - j]  > di_threshold for j in range(di_persist))
-        di_minus_pers = all(di_minus[i - j] > di_threshold for j in range(di_persist))
 
-        is_buy  = (c > sma20[i] and c > sma50[i] and c > sma100[i]
-                   and di_plus_pers and di_plus[i] > di_minus[i])
-        is_sell = (c < sma20[i] and c < sma50[i] and c < sma100[i]
-                   and di_minus_pers and di_minus[i] > di_plus[i])
+def run_backtest(df, rr, di_threshold, di_persist,
+                 adx_min=0.0, di_spread_min=0.0, avoid_hours=None,
+                 record_trades=False, setups=None):
+    if setups is None:
+        setups = entry_setups(df, di_threshold, di_persist,
+                              adx_min, di_spread_min, avoid_hours)
+    entries, is_buy, sl_arr, risk_arr = setups
 
-        if not (is_buy or is_sell):
-            continue
+    closes   = df["Close"].values
+    highs    = df["High"].values
+    lows     = df["Low"].values
+    idx      = df.index
 
-        if di_spread_min > 0 and abs(di_plus[i] - di_minus[i]) < di_spread_min:
-            continue
+    balance  = INITIAL_BAL
+    trades   = []
 
-        prev_low  = min(lows[i - 2],  lows[i - 1])
-        prev_high = max(highs[i - 2], highs[i - 1])
-        if is_buy  and c < prev_low:  continue
-        if is_sell and c > prev_high: continue
-
-        atr_val = atr_arr[i]
-        if is_buy:
-            stop_dist = max(c - prev_low, atr_val)
-            sl_p      = c - stop_dist - SPREAD
-            risk      = c - sl_p
-            if risk <= 0: continue
-            direction, sl, tp = "BUY",  sl_p, c + risk * rr
-        else:
-            stop_dist = max(prev_high - c, atr_val)
-            sl_p      = c + stop_dist + SPREAD
-            risk      = sl_p - c
-            if risk <= 0: continue
-            direction, sl, tp = "SELL", sl_p, c - risk * rr
-
-        entry_time  = idx[i]
-        entry_price = c
-        in_trade    = True
+    k = 0
+    while k < len(entries):
+        i   = entries[k]
+        c   = closes[i]
+        buy = is_buy[i]
+        sl  = sl_arr[i]
+        tp  = c + risk_arr[i] * rr if buy else c - risk_arr[i] * rr
+
+        exit_idx, win = find_exit(highs, lows, i + 1, sl, tp, buy)
+        if exit_idx < 0:
+            break
+
+        pnl     = balance * RISK_PCT * (rr if win else -1.0)
+        balance += pnl
+        trade_rec = {
+            "entry_time":  idx[i],
+            "exit_time":   idx[exit_idx],
+            "direction":   "BUY" if buy else "SELL",
+            "entry_price": round(c, 5),
+            "sl":          round(sl, 5),
+            "tp":          round(tp, 5),
+            "result":      "WIN" if win else "LOSS",
+            "pnl":         round(pnl, 2),
+            "balance":     round(balance, 2),
+        }
+        trades.append(trade_rec)
+        # Next candidate entry after the exit bar, found by binary search
+        k = int(np.searchsorted(entries, exit_idx + 1))
 
     if len(trades) < 5:
         return None, []
@@ -259,14 +254,23 @@ def main():
     print("\n[2] 15m sweep…")
     total_combos = (len(DI_THRESHOLDS) * len(RR_RATIOS) *
                     len(ADX_MIN_VALS) * len(DI_SPREAD_VALS) * len(AVOID_OPTS))
+    # Entry filters do not depend on RR: evaluate each filter combo once
+    setups = {
+        (di, adx_min, di_spread_min, a): entry_setups(
+            df15, di, 1, adx_min, di_spread_min, AVOID_OPTS[a])
+        for di, adx_min, di_spread_min, a in product(
+            DI_THRESHOLDS, ADX_MIN_VALS, DI_SPREAD_VALS, range(len(AVOID_OPTS)))
+    }
     done = 0
-    for di, rr, adx_min, di_spread_min, avoid_hours in product(
-            DI_THRESHOLDS, RR_RATIOS, ADX_MIN_VALS, DI_SPREAD_VALS, AVOID_OPTS):
+    for di, rr, adx_min, di_spread_min, a in product(
+            DI_THRESHOLDS, RR_RATIOS, ADX_MIN_VALS, DI_SPREAD_VALS, range(len(AVOID_OPTS))):
         done += 1
+        avoid_hours = AVOID_OPTS[a]
         stats, _ = run_backtest(
             df15, rr=rr, di_threshold=di, di_persist=1,
             adx_min=adx_min, di_spread_min=di_spread_min,
             avoid_hours=avoid_hours, record_trades=False,
+            setups=setups[(di, adx_min, di_spread_min, a)],
         )
         if stats is None:
             continue
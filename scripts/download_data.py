@@ -28,6 +28,12 @@ REQUEST_DELAY = 0.4      # Seconds between requests
 MAX_RETRIES = 3          # Retry attempts for failed downloads
 MIN_DATA_ROWS = 200      # Minimum rows required (~1 year)
 
+# CSV schema: only these columns are read back, with explicit price dtypes so
+# pandas skips per-column inference. Prices stay float64 because the merged
+# frame is written back to disk.
+CSV_COLUMNS = {'Date', 'Open', 'High', 'Low', 'Close', 'Volume'}
+CSV_DTYPES = {'Open': 'float64', 'High': 'float64', 'Low': 'float64', 'Close': 'float64'}
+
 # Ensure directories exist
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -104,17 +110,20 @@ def download_stock_data(ticker: str, period: str = '2y', interval: str = '1d', f
 
     if output_file.exists() and not force:
         try:
-            existing_df = pd.read_csv(output_file)
+            existing_df = pd.read_csv(output_file, usecols=lambda c: c in CSV_COLUMNS, dtype=CSV_DTYPES)
             if not existing_df.empty:
                 # Ensure Date is datetime and index
                 if 'Date' in existing_df.columns:
-                    existing_df['Date'] = pd.to_datetime(existing_df['Date'], utc=True).dt.tz_convert(None)
+                    existing_df['Date'] = pd.to_datetime(existing_df['Date'], utc=True, format='ISO8601').dt.tz_convert(None)
                     existing_df.set_index('Date', inplace=True)
                 elif isinstance(existing_df.index, pd.DatetimeIndex):
                     pass # Already fine
                 else:
                     # Try to convert index if it's not named Date
                     existing_df.index = pd.to_datetime(existing_df.index)
+
+                # Dedupe once on load so scalar .at lookups below never hit duplicate labels
+                existing_df = existing_df[~existing_df.index.duplicated(keep='last')]
                 
                 last_date = existing_df.index.max()
                 
@@ -199,6 +208,7 @@ def download_stock_data(ticker: str, period: str = '2y', interval: str = '1d', f
             # Match types for index comparison
             if not isinstance(df.index, pd.DatetimeIndex):
                 df.index = pd.to_datetime(df.index)
+            df = df[~df.index.duplicated(keep='last')]
             
             # Check for split/gap at the junction or overlap
             overlap_dates = existing_df.index.intersection(df.index)
@@ -210,12 +220,8 @@ def download_stock_data(ticker: str, period: str = '2y', interval: str = '1d', f
             if not overlap_dates.empty:
                 # Check the most recent overlapping date
                 last_overlap_date = overlap_dates.max()
-                old_val = existing_df.loc[last_overlap_date, 'Close']
-                new_val = df.loc[last_overlap_date, 'Close']
-                
-                # Handle potential Series if multiple rows for same date
-                old_price = old_val.iloc[-1] if isinstance(old_val, pd.Series) else old_val
-                new_price = new_val.iloc[-1] if isinstance(new_val, pd.Series) else new_val
+                old_price = existing_df.at[last_overlap_date, 'Close']
+                new_price = df.at[last_overlap_date, 'Close']
                 
                 if old_price > 0:
                     change = abs(new_price - old_price) / old_price
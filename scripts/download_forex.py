@@ -1,15 +1,31 @@
 import os
+import csv
+import numpy as np
 import pandas as pd
 import json
+import random
 import time
 import sys
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from functools import wraps
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from oandapyV20 import API
+from oandapyV20.oandapyV20 import TRADING_ENVIRONMENTS
+from oandapyV20.exceptions import V20Error
 import oandapyV20.endpoints.instruments as instruments
 
+# orjson decodes the large candle payloads several times faster; optional
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Load environment variables
 PROJECT_ROOT = Path(__file__).parent.parent
 # Try root first, then backend/
@@ -26,7 +42,39 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 # OANDA Limits
 MAX_CANDLES = 5000
 
-def retry_request(retries=3, delay=5):
+# OANDA granularity -> CSV file suffix
+GRANULARITY_SUFFIX = {"M15": "15_Min", "H1": "1_Hour", "H4": "4_Hour", "M3": "3_Min", "M5": "5_Min"}
+
+# Use a longer timeout for the downloader
+REQUEST_PARAMS = {"timeout": 30}
+
+# Pairs are independent files and the work is network-bound, so they are
+# fetched concurrently. Kept well under OANDA's per-second request limit.
+MAX_WORKERS = 8
+
+# On-disk schema of the forex_raw CSVs, applied at read time so the existing
+# file is parsed in a single typed pass
+CANDLE_DTYPES = {"Open": "float64", "High": "float64", "Low": "float64", "Close": "float64", "Volume": "int64"}
+CSV_COLUMNS = ["Date", *CANDLE_DTYPES]
+
+# Files are capped at MAX_ROWS. Appends may overshoot by TRIM_SLACK rows before
+# the file is rewritten, so the full rewrite happens once per TRIM_SLACK candles
+# instead of on every run.
+MAX_ROWS = 20000
+TRIM_SLACK = 1000
+
+def backoff_delay(attempt, err, base_delay, max_delay):
+    """Exponential backoff with jitter, stretched to any Retry-After the server sent."""
+    delay = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, 0.5)
+    retry_after = getattr(err, "retry_after", None)
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
+
+def retry_request(retries=3, base_delay=1.0, max_delay=30.0):
     """Decorator to retry OANDA API calls on network-related errors."""
     def decorator(func):
         @wraps(func)
@@ -38,9 +86,16 @@ def retry_request(retries=3, delay=5):
                 except Exception as e:
                     last_err = e
                     err_msg = str(e).lower()
+                    delay = backoff_delay(i, e, base_delay, max_delay)
+                    if getattr(e, "code", None) == 429:
+                        # Rate limited: hold every worker back, not just this one
+                        print(f"  [Retry] Attempt {i+1} rate limited. Pausing requests for {delay:.1f}s...")
+                        rate_limiter.pause(delay)
                     # Retry on connection, DNS (name resolution), or SSL errors
-                    if any(x in err_msg for x in ["connection", "name resolution", "ssl", "timeout", "remote end"]):
-                        print(f"  [Retry] Attempt {i+1} failed: {e}. Retrying in {delay}s...")
+                    elif any(x in err_msg for x in ["connection", "name resolution", "ssl", "timeout", "remote end"]):
+                        if i == retries - 1:
+                            break
+                        print(f"  [Retry] Attempt {i+1} failed: {e}. Retrying in {delay:.1f}s...")
                         time.sleep(delay)
                     else:
                         # For auth or logic errors, don't retry
@@ -56,18 +111,70 @@ def get_oanda_api():
     if not token:
         print("Error: OANDA_ACCESS_TOKEN not found.")
         return None
-    # Use a longer timeout for the downloader
-    return API(access_token=token, environment=env, request_params={"timeout": 30})
+    api = API(access_token=token, environment=env, request_params=REQUEST_PARAMS)
+    # Keep the TLS connection to OANDA open across calls. Each worker owns its
+    # client and has one request in flight, so one pooled connection is enough;
+    # retries are left to retry_request.
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+    api.client.mount("https://", adapter)
+    api.client.mount("http://", adapter)
+    api.client.headers["Connection"] = "keep-alive"
+    return api
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all download workers."""
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` are available, then take them."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+                    self.updated = now
+                    if self.tokens >= tokens:
+                        self.tokens -= tokens
+                        return
+                    wait = (tokens - self.tokens) / self.refill_rate
+                else:
+                    wait = self.paused_until - now
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Stop handing out tokens for `seconds` (e.g. after a 429)."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+            self.updated = self.paused_until
+
+
+# OANDA allows 30 requests/second per client IP
+rate_limiter = TokenBucket(capacity=30, refill_rate=30)
+
+# One OANDA client per worker thread: requests.Session is not thread-safe
+_thread_local = threading.local()
+
+def get_thread_api():
+    api = getattr(_thread_local, "api", None)
+    if api is None:
+        api = get_oanda_api()
+        _thread_local.api = api
+    return api
 
 def load_pairs():
     with open(CONFIG_PATH, 'r') as f:
         return json.load(f)['pairs']
 
-@retry_request(retries=4, delay=5)
-def fetch_candles(api, instrument, granularity, start_time=None, count=5000):
-    """
-    Fetch candles from OANDA.
-    """
+def candle_params(granularity, start_time=None, count=5000):
+    """Query parameters of an InstrumentsCandles request."""
     params = {
         "granularity": granularity,
         "alignmentTimezone": "America/New_York" # Standardize
@@ -77,57 +184,166 @@ def fetch_candles(api, instrument, granularity, start_time=None, count=5000):
         from_str = start_time.strftime("%Y-%m-%dT%H:%M:%S.000000000Z")
         params["from"] = from_str
         params["count"] = count 
+        # The candle at `from` is the last one already on disk. v20 expects
+        # a lowercase boolean; requests would send a Python bool as "False".
+        params["includeFirst"] = "false"
     else:
         params["count"] = count
+    return params
+
+@retry_request(retries=4)
+def fetch_candles(api, instrument, granularity, start_time=None, count=5000):
+    """
+    Fetch candles from OANDA.
+    """
+    params = candle_params(granularity, start_time, count)
 
     r = instruments.InstrumentsCandles(instrument=instrument, params=params)
-    api.request(r)
-    return r.response.get('candles', [])
+    rate_limiter.acquire()
+    # Same GET as api.request(r), but the body goes through json_loads
+    url = f"{TRADING_ENVIRONMENTS[api.environment]['api']}/{r}"
+    response = api.client.get(url, params=params, **REQUEST_PARAMS)
+    if response.status_code >= 400:
+        err = V20Error(response.status_code, response.content.decode('utf-8'))
+        err.retry_after = response.headers.get("Retry-After")
+        raise err
+    return json_loads(response.content).get('candles', [])
 
 def parse_candles(candles):
-    records = []
+    """
+    Complete candles as a DataFrame in the on-disk schema (Date is naive UTC).
+
+    Each column is converted in one np.fromiter pass over the payload, so
+    pandas takes typed arrays as-is instead of inferring dtypes from a list
+    of dicts.
+    """
+    done = [c for c in candles if c['complete']]
+    n = len(done)
+    mids = list(map(itemgetter('mid'), done))
+    columns = {"Date": np.array([c['time'].rstrip('Z') for c in done], dtype="datetime64[ns]")}
+    for name, key in (("Open", "o"), ("High", "h"), ("Low", "l"), ("Close", "c")):
+        columns[name] = np.fromiter(map(itemgetter(key), mids), np.float64, n)
+    columns["Volume"] = np.fromiter(map(itemgetter('volume'), done), np.int64, n)
+    return pd.DataFrame(columns)
+
+def read_csv_state(filename):
+    """
+    Return (header columns, last Date, data row count) of a candle CSV.
+
+    Only the raw bytes are scanned, so the history is never parsed.
+    """
+    content = filename.read_bytes().rstrip(b"\n")
+    header, _, _ = content.partition(b"\n")
+    last_line = content.rsplit(b"\n", 1)[-1]
+    n_rows = content.count(b"\n")
+    if n_rows == 0:
+        raise ValueError("file has no data rows")
+    columns = header.decode().strip().split(",")
+    last_date = pd.Timestamp(last_line.decode().split(",")[columns.index("Date")])
+    return columns, last_date, n_rows
+
+
+def new_csv_rows(candles, columns, after=None):
+    """
+    Complete candles newer than `after` (all of them if None) as CSV rows in
+    `columns` order.
+
+    Timestamps are compared as "YYYY-MM-DD HH:MM:SS" strings, which sort like
+    the times themselves. Returns None if the candles are out of order, so the
+    caller can fall back to a full merge.
+    """
+    last_key = after.strftime("%Y-%m-%d %H:%M:%S") if after is not None else ""
+    rows = []
     for c in candles:
         if not c['complete']: continue
-        records.append({
-            "Date": c['time'],
-            "Open": float(c['mid']['o']),
-            "High": float(c['mid']['h']),
-            "Low": float(c['mid']['l']),
-            "Close": float(c['mid']['c']),
-            "Volume": int(c['volume'])
-        })
-    return records
-
-def update_dataset(api, symbol, oanda_symbol, granularity, label):
+        key = c['time'][:19].replace('T', ' ')
+        if key <= last_key:
+            if rows:
+                return None
+            continue
+        mid = c['mid']
+        values = {"Date": key, "Open": mid['o'], "High": mid['h'], "Low": mid['l'], "Close": mid['c'], "Volume": c['volume']}
+        rows.append([values[col] for col in columns])
+        last_key = key
+    return rows
+
+
+def dataset_path(symbol, granularity):
+    """CSV path for a symbol/timeframe, e.g. data/forex_raw/EUR_USD_15_Min.csv"""
+    return DATA_DIR / f"{symbol}_{GRANULARITY_SUFFIX.get(granularity, granularity)}.csv"
+
+
+def resample_candles(candles, minutes):
     """
-    Update the CSV dataset for a specific timeframe.
-    file_name: e.g. "EUR_USD_15_Min.csv"
+    Aggregate M5 candles into `minutes`-long candles shaped like OANDA's.
+
+    A bucket is only marked complete once the M5 data has reached its end,
+    so a partially formed candle is never written.
+
+    Timestamps and prices are converted column-wise and the buckets are
+    reduced with numpy, so there is no datetime arithmetic per candle.
     """
-    # Map granularity to file suffix
-    if granularity == "M15":
-        suffix = "15_Min"
-    elif granularity == "H1":
-        suffix = "1_Hour"
-    elif granularity == "H4":
-        suffix = "4_Hour"
-    elif granularity == "M3":
-        suffix = "3_Min"
-    elif granularity == "M5":
-        suffix = "5_Min"
-    else:
-        suffix = granularity
+    if not candles:
+        return []
+    n = len(candles)
+    starts = np.array([c['time'][:19] for c in candles], dtype="datetime64[s]").astype(np.int64)
+    complete = np.fromiter(map(itemgetter('complete'), candles), bool, n)
+    data_end = np.where(complete, starts + 300, starts).max()
+    if not complete.any():
+        return []
+
+    done = [c for c in candles if c['complete']]
+    m = len(done)
+    mids = list(map(itemgetter('mid'), done))
+    o, h, l, cl = (np.fromiter((float(mid[k]) for mid in mids), np.float64, m) for k in "ohlc")
+    volume = np.fromiter((int(c['volume']) for c in done), np.int64, m)
+
+    # Bucket start: the candle time less its minute-of-day modulo `minutes`
+    ts = starts[complete]
+    bucket = ts - ((ts % 86400) // 60 % minutes) * 60
+
+    # Stable sort keeps each bucket's candles in arrival order, so the first
+    # and last of a group are its open and close
+    order = np.argsort(bucket, kind="stable")
+    bucket = bucket[order]
+    first = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    last = np.r_[first[1:], m] - 1
+    keys = bucket[first]
+
+    opens = o[order][first].tolist()
+    highs = np.maximum.reduceat(h[order], first).tolist()
+    lows = np.minimum.reduceat(l[order], first).tolist()
+    closes = cl[order][last].tolist()
+    volumes = np.add.reduceat(volume[order], first).tolist()
+    is_complete = (keys + minutes * 60 <= data_end).tolist()
+    times = np.datetime_as_string(keys.astype("datetime64[s]"), unit="s").tolist()
+
+    return [
+        {
+            "complete": is_complete[k],
+            "time": f"{times[k]}.000000000Z",
+            "mid": {"o": opens[k], "h": highs[k], "l": lows[k], "c": closes[k]},
+            "volume": volumes[k],
+        }
+        for k in range(len(keys))
+    ]
+
 
-    filename = DATA_DIR / f"{symbol}_{suffix}.csv"
+def update_dataset(api, filename, oanda_symbol, granularity, label, candles=None):
+    """
+    Update the CSV dataset for a specific timeframe.
+    filename: path from dataset_path(), e.g. ".../EUR_USD_15_Min.csv"
+    candles: already fetched (or derived) candles; fetched from OANDA if None.
+    """
     
     # 1. Determine start time
     start_time = None
-    existing_df = None
+    columns = None
+    n_rows = 0
     
     if filename.exists():
         try:
-            existing_df = pd.read_csv(filename)
-            existing_df['Date'] = pd.to_datetime(existing_df['Date'])
-            last_date = existing_df['Date'].max()
+            columns, last_date, n_rows = read_csv_state(filename)
             # Start from the last date
             start_time = last_date
             print(f"  [{label}] Found existing data. Last: {last_date}. Appending...")
@@ -135,31 +351,62 @@ def update_dataset(api, symbol, oanda_symbol, granularity, label):
             print(f"  [{label}] Error reading existing file: {e}. Starting fresh.")
     
     # 2. Fetch Data
-    candles = fetch_candles(api, oanda_symbol, granularity, start_time)
+    if candles is None:
+        candles = fetch_candles(api, oanda_symbol, granularity, start_time)
     
     if not candles:
         print(f"  [{label}] No new data received.")
         return
 
-    new_records = parse_candles(candles)
-    if not new_records:
+    # 3a. Steady state: write the new rows straight to the end of the file
+    if start_time is not None and start_time.tzinfo is None and set(columns) == set(CANDLE_DTYPES) | {"Date"}:
+        rows = new_csv_rows(candles, columns, start_time)
+        if rows is not None and n_rows + len(rows) <= MAX_ROWS + TRIM_SLACK:
+            if not rows:
+                print(f"  [{label}] No new complete candles.")
+                return
+            with open(filename, 'a', newline='') as f:
+                csv.writer(f, lineterminator='\n').writerows(rows)
+            print(f"  [{label}] Appended. New rows: {len(rows)}. Total: {n_rows + len(rows)}")
+            return
+
+    # 3b. New file: stream the rows out the same way, skipping the DataFrame
+    if start_time is None:
+        rows = new_csv_rows(candles, CSV_COLUMNS)
+        if rows is not None:
+            if not rows:
+                print(f"  [{label}] No complete candles returned.")
+                return
+            with open(filename, 'w', newline='') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(CSV_COLUMNS)
+                writer.writerows(rows)
+            print(f"  [{label}] Created fresh. Total: {len(rows)}")
+            return
+
+    new_df = parse_candles(candles)
+    if new_df.empty:
         print(f"  [{label}] No complete candles returned.")
         return
 
-    new_df = pd.DataFrame(new_records)
-    new_df['Date'] = pd.to_datetime(new_df['Date'], utc=True).dt.tz_convert(None)
+    # 3c. Merge or Save
+    if start_time is not None:
+        # The request starts at the last stored candle, so drop what we already have
+        new_df = new_df[new_df['Date'] > start_time]
+        if new_df.empty:
+            print(f"  [{label}] No new complete candles.")
+            return
 
-    # 3. Merge and Save
-    if existing_df is not None:
-        # Concatenate
+        # Trim due, out-of-order candles or unexpected layout: full merge and rewrite
+        existing_df = pd.read_csv(filename, parse_dates=['Date'], dtype=CANDLE_DTYPES)
         combined_df = pd.concat([existing_df, new_df])
         # Drop duplicates based on Date
         combined_df = combined_df.drop_duplicates(subset=['Date'], keep='last')
         combined_df = combined_df.sort_values('Date')
         
-        # Optional: Limit file size (e.g. keep last 20k rows)
-        if len(combined_df) > 20000:
-             combined_df = combined_df.tail(20000)
+        # Limit file size (keep last MAX_ROWS rows)
+        if len(combined_df) > MAX_ROWS:
+             combined_df = combined_df.tail(MAX_ROWS)
              
         combined_df.to_csv(filename, index=False)
         print(f"  [{label}] Updated. New rows: {len(new_df)}. Total: {len(combined_df)}")
@@ -168,9 +415,72 @@ def update_dataset(api, symbol, oanda_symbol, granularity, label):
         print(f"  [{label}] Created fresh. Total: {len(new_df)}")
 
 
+# Timeframes built from M5 candles in steady state, and their length in minutes
+DERIVED_MINUTES = {"M15": 15, "H1": 60}
+
+
+def update_from_m5(api, paths, labels, oanda_symbol, start_time):
+    """Steady state: fetch M5 once and derive M15 and H1 from it, saving two requests."""
+    m5_candles = fetch_candles(api, oanda_symbol, "M5", start_time)
+    update_dataset(api, paths["M5"], oanda_symbol, "M5", labels["M5"], candles=m5_candles)
+    for granularity, minutes in DERIVED_MINUTES.items():
+        update_dataset(api, paths[granularity], oanda_symbol, granularity, labels[granularity],
+                       candles=resample_candles(m5_candles, minutes))
+
+
+def pair_jobs(pair):
+    """
+    Download jobs for one pair as (function, args) tuples, run with the
+    worker's OANDA client prepended. Each job writes its own files, so the
+    jobs of a pair run side by side like those of different pairs.
+    """
+    symbol = pair['symbol'] # e.g. EURUSD=X (keep for file naming)
+    oanda_symbol = pair.get('oanda_symbol') # e.g. EUR_USD
+
+    if not oanda_symbol:
+        print(f"Skipping {symbol} (No OANDA mapping)")
+        return []
+
+    print(f"Processing {pair['name']} ({oanda_symbol})...")
+
+    # Resolve every file path and log label once for this pair
+    paths = {g: dataset_path(symbol, g) for g in GRANULARITY_SUFFIX}
+    labels = {g: f"{symbol} {suffix}" for g, suffix in GRANULARITY_SUFFIX.items()}
+
+    # Steady state: M5 is fetched from the oldest of the three last candles
+    # so every derived bucket has its full set of M5 candles.
+    start_time = None
+    if all(paths[g].exists() for g in ("M5", *DERIVED_MINUTES)):
+        try:
+            start_time = min(read_csv_state(paths[g])[1] for g in ("M5", *DERIVED_MINUTES))
+        except Exception:
+            start_time = None
+
+    if start_time is not None:
+        jobs = [(update_from_m5, (paths, labels, oanda_symbol, start_time))]
+    else:
+        # Intraday M5, M15 and H1 for all assets, each fetched natively
+        jobs = [(update_dataset, (paths[g], oanda_symbol, g, labels[g])) for g in ("M5", *DERIVED_MINUTES)]
+
+    # H4 Update (always native: OANDA aligns H4 to 17:00 New York, not UTC)
+    jobs.append((update_dataset, (paths["H4"], oanda_symbol, "H4", labels["H4"])))
+
+    # Special Case: Silver (XAG_USD) Intraday M3
+    if symbol == "XAG_USD":
+        print(f"  [Intraday] Fetching M3 for Silver...")
+        jobs.append((update_dataset, (paths["M3"], oanda_symbol, "M3", labels["M3"])))
+
+    return jobs
+
+
+def run_job(job):
+    func, args = job
+    func(get_thread_api(), *args)
+
+
 def main():
-    api = get_oanda_api()
-    if not api:
+    # Fail fast on missing credentials before spinning up workers
+    if not get_thread_api():
         sys.exit(1)
 
     pairs = load_pairs()
@@ -188,35 +498,14 @@ def main():
     print(f"Starting Forex Update at {now.strftime('%H:%M')}")
     print(f"Plan: M15=Yes | H1=Yes | H4=Yes (Polling for completed candles)")
 
-    for pair in pairs:
-        symbol = pair['symbol'] # e.g. EURUSD=X (keep for file naming)
-        oanda_symbol = pair.get('oanda_symbol') # e.g. EUR_USD
-        
-        if not oanda_symbol:
-            print(f"Skipping {symbol} (No OANDA mapping)")
-            continue
-            
-        print(f"Processing {pair['name']} ({oanda_symbol})...")
-        
-        # M15 Update
-        update_dataset(api, symbol, oanda_symbol, "M15", "15_Min")
-        
-        # H1 Update
-        update_dataset(api, symbol, oanda_symbol, "H1", "1_Hour")
-            
-        # H4 Update
-        update_dataset(api, symbol, oanda_symbol, "H4", "4_Hour")
-
-        # Intraday M5 for all assets
-        update_dataset(api, symbol, oanda_symbol, "M5", "5_Min")
-
-        # Special Case: Silver (XAG_USD) Intraday M3
-        if symbol == "XAG_USD":
-            print(f"  [Intraday] Fetching M3 for Silver...")
-            update_dataset(api, symbol, oanda_symbol, "M3", "3_Min")
-            
-        # Rate limit kindness
-        time.sleep(0.2)
+    # Timeframes of one pair are independent requests too: queue them all on
+    # one pool so a pair's H4 fetch overlaps its M5 fetch. Jobs are submitted
+    # as each pair is planned, so downloads start while later pairs' CSVs are
+    # still being read.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(run_job, job) for pair in pairs for job in pair_jobs(pair)]
+        for future in futures:
+            future.result()
 
 if __name__ == "__main__":
     main()
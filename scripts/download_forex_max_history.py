@@ -6,6 +6,7 @@ Downloads 'max' period (up to 42 days of 15m data) for all forex pairs.
 import yfinance as yf
 import pandas as pd
 import json
+import os
 import time
 from pathlib import Path
 
@@ -16,14 +17,71 @@ DATA_DIR = PROJECT_ROOT / 'data' / 'forex_raw'
 
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# A file written within the last bar already holds everything Yahoo has
+FRESH_SECONDS = 15 * 60
+
 def load_forex_pairs():
     with open(CONFIG_PATH, 'r') as f:
         return json.load(f)['pairs']
 
-def download_max_data(symbol, name):
-    """Download maximum available 15m data (up to 42 days)."""
+def is_data_stale(symbol, now):
+    """True unless the symbol's CSV was written within the last FRESH_SECONDS."""
+    try:
+        mtime = os.stat(DATA_DIR / f"{symbol}.csv").st_mtime
+    except FileNotFoundError:
+        return True
+    return now - mtime > FRESH_SECONDS
+
+def save_max_data(symbol, df):
+    """Normalize a downloaded 15m frame and write it to the symbol's CSV."""
     output_file = DATA_DIR / f"{symbol}.csv"
 
+    # Handle MultiIndex columns
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+
+    # Normalize timezone
+    if df.index.tz is not None:
+        df.index = df.index.tz_convert(None)
+
+    # Save to CSV
+    df.to_csv(output_file)
+
+    rows = len(df)
+    days = rows / 96  # 96 x 15m bars per day
+
+    print(f" [✓] Downloaded {rows} rows (~{days:.1f} days) for {symbol}")
+    return True, rows
+
+def download_batch(symbols):
+    """
+    Download every symbol in one multi-ticker request.
+    Returns {symbol: DataFrame} for the symbols that came back with data.
+    """
+    print(f"[+] Downloading MAX 15m data for {len(symbols)} symbols in one batch...")
+    try:
+        df = yf.download(" ".join(symbols), period="max", interval="15m",
+                         group_by="ticker", threads=True, progress=False)
+    except Exception as e:
+        print(f" [!] Batch download failed: {e}")
+        return {}
+
+    if df is None or df.empty or not isinstance(df.columns, pd.MultiIndex):
+        return {}
+
+    frames = {}
+    tickers = set(df.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol not in tickers:
+            continue
+        # The batch shares one index, so drop bars this symbol doesn't have
+        symbol_df = df[symbol].dropna(how='all')
+        if not symbol_df.empty:
+            frames[symbol] = symbol_df
+    return frames
+
+def download_max_data(symbol, name):
+    """Download maximum available 15m data (up to 42 days)."""
     print(f"[+] Downloading MAX 15m data for {name} ({symbol})...")
 
     try:
@@ -35,22 +93,7 @@ def download_max_data(symbol, name):
             print(f" [!] No data found for {symbol}")
             return False, 0
 
-        # Handle MultiIndex columns
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
-        # Normalize timezone
-        if df.index.tz is not None:
-            df.index = df.index.tz_convert(None)
-
-        # Save to CSV
-        df.to_csv(output_file)
-
-        rows = len(df)
-        days = rows / 96  # 96 x 15m bars per day
-
-        print(f" [✓] Downloaded {rows} rows (~{days:.1f} days) for {symbol}")
-        return True, rows
+        return save_max_data(symbol, df)
 
     except Exception as e:
         print(f" [!] Error downloading {symbol}: {e}")
@@ -73,15 +116,29 @@ def main():
     print(f"Period: max (~42 days available)")
     print("="*70)
 
-    for pair in pairs:
-        ok, rows = download_max_data(pair['symbol'], pair['name'])
+    # Fresh files need no network at all
+    now = time.time()
+    stale_pairs = [pair for pair in pairs if is_data_stale(pair['symbol'], now)]
+    skipped = len(pairs) - len(stale_pairs)
+    if skipped:
+        print(f"Skipping {skipped} symbols downloaded in the last {FRESH_SECONDS // 60} minutes")
+        success += skipped
+
+    frames = download_batch([pair['symbol'] for pair in stale_pairs]) if stale_pairs else {}
+
+    results = [save_max_data(pair['symbol'], frames[pair['symbol']])
+               for pair in stale_pairs if pair['symbol'] in frames]
+
+    # Symbols missing from the batch are retried on their own, one at a time:
+    # yf.download collects results in module-level state and is not thread-safe
+    results += [download_max_data(pair['symbol'], pair['name'])
+                for pair in stale_pairs if pair['symbol'] not in frames]
+
+    for ok, rows in results:
         if ok:
             success += 1
             total_rows += rows
 
-        # Be nice to Yahoo API
-        time.sleep(0.5)
-
     print("="*70)
     print(f"Finished: {success}/{len(pairs)} symbols downloaded")
     print(f"Total bars: {total_rows:,} (~{total_rows/96:.1f} instrument-days)")
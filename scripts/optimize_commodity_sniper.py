@@ -10,32 +10,111 @@ Tests combinations of:
 - cooldown_hours: 0, 4
 
 Total: 72 combinations per asset
+
+Usage:
+    python scripts/optimize_commodity_sniper.py              # full grid
+    python scripts/optimize_commodity_sniper.py --adaptive   # corners, then refine
 """
 
+import argparse
+import csv
+import os
 import pandas as pd
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 import numpy as np
 from itertools import product
+from functools import lru_cache, partial
+from tqdm import tqdm
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 from backend.app.services.commodity_sniper_detector import CommoditySniperDetector
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.indicators import TechnicalIndicators, cached_indicator_frame
+
+# pyarrow parses CSVs multithreaded; fall back to the C parser when it isn't installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
 
 # Configuration
 DATA_DIR = PROJECT_ROOT / 'data' / 'forex_raw'
+CACHE_DIR = PROJECT_ROOT / 'data' / 'forex_cache'
 STARTING_BALANCE = 360.0
 RISK_PCT = 2.0
 LEVERAGE = 10.0
 SPREAD_COST = 0.0006
 
+# Grid pruning: from PRUNE_MIN_TRADES trades on, every PRUNE_CHECK_EVERY
+# trades, a configuration whose balance is below PRUNE_RATIO of the best
+# completed one at the same trade count is abandoned
+PRUNE_MIN_TRADES = 40
+PRUNE_CHECK_EVERY = 20
+PRUNE_RATIO = 0.5
+
+# Cooldowns are applied by the backtest itself, so the detector carries no
+# per-run state and one instance serves every configuration
+DETECTOR = CommoditySniperDetector()
+
+# Parameter grid: 72 combinations
+PARAM_GRID = {
+    'squeeze_threshold': [1.2, 1.3, 1.5],
+    'adx_min': [20, 22, 25],
+    'require_fvg': [False, True],
+    'target_rr': [2.5, 3.0],
+    'cooldown_hours': [0, 4]
+}
+
+# CSV schema: skip unused columns and read prices as float32 (ample precision
+# for backtest math, half the memory of float64)
+OHLCV_DTYPES = {'Open': 'float32', 'High': 'float32', 'Low': 'float32', 'Close': 'float32', 'Volume': 'float64'}
+
+
+def read_prepared(path: Path) -> pd.DataFrame:
+    """Parse one OHLCV CSV and add all indicators."""
+    # Resolve the column list from the header: the pyarrow engine takes
+    # explicit usecols only, and the date column is parsed by the reader
+    header = pd.read_csv(path, nrows=0).columns
+    date_col = 'Date' if 'Date' in header else 'Datetime'
+    df = pd.read_csv(
+        path,
+        usecols=[c for c in header if c in OHLCV_DTYPES or c == date_col],
+        dtype=OHLCV_DTYPES,
+        parse_dates=[date_col],
+        engine=CSV_ENGINE,
+        # The C parser can read straight from the page cache; pyarrow rejects the option
+        memory_map=CSV_ENGINE == "c"
+    )
+    df[date_col] = pd.to_datetime(df[date_col], utc=True, format='ISO8601')
+    df.set_index(date_col, inplace=True)
+    # Downloaded candles are already in time order; only sort when they aren't
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+    return TechnicalIndicators.add_all_indicators(df)
+
 
+def load_prepared(path: Path) -> pd.DataFrame:
+    """read_prepared() memoized under CACHE_DIR until the CSV changes."""
+    return cached_indicator_frame(
+        path, CACHE_DIR, {'dtypes': OHLCV_DTYPES, 'indicators': 'add_all_indicators'},
+        partial(read_prepared, path)
+    )
+
+
+@lru_cache(maxsize=None)
 def load_data(symbol: str) -> Dict[str, pd.DataFrame]:
-    """Load 5m and 15m data for symbol."""
+    """
+    Load 5m and 15m data for symbol.
+
+    Memoized per symbol: the frames and the derived arrays cached in the
+    returned dict are shared by every caller in the process.
+    """
     data = {}
 
     for tf_name, tf_str in [('base', '5_Min'), ('htf', '15_Min')]:
@@ -43,13 +122,12 @@ def load_data(symbol: str) -> Dict[str, pd.DataFrame]:
         if not path.exists():
             return None
 
-        df = pd.read_csv(path)
-        date_col = 'Date' if 'Date' in df.columns else 'Datetime'
-        df[date_col] = pd.to_datetime(df[date_col], utc=True)
-        df.set_index(date_col, inplace=True)
-        df.sort_index(inplace=True)
-        df = TechnicalIndicators.add_all_indicators(df)
-        data[tf_name] = df
+        data[tf_name] = load_prepared(path)
+
+    # Squeeze baseline (narrowest BB width of the previous 96 candles) is
+    # data-only, so it is computed once here rather than per entry setup
+    df_base = data['base']
+    df_base['BB_Width_Min96'] = df_base['BB_Width'].rolling(96, min_periods=1).min().shift(1)
 
     return data
 
@@ -66,206 +144,454 @@ def calculate_position_size(balance: float, entry: float, sl: float) -> int:
     return int(min(units_by_risk, max_units))
 
 
-def simulate_trade(df, entry_idx, signal, entry_price, stop_loss, take_profit):
-    """Simulate trade to SL or TP."""
-    direction = signal['signal']
-    risk = abs(entry_price - stop_loss)
-
-    for i in range(entry_idx + 1, len(df)):
-        candle = df.iloc[i]
-
-        if direction == 'BUY':
-            if candle['Low'] <= stop_loss:
-                return stop_loss - entry_price, -1.0, "LOSS", candle.name
-            if candle['High'] >= take_profit:
-                return take_profit - entry_price, (take_profit - entry_price) / risk, "WIN", candle.name
-        else:  # SELL
-            if candle['High'] >= stop_loss:
-                return entry_price - stop_loss, -1.0, "LOSS", candle.name
-            if candle['Low'] <= take_profit:
-                return entry_price - take_profit, (entry_price - take_profit) / risk, "WIN", candle.name
-
-    # Still open at end
-    close = df.iloc[-1]['Close']
-    ppu = (close - entry_price) if direction == 'BUY' else (entry_price - close)
-    return ppu, ppu / risk if risk > 0 else 0, "OPEN", None
-
-
-def backtest_config(symbol: str, data: Dict, params: Dict) -> Dict:
-    """Run backtest with specific parameter configuration."""
-    detector = CommoditySniperDetector(
-        squeeze_threshold=params['squeeze_threshold'],
-        adx_min=params['adx_min'],
-        require_fvg=params['require_fvg'],
-        cooldown_hours=params['cooldown_hours']
+def range_table(values: np.ndarray, op) -> List[np.ndarray]:
+    """
+    Sparse table for range min/max queries: level k holds op() over the
+    2**k bars starting at each index. Built in O(N log N) with NumPy.
+    """
+    table = [values]
+    span = 1
+    while span * 2 <= len(values):
+        prev = table[-1]
+        table.append(op(prev[:-span], prev[span:]))
+        span *= 2
+    return table
+
+
+def first_crossings(table: List[np.ndarray], starts: np.ndarray, levels: np.ndarray, below: bool) -> np.ndarray:
+    """
+    First index from each of `starts` whose value is <= the matching level
+    (below=True, on a min table) or >= it (below=False, on a max table).
+
+    Every query descends the table together in O(log N) NumPy steps,
+    skipping the largest blocks that stay clear of its level. `starts`
+    broadcasts against `levels`. Returns len(values) where the level is
+    never crossed.
+    """
+    n = len(table[0])
+    # Compare in the table's dtype, as a scalar lookup against a float32 bar would
+    levels = np.asarray(levels).astype(table[0].dtype)
+    pos = np.broadcast_to(np.asarray(starts, dtype=np.int64), levels.shape).copy()
+    for k in range(len(table) - 1, -1, -1):
+        block = table[k]
+        inside = pos < len(block)
+        extreme = block[np.minimum(pos, len(block) - 1)]
+        clear = inside & ((extreme > levels) if below else (extreme < levels))
+        pos[clear] += 1 << k
+    return np.minimum(pos, n)
+
+
+def resolve_exits(data: Dict, signals: List[tuple], target_rrs: List[float]) -> Dict[float, tuple]:
+    """
+    Exit of every signal for every target RR, resolved in one vectorized pass.
+
+    The stop loss does not depend on target_rr, so its crossing is located
+    once per signal; take profits form a (signals, target_rrs) matrix.
+    SL wins when both are hit on the same bar.
+    Returns {target_rr: (exit_idx, hit_tp, take_profit)} with exit_idx -1
+    for trades still open at the end of the data.
+    """
+    low_min, high_max = exit_tables(data)
+    n = len(low_min[0])
+
+    starts = np.array([s[0] for s in signals], dtype=np.int64) + 1
+    is_buy = np.array([s[1] == "BUY" for s in signals], dtype=bool)
+    entry = np.array([s[2] for s in signals], dtype=np.float64)
+    stop_loss = np.array([s[3] for s in signals], dtype=np.float64)
+    risk = np.abs(entry - stop_loss)
+
+    rrs = np.asarray(target_rrs, dtype=np.float64)
+    reward = risk[:, None] * rrs[None, :]
+    take_profit = np.where(is_buy[:, None], entry[:, None] + reward, entry[:, None] - reward)
+
+    # Longs stop out on a Low and take profit on a High; shorts the reverse
+    sl_idx = np.where(
+        is_buy,
+        first_crossings(low_min, starts, stop_loss, below=True),
+        first_crossings(high_max, starts, stop_loss, below=False)
+    )[:, None]
+    tp_idx = np.where(
+        is_buy[:, None],
+        first_crossings(high_max, starts[:, None], take_profit, below=False),
+        first_crossings(low_min, starts[:, None], take_profit, below=True)
     )
 
-    df_base = data['base']
-    df_htf = data['htf']
-    balance = STARTING_BALANCE
-    trades = []
+    hit_sl = (sl_idx < n) & (sl_idx <= tp_idx)
+    hit_tp = ~hit_sl & (tp_idx < n)
+    exit_idx = np.where(hit_sl, sl_idx, np.where(hit_tp, tp_idx, -1))
+
+    return {
+        rr: (exit_idx[:, r], hit_tp[:, r], take_profit[:, r])
+        for r, rr in enumerate(target_rrs)
+    }
 
-    i = 100
-    while i < len(df_base):
-        current_time = df_base.index[i]
-        slice_base = df_base.iloc[max(0, i-100):i+1]
 
-        # Align HTF
-        htf_idx = df_htf.index.get_indexer([current_time], method='pad')[0]
-        if htf_idx < 20:
-            i += 1
-            continue
+def signal_inputs(data: Dict) -> tuple:
+    """
+    HTF alignment for a symbol's data, built on first use and kept in `data`.
+
+    Returns the HTF position of every base bar and a mask of bars with
+    enough history to evaluate.
+    """
+    if 'signal_inputs' not in data:
+        df_base = data['base']
+        df_htf = data['htf']
+
+        # Align HTF: position of the last HTF candle at or before each base
+        # candle, resolved for every bar in one binary-search pass
+        htf_positions = df_htf.index.searchsorted(df_base.index, side='right') - 1
+
+        # Bars with 100 base candles and 20 HTF candles of history
+        valid_bar = htf_positions >= 20
+        valid_bar[:100] = False
 
-        slice_htf = df_htf.iloc[max(0, htf_idx-50):htf_idx+1]
+        data['signal_inputs'] = (htf_positions, valid_bar)
 
-        # Check for signal
-        signal = detector.analyze(
-            {'base': slice_base, 'htf': slice_htf},
-            symbol,
-            target_rr=params['target_rr'],
-            spread=SPREAD_COST
+    return data['signal_inputs']
+
+
+def price_arrays(data: Dict) -> tuple:
+    """
+    High, Low and Close of the base timeframe for the exit scans, built on
+    first use and kept in `data`.
+
+    Stored as C-contiguous float32 (the dtype load_data reads prices in),
+    so every configuration's scans stream over the same compact buffers.
+    """
+    if 'price_arrays' not in data:
+        df_base = data['base']
+        data['price_arrays'] = tuple(
+            np.ascontiguousarray(df_base[col].to_numpy(dtype=np.float32))
+            for col in ('High', 'Low', 'Close')
+        )
+    return data['price_arrays']
+
+
+def exit_tables(data: Dict) -> tuple:
+    """Range-min table of Low and range-max table of High, built on first use and kept in `data`."""
+    if 'exit_tables' not in data:
+        highs, lows, _ = price_arrays(data)
+        data['exit_tables'] = (range_table(lows, np.minimum), range_table(highs, np.maximum))
+    return data['exit_tables']
+
+
+def raw_candidates(symbol: str, data: Dict) -> Dict[str, np.ndarray]:
+    """
+    Breakout candidates of the detector before the squeeze/ADX/FVG settings
+    are applied, built on first use and kept in `data`.
+    """
+    key = ('raw_candidates', symbol)  # the time filter depends on the symbol
+    if key not in data:
+        htf_positions, valid_bar = signal_inputs(data)
+        raw = DETECTOR.raw_candidates(
+            data['base'], data['htf'], symbol,
+            spread=SPREAD_COST,
+            htf_positions=htf_positions
+        )
+        keep = valid_bar[raw['index']]
+        data[key] = {name: values[keep] for name, values in raw.items()}
+    return data[key]
+
+
+def scan_signals(symbol: str, data: Dict, params: Dict) -> List[tuple]:
+    """
+    Find every entry signal for the squeeze/ADX/FVG settings in `params`.
+
+    Entries, direction and stop loss do not depend on target_rr or the
+    cooldown, so one scan is shared by every combination of those; the
+    scan itself only filters the symbol's raw_candidates().
+    Returns (bar index, direction, entry price, stop loss) tuples.
+    """
+    detector_params = {
+        'squeeze_threshold': params['squeeze_threshold'],
+        'adx_min': params['adx_min'],
+        'require_fvg': params['require_fvg']
+    }
+    raw = raw_candidates(symbol, data)
+    selected = np.flatnonzero(DETECTOR.select_candidates(raw, detector_params))
+
+    return [
+        (i, "BUY" if is_buy else "SELL", float(price), float(stop_loss))
+        for i, is_buy, price, stop_loss in zip(
+            raw['index'][selected].tolist(), raw['is_buy'][selected].tolist(),
+            raw['price'][selected], raw['stop_loss'][selected]
         )
+    ]
+
+
+def backtest_config(symbol: str, data: Dict, params: Dict, signals: List[tuple] = None,
+                    exits: Dict[float, tuple] = None, best_balances: Dict[int, float] = None) -> Dict:
+    """
+    Run backtest with specific parameter configuration.
+
+    `signals` is the output of scan_signals() and `exits` that of
+    resolve_exits() for the same entry settings; they are computed here
+    when not supplied.
+
+    `best_balances` enables pruning across a grid: it maps a trade count to
+    the best balance any completed configuration had after that many trades.
+    A configuration that falls below PRUNE_RATIO of it is stopped early and
+    flagged 'pruned'; one that completes records its balances there.
+    """
+    if signals is None:
+        signals = scan_signals(symbol, data, params)
+
+    target_rr = params['target_rr']
+    cooldown_hours = params['cooldown_hours']
 
-        if signal:
-            entry_price = signal['price']
-            stop_loss = signal['stop_loss']
-            take_profit = signal['take_profit']
-            units = calculate_position_size(balance, entry_price, stop_loss)
-
-            if units >= 1:
-                ppu, actual_rr, result, exit_time = simulate_trade(
-                    df_base, i, signal, entry_price, stop_loss, take_profit
-                )
-
-                if result != "OPEN":
-                    gross_pnl = ppu * units
-                    spread_cost = entry_price * units * SPREAD_COST
-                    net_pnl = gross_pnl - spread_cost
-                    balance += net_pnl
-
-                    trades.append({
-                        'result': result,
-                        'pnl': net_pnl,
-                        'rr': actual_rr
-                    })
-
-                    # Record exit for cooldown
-                    if exit_time:
-                        detector.record_exit(exit_time, symbol)
-                        try:
-                            i = df_base.index.get_loc(exit_time)
-                        except KeyError:
-                            pass
-
-        i += 1
+    if exits is None or target_rr not in exits:
+        exits = resolve_exits(data, signals, [target_rr])
+    exit_idx, hit_tp, take_profits = exits[target_rr]
+
+    balance = STARTING_BALANCE
+    wins = []    # per trade: won (TP) or lost (SL)
+    pnls = []
+    balance_path = []
+    pruned = False
+
+    # Cooldowns are checked on int64 nanosecond timestamps rather than
+    # Timestamp arithmetic per signal
+    times_ns = data['base'].index.as_unit('ns').asi8
+    cooldown_ns = cooldown_hours * 3600 * 10**9
+
+    # Exits are already resolved, so the walk only applies the position
+    # overlap, cooldown and compounding that depend on earlier trades
+    next_bar = 0
+    last_exit_ns = None
+    for s, (i, direction, entry_price, stop_loss) in enumerate(signals):
+        # Still inside the previous trade
+        if i < next_bar:
+            continue
+
+        # Cooldown period after the last exit
+        if cooldown_hours and last_exit_ns is not None:
+            if times_ns[i] - last_exit_ns < cooldown_ns:
+                continue
+
+        units = calculate_position_size(balance, entry_price, stop_loss)
+
+        # Trades still open at the end of the data are not counted
+        if units >= 1 and exit_idx[s] >= 0:
+            if hit_tp[s]:
+                take_profit = float(take_profits[s])
+                ppu = (take_profit - entry_price) if direction == 'BUY' else (entry_price - take_profit)
+            else:
+                ppu = (stop_loss - entry_price) if direction == 'BUY' else (entry_price - stop_loss)
+
+            gross_pnl = ppu * units
+            spread_cost = entry_price * units * SPREAD_COST
+            net_pnl = gross_pnl - spread_cost
+            balance += net_pnl
+
+            wins.append(bool(hit_tp[s]))
+            pnls.append(net_pnl)
+
+            # Record exit for cooldown and resume after the exit bar
+            last_exit_ns = times_ns[exit_idx[s]]
+            next_bar = exit_idx[s] + 1
+
+            # Stop a configuration that is clearly dominated at this trade count
+            if best_balances is not None:
+                balance_path.append(balance)
+                n_trades = len(pnls)
+                if (n_trades >= PRUNE_MIN_TRADES and n_trades % PRUNE_CHECK_EVERY == 0
+                        and n_trades in best_balances
+                        and balance < PRUNE_RATIO * best_balances[n_trades]):
+                    pruned = True
+                    break
+
+    if best_balances is not None and not pruned:
+        for n_trades, path_balance in enumerate(balance_path, 1):
+            if path_balance > best_balances.get(n_trades, float('-inf')):
+                best_balances[n_trades] = path_balance
 
     # Calculate metrics
-    if not trades:
+    if not pnls:
         return {
             'total_trades': 0,
             'win_rate': 0,
             'net_profit': 0,
             'return_pct': 0,
             'max_loss_streak': 0,
-            'sharpe': 0
+            'sharpe': 0,
+            'pruned': pruned
         }
 
-    wins = [t for t in trades if t['result'] == 'WIN']
-    losses = [t for t in trades if t['result'] == 'LOSS']
-
-    win_rate = (len(wins) / len(trades) * 100) if trades else 0
+    n_wins, max_streak, sharpe = trade_metrics(np.array(wins), np.array(pnls))
     net_profit = balance - STARTING_BALANCE
-    return_pct = (net_profit / STARTING_BALANCE * 100)
-
-    # Max loss streak
-    streak = 0
-    max_streak = 0
-    for t in trades:
-        if t['result'] == 'LOSS':
-            streak += 1
-            max_streak = max(max_streak, streak)
-        else:
-            streak = 0
-
-    # Sharpe (simplified)
-    if len(trades) > 1:
-        returns = [t['pnl'] / STARTING_BALANCE for t in trades]
-        sharpe = (np.mean(returns) / np.std(returns)) * np.sqrt(len(trades)) if np.std(returns) > 0 else 0
-    else:
-        sharpe = 0
 
     return {
-        'total_trades': len(trades),
-        'win_rate': win_rate,
+        'total_trades': len(pnls),
+        'win_rate': n_wins / len(pnls) * 100,
         'net_profit': net_profit,
-        'return_pct': return_pct,
+        'return_pct': (net_profit / STARTING_BALANCE * 100),
         'max_loss_streak': max_streak,
-        'sharpe': sharpe
+        'sharpe': sharpe,
+        'pruned': pruned
     }
 
 
-def optimize_asset(symbol: str) -> pd.DataFrame:
-    """Run grid search for a single asset."""
-    print(f"\n{'='*80}")
-    print(f"Optimizing {symbol}...")
-    print(f"{'='*80}")
+def trade_metrics(is_win: np.ndarray, pnl: np.ndarray) -> tuple:
+    """
+    Win count, max loss streak and (simplified) Sharpe of a trade sequence,
+    computed together from its outcome and P&L arrays.
+    """
+    n = len(pnl)
+    is_loss = ~is_win
 
-    # Load data once
-    data = load_data(symbol)
-    if not data:
-        print(f"ERROR: Could not load data for {symbol}")
-        return None
+    # Max loss streak: label each run of losses by the number of wins
+    # before it and take the largest run
+    max_streak = int(np.bincount(np.cumsum(is_win)[is_loss]).max()) if is_loss.any() else 0
 
-    # Parameter grid
-    param_grid = {
-        'squeeze_threshold': [1.2, 1.3, 1.5],
-        'adx_min': [20, 22, 25],
-        'require_fvg': [False, True],
-        'target_rr': [2.5, 3.0],
-        'cooldown_hours': [0, 4]
-    }
+    sharpe = 0
+    if n > 1:
+        returns = pnl / STARTING_BALANCE
+        std = returns.std()
+        if std > 0:
+            sharpe = (returns.mean() / std) * np.sqrt(n)
+
+    return int(is_win.sum()), max_streak, sharpe
 
-    # Generate all combinations
-    keys = param_grid.keys()
-    values = param_grid.values()
-    combinations = [dict(zip(keys, v)) for v in product(*values)]
 
-    print(f"Testing {len(combinations)} parameter combinations...")
+def results_path(symbol: str) -> Path:
+    """CSV holding an asset's grid results."""
+    return PROJECT_ROOT / 'data' / f'optimization_results_{symbol}.csv'
 
-    results = []
-    for i, params in enumerate(combinations, 1):
-        if i % 10 == 0:
-            print(f"  Progress: {i}/{len(combinations)}")
 
-        metrics = backtest_config(symbol, data, params)
+def read_results(path: Path) -> pd.DataFrame:
+    """Grid results streamed by optimize_asset(), with floats read back exactly."""
+    return pd.read_csv(path, float_precision='round_trip')
 
-        results.append({
-            **params,
-            **metrics
-        })
 
-    # Convert to DataFrame and sort by profitability
-    df = pd.DataFrame(results)
+def rank_results(df: pd.DataFrame) -> pd.DataFrame:
+    """Completed configurations with at least 5 trades, best first (net_profit, then win_rate)."""
+    # Sort by profitability; pruned runs are partial
+    if len(df) == 0:
+        return df
+    df = df[~df['pruned']].drop(columns='pruned')
 
     # Filter: Must have at least 5 trades
     df = df[df['total_trades'] >= 5]
 
     if len(df) == 0:
-        print(f"WARNING: No configurations produced >= 5 trades for {symbol}")
-        return pd.DataFrame()
+        return df
 
     # Sort by net_profit (primary), then win_rate
-    df = df.sort_values(['net_profit', 'win_rate'], ascending=[False, False])
+    return df.sort_values(['net_profit', 'win_rate'], ascending=[False, False])
+
+
+def refine_grid(coarse: pd.DataFrame) -> Dict[str, list]:
+    """
+    Sub-grid around the best coarse configurations.
+
+    Axes on which the two best coarse configurations agree are settled at
+    that value, plus its untested neighbours in PARAM_GRID; axes on which
+    they disagree are expanded to every value.
+    """
+    top = coarse.head(2)
+    sub_grid = {}
+    for key, values in PARAM_GRID.items():
+        settled = top[key].unique()
+        if len(settled) != 1:
+            sub_grid[key] = list(values)
+            continue
+        idx = values.index(settled[0])
+        neighbours = values[max(0, idx - 1):idx + 2]
+        sub_grid[key] = [v for v in neighbours if v == values[idx] or v not in (values[0], values[-1])]
+    return sub_grid
+
+
+def optimize_asset(symbol: str, adaptive: bool = False) -> pd.DataFrame:
+    """
+    Run grid search for a single asset.
+
+    With `adaptive`, only the corners of the grid are tested first and the
+    full grid is then run within refine_grid()'s sub-cube around the best
+    of them.
+    """
+    print(f"\n{'='*80}")
+    print(f"Optimizing {symbol}...")
+    print(f"{'='*80}")
+
+    # Load data once
+    data = load_data(symbol)
+    if not data:
+        print(f"ERROR: Could not load data for {symbol}")
+        return None
+
+    # Entry signals depend only on the squeeze/ADX/FVG settings, so scan once
+    # per entry setup, resolve the exits of every target_rr in one batch and
+    # replay them for each target_rr and cooldown
+    signal_cache = {}
+
+    # Best balance after each trade count, shared by the grid for pruning
+    best_balances = {}
+
+    # Each result is appended to the asset's results CSV as it completes, so
+    # the grid is never held in memory and a partial run keeps its rows;
+    # main() overwrites the file with the ranked results at the end
+    path = results_path(symbol)
+    writer = None
+
+    def run_grid(grid: Dict[str, list], skip=()):
+        """Backtest every combination of `grid` not listed in `skip`, appending rows to `path`."""
+        nonlocal writer
+        combinations = [
+            dict(zip(grid.keys(), v)) for v in product(*grid.values())
+            if v not in skip
+        ]
+        print(f"Testing {len(combinations)} parameter combinations...")
+
+        # tqdm batches its redraws, so workers don't contend on stdout per combination
+        for params in tqdm(combinations, desc=symbol):
+            entry_key = (params['squeeze_threshold'], params['adx_min'], params['require_fvg'])
+            if entry_key not in signal_cache:
+                signals = scan_signals(symbol, data, params)
+                signal_cache[entry_key] = (signals, resolve_exits(data, signals, PARAM_GRID['target_rr']))
+
+            metrics = backtest_config(symbol, data, params, *signal_cache[entry_key], best_balances)
+
+            row = {**params, **metrics}
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            f.flush()
+
+    with open(path, 'w', newline='') as f:
+        if adaptive:
+            corners = {key: [values[0], values[-1]] for key, values in PARAM_GRID.items()}
+            run_grid(corners)
+            coarse_results = read_results(path)
+            coarse = rank_results(coarse_results)
+            if len(coarse) > 0:
+                tested = set(coarse_results[list(PARAM_GRID)].itertuples(index=False, name=None))
+                run_grid(refine_grid(coarse), skip=tested)
+        else:
+            run_grid(PARAM_GRID)
+
+    df = rank_results(read_results(path))
+    if len(df) == 0:
+        print(f"WARNING: No configurations produced >= 5 trades for {symbol}")
+        return pd.DataFrame()
 
     return df
 
 
 def main():
     """Run optimization for both assets."""
+    parser = argparse.ArgumentParser(description="CommoditySniper Parameter Optimization")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Test the grid corners first, then only the sub-grid around the best of them")
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("COMMODITYSNIPER PARAMETER OPTIMIZATION")
     print("="*80)
-    print(f"Testing 72 parameter combinations per asset")
+    if args.adaptive:
+        print(f"Testing 32 corner combinations per asset, then refining around the best")
+    else:
+        print(f"Testing 72 parameter combinations per asset")
     print(f"Optimization Metrics:")
     print(f"  1. Win Rate >= 40%")
     print(f"  2. Net Profit > $30")
@@ -275,59 +601,63 @@ def main():
     assets = ['WHEAT_USD', 'BCO_USD']
     best_configs = {}
 
-    for symbol in assets:
-        results_df = optimize_asset(symbol)
+    # Assets share no state, so each grid search runs in its own process
+    # (the backtests are CPU-bound and would serialize on the GIL in threads)
+    with ProcessPoolExecutor(max_workers=min(len(assets), os.cpu_count() or 1)) as executor:
+        asset_results = list(executor.map(partial(optimize_asset, adaptive=args.adaptive), assets))
+
+    # Build the report in memory and emit it with one write, so the
+    # per-asset sections come out whole and in asset order
+    out = []
+    display_cols = ['squeeze_threshold', 'adx_min', 'require_fvg', 'target_rr', 'cooldown_hours',
+                    'total_trades', 'win_rate', 'net_profit', 'return_pct', 'max_loss_streak', 'sharpe']
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', 200)
 
+    for symbol, results_df in zip(assets, asset_results):
         if results_df is None or len(results_df) == 0:
-            print(f"\nNo valid configurations found for {symbol}")
+            out.append(f"\nNo valid configurations found for {symbol}")
             continue
 
         # Show top 10 configurations
-        print(f"\n{'='*80}")
-        print(f"TOP 10 CONFIGURATIONS FOR {symbol}")
-        print(f"{'='*80}")
-
-        # Select columns to display
-        display_cols = ['squeeze_threshold', 'adx_min', 'require_fvg', 'target_rr', 'cooldown_hours',
-                        'total_trades', 'win_rate', 'net_profit', 'return_pct', 'max_loss_streak', 'sharpe']
-
-        pd.set_option('display.max_columns', None)
-        pd.set_option('display.width', 200)
-        print(results_df[display_cols].head(10).to_string(index=False))
+        out.append(f"\n{'='*80}")
+        out.append(f"TOP 10 CONFIGURATIONS FOR {symbol}")
+        out.append(f"{'='*80}")
+        out.append(results_df[display_cols].head(10).to_string(index=False))
 
         # Save full results
-        output_path = PROJECT_ROOT / 'data' / f'optimization_results_{symbol}.csv'
+        output_path = results_path(symbol)
         results_df.to_csv(output_path, index=False)
-        print(f"\nFull results saved to: {output_path}")
+        out.append(f"\nFull results saved to: {output_path}")
 
         # Store best config
         best = results_df.iloc[0]
         best_configs[symbol] = best.to_dict()
 
-    # Print final recommendations
-    print("\n" + "="*80)
-    print("RECOMMENDED CONFIGURATIONS")
-    print("="*80)
+    # Final recommendations
+    out.append("\n" + "="*80)
+    out.append("RECOMMENDED CONFIGURATIONS")
+    out.append("="*80)
 
     for symbol, config in best_configs.items():
-        print(f"\n{symbol}:")
-        print(f"  squeeze_threshold: {config['squeeze_threshold']}")
-        print(f"  adx_min: {config['adx_min']}")
-        print(f"  require_fvg: {config['require_fvg']}")
-        print(f"  target_rr: {config['target_rr']}")
-        print(f"  cooldown_hours: {config['cooldown_hours']}")
-        print(f"\n  Expected Performance:")
-        print(f"    Trades: {config['total_trades']}")
-        print(f"    Win Rate: {config['win_rate']:.1f}%")
-        print(f"    Net Profit: ${config['net_profit']:.2f}")
-        print(f"    Return: {config['return_pct']:.2f}%")
-        print(f"    Max Loss Streak: {config['max_loss_streak']}")
-        print(f"    Sharpe Ratio: {config['sharpe']:.2f}")
-
-    print("\n" + "="*80)
-    print("Optimization Complete!")
-    print("="*80)
-
+        out.append(f"\n{symbol}:")
+        out.append(f"  squeeze_threshold: {config['squeeze_threshold']}")
+        out.append(f"  adx_min: {config['adx_min']}")
+        out.append(f"  require_fvg: {config['require_fvg']}")
+        out.append(f"  target_rr: {config['target_rr']}")
+        out.append(f"  cooldown_hours: {config['cooldown_hours']}")
+        out.append(f"\n  Expected Performance:")
+        out.append(f"    Trades: {config['total_trades']}")
+        out.append(f"    Win Rate: {config['win_rate']:.1f}%")
+        out.append(f"    Net Profit: ${config['net_profit']:.2f}")
+        out.append(f"    Return: {config['return_pct']:.2f}%")
+        out.append(f"    Max Loss Streak: {config['max_loss_streak']}")
+        out.append(f"    Sharpe Ratio: {config['sharpe']:.2f}")
+
+    out.append("\n" + "="*80)
+    out.append("Optimization Complete!")
+    out.append("="*80)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -3,9 +3,12 @@ Grid search optimizer for Enhanced Sniper Strategy.
 Tests multiple parameter combinations to find optimal configuration per forex pair.
 """
 
+import argparse
 import pandas as pd
 import numpy as np
 from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
 import sys
 import os
 from pathlib import Path
@@ -14,7 +17,45 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.app.services.enhanced_sniper_detector import EnhancedSniperDetector
-from backend.app.services.indicators import TechnicalIndicators
+from backend.app.services.backtest_sweep import find_exit
+from backend.app.services.indicators import TechnicalIndicators, cached_indicator_frame
+
+DATA_DIR = Path('data') / 'forex_raw'
+CACHE_DIR = Path('data') / 'forex_cache'
+
+# Prices are read as float32: ample precision for FX quotes, and half the
+# bytes for the exit scans to stream over
+PRICE_DTYPES = {'Open': 'float32', 'High': 'float32', 'Low': 'float32', 'Close': 'float32'}
+
+# Trade record layout for the preallocated trades buffer
+TRADE_DTYPE = [
+    ('entry_time', 'datetime64[ns]'),
+    ('exit_time', 'datetime64[ns]'),
+    ('direction', 'U4'),
+    ('entry_price', 'f8'),
+    ('exit_price', 'f8'),
+    ('stop_loss', 'f8'),
+    ('take_profit', 'f8'),
+    ('position_size', 'f8'),
+    ('profit', 'f8'),
+    ('actual_rr', 'f8'),
+    ('exit_reason', 'U11'),
+]
+
+def read_prepared(path: Path) -> pd.DataFrame:
+    """Parse one OHLCV CSV (Date renamed to time) and add all indicators."""
+    df = pd.read_csv(path, parse_dates=['Date'], dtype=PRICE_DTYPES)
+    # Rename Date to time for consistency
+    df.rename(columns={'Date': 'time'}, inplace=True)
+    return TechnicalIndicators.add_all_indicators(df)
+
+def load_prepared(path: Path) -> pd.DataFrame:
+    """read_prepared() memoized under CACHE_DIR until the CSV changes."""
+    return cached_indicator_frame(
+        path, CACHE_DIR,
+        {'dtypes': PRICE_DTYPES, 'date_column': 'time', 'indicators': 'add_all_indicators'},
+        lambda: read_prepared(path)
+    )
 
 def calculate_position_size(balance, risk_pct, entry_price, stop_loss, leverage=30):
     """Calculate position size based on risk parameters."""
@@ -29,11 +70,13 @@ def calculate_position_size(balance, risk_pct, entry_price, stop_loss, leverage=
 
     return min(units, max_units_by_leverage)
 
-def simulate_trade(df, entry_idx, entry_price, stop_loss, take_profit, spread=0.0006):
+def simulate_trade(highs, lows, closes, times, entry_idx, entry_price, stop_loss, take_profit, spread=0.0006):
     """
     Simulate trade execution with SL/TP.
+    Takes the base timeframe columns as NumPy arrays (extracted once per backtest).
     """
     is_buy = take_profit > entry_price
+    risk = abs(entry_price - stop_loss)
 
     # Adjust for spread
     if is_buy:
@@ -43,80 +86,95 @@ def simulate_trade(df, entry_idx, entry_price, stop_loss, take_profit, spread=0.
         actual_entry = entry_price - (entry_price * spread)
         actual_sl = stop_loss + (stop_loss * spread * 0.5)
 
-    # Iterate through subsequent candles
-    for i in range(entry_idx + 1, len(df)):
-        candle = df.iloc[i]
-
-        # Check SL first (conservative)
-        if is_buy:
-            if candle['Low'] <= actual_sl:
-                profit_per_unit = actual_sl - actual_entry
-                actual_rr = profit_per_unit / abs(entry_price - stop_loss)
-                return profit_per_unit, actual_rr, 'STOP_LOSS', candle['time'], actual_sl
-
-            if candle['High'] >= take_profit:
-                profit_per_unit = take_profit - actual_entry
-                actual_rr = profit_per_unit / abs(entry_price - stop_loss)
-                return profit_per_unit, actual_rr, 'TAKE_PROFIT', candle['time'], take_profit
-        else:
-            if candle['High'] >= actual_sl:
-                profit_per_unit = actual_entry - actual_sl
-                actual_rr = profit_per_unit / abs(entry_price - stop_loss)
-                return profit_per_unit, actual_rr, 'STOP_LOSS', candle['time'], actual_sl
-
-            if candle['Low'] <= take_profit:
-                profit_per_unit = actual_entry - take_profit
-                actual_rr = profit_per_unit / abs(entry_price - stop_loss)
-                return profit_per_unit, actual_rr, 'TAKE_PROFIT', candle['time'], take_profit
+    exit_idx, hit_tp = find_exit(highs, lows, entry_idx + 1, actual_sl, take_profit, is_buy)
+
+    if exit_idx >= 0:
+        if hit_tp:
+            profit_per_unit = (take_profit - actual_entry) if is_buy else (actual_entry - take_profit)
+            return profit_per_unit, profit_per_unit / risk, 'TAKE_PROFIT', times[exit_idx], take_profit
+        profit_per_unit = (actual_sl - actual_entry) if is_buy else (actual_entry - actual_sl)
+        return profit_per_unit, profit_per_unit / risk, 'STOP_LOSS', times[exit_idx], actual_sl
 
     # Trade still open at end of data
-    latest = df.iloc[-1]
+    last_close = closes[-1]
     if is_buy:
-        profit_per_unit = latest['Close'] - actual_entry
+        profit_per_unit = last_close - actual_entry
     else:
-        profit_per_unit = actual_entry - latest['Close']
+        profit_per_unit = actual_entry - last_close
+
+    return profit_per_unit, profit_per_unit / risk, 'OPEN', times[-1], last_close
 
-    actual_rr = profit_per_unit / abs(entry_price - stop_loss)
-    return profit_per_unit, actual_rr, 'OPEN', latest['time'], latest['Close']
+def align_htf(df_15m, df_1h, df_4h):
+    """
+    Position of the last 1h and 4h candle at or before each 15m candle,
+    resolved for every bar in one binary-search pass per timeframe.
+    """
+    base_times = df_15m['time']
+    return (
+        df_1h['time'].searchsorted(base_times, side='right') - 1,
+        df_4h['time'].searchsorted(base_times, side='right') - 1
+    )
 
-def run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread=0.0006):
+def run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread=0.0006, htf_alignment=None):
     """
     Run backtest with specific parameter configuration.
+
+    htf_alignment is align_htf() of the same frames; it does not depend on
+    the parameters, so grid searches compute it once and pass it in.
     """
     # Initialize detector with test parameters
-    detector = EnhancedSniperDetector(
-        symbol=symbol,
-        high_loss_hours=params.get('time_blocks', []),
-        use_squeeze=params.get('use_squeeze', False),
-        squeeze_threshold=params.get('squeeze_threshold', 1.5)
-    )
-    detector.target_rr = params.get('target_rr', 2.0)
+    detector = EnhancedSniperDetector()
+    detector_params = {
+        'high_loss_hours': params.get('time_blocks', []),
+        'use_squeeze': params.get('use_squeeze', False),
+        'squeeze_threshold': params.get('squeeze_threshold', 1.5)
+    }
 
-    trades = []
+    # At most one trade per bar, so len(df_15m) bounds the buffer
+    trades = np.empty(len(df_15m), dtype=TRADE_DTYPE)
+    n_trades = 0
     balance = 360.0  # Starting balance (AUD)
     risk_pct = 0.02
 
+    # Bind hot-loop lookups once instead of resolving them on every bar
+    analyze = detector.analyze_precomputed
+    target_rr = params.get('target_rr', 2.0)
+    base_times = df_15m['time']
+
+    # Raw columns for trade simulation, so it never touches rows via .iloc
+    highs = df_15m['High'].to_numpy()
+    lows = df_15m['Low'].to_numpy()
+    closes = df_15m['Close'].to_numpy()
+    times = base_times.to_numpy()
+
+    # Columns the detector reads, so each bar is evaluated by position
+    # instead of through DataFrames sliced up to it
+    base_cols = EnhancedSniperDetector.column_arrays(df_15m, EnhancedSniperDetector.BASE_COLUMNS)
+    htf_cols = EnhancedSniperDetector.column_arrays(df_1h, EnhancedSniperDetector.HTF_COLUMNS)
+    htf2_cols = EnhancedSniperDetector.column_arrays(df_4h, EnhancedSniperDetector.HTF2_COLUMNS)
+
+    # Align HTF data
+    if htf_alignment is None:
+        htf_alignment = align_htf(df_15m, df_1h, df_4h)
+    htf_positions, htf2_positions = htf_alignment
+
     # Walk-forward testing
     for i in range(220, len(df_15m)):
-        # Align HTF data
-        current_time = df_15m.iloc[i]['time']
-
-        htf_idx = df_1h['time'].searchsorted(current_time, side='right') - 1
+        htf_idx = htf_positions[i]
         if htf_idx < 60:
             continue
-        
-        htf2_idx = df_4h['time'].searchsorted(current_time, side='right') - 1
+
+        htf2_idx = htf2_positions[i]
         if htf2_idx < 200:
             continue
 
-        data = {
-            'base': df_15m.iloc[:i+1].copy(),
-            'htf': df_1h.iloc[:htf_idx+1].copy(),
-            'htf2': df_4h.iloc[:htf2_idx+1].copy()
-        }
+        current_time = base_times.iat[i]
 
         # Get signal from detector (Now fully configurable)
-        signal = detector.analyze(data, symbol=symbol, target_rr=detector.target_rr)
+        signal = analyze(
+            base_cols, i, htf_cols, htf_idx, htf2_cols, htf2_idx, current_time,
+            symbol, target_rr=target_rr, params=detector_params
+        )
 
         if signal is None:
             continue
@@ -132,25 +190,17 @@ def run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread=0.0006
             continue
 
         profit_per_unit, actual_rr, exit_reason, exit_time, exit_price = simulate_trade(
-            df_15m, i, entry_price, stop_loss, take_profit, spread
+            highs, lows, closes, times, i, entry_price, stop_loss, take_profit, spread
         )
 
         profit = profit_per_unit * position_size
         balance += profit
 
-        trades.append({
-            'entry_time': current_time,
-            'exit_time': exit_time,
-            'direction': signal['signal'],
-            'entry_price': entry_price,
-            'exit_price': exit_price,
-            'stop_loss': stop_loss,
-            'take_profit': take_profit,
-            'position_size': position_size,
-            'profit': profit,
-            'actual_rr': actual_rr,
-            'exit_reason': exit_reason
-        })
+        trades[n_trades] = (
+            current_time, exit_time, signal['signal'], entry_price, exit_price,
+            stop_loss, take_profit, position_size, profit, actual_rr, exit_reason
+        )
+        n_trades += 1
 
         # Check cooldown (Simple skip)
         cooldown_hours = params.get('cooldown_hours', 0)
@@ -161,10 +211,10 @@ def run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread=0.0006
             pass # (Simplified for now)
 
     # Calculate metrics
-    if len(trades) == 0:
+    if n_trades == 0:
         return None
 
-    trades_df = pd.DataFrame(trades)
+    trades_df = pd.DataFrame(trades[:n_trades])
 
     wins = trades_df[trades_df['exit_reason'] == 'TAKE_PROFIT']
     losses = trades_df[trades_df['exit_reason'] == 'STOP_LOSS']
@@ -180,15 +230,10 @@ def run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread=0.0006
     else:
         sharpe = 0
 
-    # Max consecutive losses
-    streak = 0
-    max_streak = 0
-    for _, trade in trades_df.iterrows():
-        if trade['exit_reason'] == 'STOP_LOSS':
-            streak += 1
-            max_streak = max(max_streak, streak)
-        else:
-            streak = 0
+    # Max consecutive losses: label each run of losses by the number of
+    # non-losses before it and take the largest run
+    is_loss = trades_df['exit_reason'].to_numpy() == 'STOP_LOSS'
+    max_streak = int(np.bincount(np.cumsum(~is_loss)[is_loss]).max()) if is_loss.any() else 0
 
     return {
         'total_trades': len(trades_df),
@@ -203,73 +248,50 @@ def run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread=0.0006
         **params
     }
 
-def optimize_symbol(symbol: str, spread: float = 0.0006):
+# Per-worker backtest inputs, set once by _init_grid_worker
+_grid_inputs = None
+
+def _init_grid_worker(symbol, df_15m, df_1h, df_4h):
+    """Process pool initializer: keep the symbol's frames and HTF alignment for every combination."""
+    global _grid_inputs
+    _grid_inputs = (symbol, df_15m, df_1h, df_4h, align_htf(df_15m, df_1h, df_4h))
+
+def _run_grid_combo(job):
+    params, spread = job
+    symbol, df_15m, df_1h, df_4h, htf_alignment = _grid_inputs
+    return run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread, htf_alignment)
+
+def load_symbol(symbol: str):
     """
-    Run grid search optimization for a forex pair.
+    15m, 1H and 4H frames of a forex pair with every column the backtest
+    reads, or None when its data is missing. Spread-independent, so a
+    multi-spread run loads once.
     """
-    print(f"\n{'='*70}")
-    print(f"OPTIMIZING ENHANCED SNIPER: {symbol}")
-    print(f"{'='*70}")
-
-    # Load data
     print("Loading data...")
+    # Frames come with indicators added, from the on-disk cache when the
+    # CSVs are unchanged since the last run
     try:
-        df_15m = pd.read_csv(f'data/forex_raw/{symbol}_15_Min.csv', parse_dates=['Date'])
-        df_1h = pd.read_csv(f'data/forex_raw/{symbol}_1_Hour.csv', parse_dates=['Date'])
-        df_4h = pd.read_csv(f'data/forex_raw/{symbol}_4_Hour.csv', parse_dates=['Date'])
-        
-        # Rename Date to time for consistency
-        for df in [df_15m, df_1h, df_4h]:
-            df.rename(columns={'Date': 'time'}, inplace=True)
-            
+        df_15m = load_prepared(DATA_DIR / f'{symbol}_15_Min.csv')
+        df_1h = load_prepared(DATA_DIR / f'{symbol}_1_Hour.csv')
+        df_4h = load_prepared(DATA_DIR / f'{symbol}_4_Hour.csv')
     except FileNotFoundError:
         print(f"❌ Data not found for {symbol}")
-        return
+        return None
+
+    # Rolling BB width floor used by the Cyclical casket filter, computed once
+    # over the whole series instead of per evaluated bar
+    df_15m['BB_Width_Min20'] = df_15m['BB_Width'].rolling(window=20).min()
 
-    # Add indicators
-    df_15m = TechnicalIndicators.add_all_indicators(df_15m)
-    df_1h = TechnicalIndicators.add_all_indicators(df_1h)
-    df_4h = TechnicalIndicators.add_all_indicators(df_4h)
-    
     # Ensure SMA200 for 4H
     if 'SMA200' not in df_4h.columns:
         df_4h['SMA200'] = df_4h['Close'].rolling(window=200).mean()
 
     print(f"✅ Loaded {len(df_15m)} 15m candles, {len(df_1h)} 1H candles, {len(df_4h)} 4H candles")
 
-    # Define parameter grid
-    param_grid = {
-        'target_rr': [1.5, 2.0, 2.5],
-        'squeeze_threshold': [1.3, 1.5, 1.8],
-        'use_squeeze': [True, False],
-        'cooldown_hours': [0, 4],
-        'time_blocks': [
-            [],           
-            [0, 9, 14, 15],  # Specific to AUD_USD findings
-            [8, 9, 10, 14, 15, 16], # Broader filter
-        ]
-    }
-
-    keys = list(param_grid.keys())
-    values = list(param_grid.values())
-
-    combinations = [dict(zip(keys, v)) for v in product(*values)]
-    total_combos = len(combinations)
-
-    print(f"\n🔍 Testing {total_combos} parameter combinations...")
-    print(f"Expected runtime: ~{total_combos * 1.5 // 60} minutes\n")
-
-    results = []
-
-    for idx, params in enumerate(combinations, 1):
-        if idx % 10 == 0:
-            print(f"Progress: {idx}/{total_combos} ({idx/total_combos*100:.1f}%)")
-
-        result = run_backtest_with_params(symbol, df_15m, df_1h, df_4h, params, spread)
-
-        if result is not None and result['total_trades'] >= 10:  # Minimum 10 trades
-            results.append(result)
+    return df_15m, df_1h, df_4h
 
+def report_results(symbol: str, results: list, output_path: str):
+    """Save one grid's results to output_path and print its top 10."""
     if len(results) == 0:
         print("❌ No valid configurations found (all had < 10 trades)")
         return
@@ -279,7 +301,6 @@ def optimize_symbol(symbol: str, spread: float = 0.0006):
     results_df = results_df.sort_values(['return_pct', 'win_rate', 'sharpe'], ascending=[False, False, False])
 
     # Save full results
-    output_path = f'data/optimization_results_{symbol}_enhanced.csv'
     results_df.to_csv(output_path, index=False)
     print(f"\n✅ Full results saved to: {output_path}")
 
@@ -309,11 +330,72 @@ def optimize_symbol(symbol: str, spread: float = 0.0006):
         print(f"  - Time Blocks:       {row['time_blocks']}")
         print()
 
+def optimize_symbol(symbol: str, spreads=(0.0006,)):
+    """
+    Run grid search optimization for a forex pair at each spread in `spreads`.
+
+    Data is loaded and handed to the worker processes once; every spread
+    then reruns only the grid. A single spread saves to
+    optimization_results_{symbol}_enhanced.csv, several to one file per
+    spread.
+    """
+    print(f"\n{'='*70}")
+    print(f"OPTIMIZING ENHANCED SNIPER: {symbol}")
+    print(f"{'='*70}")
+
+    frames = load_symbol(symbol)
+    if frames is None:
+        return
+
+    # Define parameter grid
+    param_grid = {
+        'target_rr': [1.5, 2.0, 2.5],
+        'squeeze_threshold': [1.3, 1.5, 1.8],
+        'use_squeeze': [True, False],
+        'cooldown_hours': [0, 4],
+        'time_blocks': [
+            [],           
+            [0, 9, 14, 15],  # Specific to AUD_USD findings
+            [8, 9, 10, 14, 15, 16], # Broader filter
+        ]
+    }
+
+    keys = list(param_grid.keys())
+    values = list(param_grid.values())
+
+    combinations = [dict(zip(keys, v)) for v in product(*values)]
+    total_combos = len(combinations)
+
+    print(f"\n🔍 Testing {total_combos} parameter combinations at {len(spreads)} spread(s)...")
+    print(f"Expected runtime: ~{total_combos * 1.5 // 60} minutes\n")
+
+    # Combinations are independent CPU-bound backtests: run them across all
+    # cores, handing each worker the indicator frames once at start-up
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_grid_worker,
+        initargs=(symbol, *frames)
+    ) as executor:
+        for spread in spreads:
+            jobs = [(params, spread) for params in combinations]
+            results = []
+            progress = tqdm(executor.map(_run_grid_combo, jobs, chunksize=4), total=total_combos,
+                            desc=f"{symbol} @ {spread:g}")
+            for result in progress:
+                if result is not None and result['total_trades'] >= 10:  # Minimum 10 trades
+                    results.append(result)
+
+            if len(spreads) == 1:
+                output_path = f'data/optimization_results_{symbol}_enhanced.csv'
+            else:
+                output_path = f'data/optimization_results_{symbol}_enhanced_spread{spread:g}.csv'
+            report_results(symbol, results, output_path)
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python optimize_enhanced_sniper.py <SYMBOL>")
-        print("Example: python optimize_enhanced_sniper.py AUD_USD")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Enhanced Sniper grid search optimizer")
+    parser.add_argument("symbol", help="Forex pair to optimize (e.g. AUD_USD)")
+    parser.add_argument("--spreads", default="0.0006",
+                        help="Comma-separated spreads to test, loading the data once (e.g. 0.0004,0.0006,0.0008)")
+    args = parser.parse_args()
 
-    symbol = sys.argv[1]
-    optimize_symbol(symbol, spread=0.0006)
+    optimize_symbol(args.symbol, spreads=[float(s) for s in args.spreads.split(',')])
@@ -0,0 +1,197 @@
+"""
+ASX Strategy Backtests - All Strategies
+
+Backtests trend following, mean reversion and Triple Trend over the ASX
+universe in one run. Every stock CSV is read and indicator-enriched once
+(through the screener's indicator cache); indicators are additive columns,
+so the same frames feed all three detectors.
+
+Output (per strategy, in data/backtests/):
+  backtest_<strategy>_metrics.json  — PerformanceMetrics.to_dict()
+  backtest_<strategy>_trades.json   — closed trades
+  backtest_<strategy>_equity.parquet — daily equity curve (.csv without pyarrow)
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from datetime import datetime, timedelta
+from operator import attrgetter
+from pathlib import Path
+
+import pandas as pd
+from tqdm import tqdm
+
+# orjson serializes several times faster; fall back to pandas' writer if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parquet stores the equity curve's dates and floats in binary; needs pyarrow
+try:
+    import pyarrow  # noqa: F401
+    EQUITY_FORMAT = "parquet"
+except ImportError:
+    EQUITY_FORMAT = "csv"
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.app.config import settings
+from backend.app.services.backtester import Backtester, ClosedTrade
+from backend.app.services.backtest_metrics import PerformanceMetrics
+from backend.app.services.indicators import (
+    TechnicalIndicators, cached_indicator_frame, downcast_floats, load_price_csv
+)
+from backend.app.services.mean_reversion_detector import MeanReversionDetector
+from backend.app.services.screener import INDICATOR_PARAMS
+from backend.app.services import stock_list
+from backend.app.services.signal_detector import SignalDetector
+from backend.app.services.triple_trend_detector import TripleTrendDetector
+
+OUTPUT_DIR = settings.DATA_DIR / 'backtests'
+CACHE_DIR = settings.DATA_DIR / 'indicator_cache'
+MIN_DATA_ROWS = 200      # Minimum rows required (~1 year)
+
+TRADE_COLUMNS = [field.name for field in fields(ClosedTrade)]
+TRADE_ROUNDING = {
+    'entry_price': 2, 'exit_price': 2, 'pnl': 2, 'pnl_pct': 2, 'entry_score': 1,
+    'entry_adx': 1, 'entry_di_plus': 1, 'entry_di_minus': 1,
+    'entry_rsi': 1, 'entry_bb_upper': 2, 'entry_bb_middle': 2,
+}
+
+
+def load_stock_list():
+    """Load stock list from metadata file."""
+    stock_list_file = settings.METADATA_DIR / 'stock_list.json'
+
+    if not stock_list_file.exists():
+        print(f"Error: Stock list file not found at {stock_list_file}")
+        sys.exit(1)
+
+    return stock_list.load_stock_list(stock_list_file)
+
+
+def load_stock(csv_path: Path) -> pd.DataFrame:
+    """
+    Load one stock CSV with all indicators (same cache and params as the
+    screener), held as float32 for the duration of the backtests.
+    """
+    return downcast_floats(cached_indicator_frame(
+        csv_path, CACHE_DIR, INDICATOR_PARAMS,
+        lambda: TechnicalIndicators.add_all_indicators(load_price_csv(csv_path), **INDICATOR_PARAMS)
+    ))
+
+
+def load_all_stocks(tickers):
+    """Load and enrich every available stock once, in parallel."""
+    paths = {t: settings.RAW_DATA_DIR / f"{t}.csv" for t in tickers}
+    paths = {t: p for t, p in paths.items() if p.exists()}
+
+    stock_data = {}
+    with ProcessPoolExecutor() as executor:
+        frames = executor.map(load_stock, paths.values(), chunksize=8)
+        for ticker, df in tqdm(zip(paths, frames), total=len(paths), desc="Loading stocks"):
+            if len(df) >= MIN_DATA_ROWS:
+                stock_data[ticker] = df
+    return stock_data
+
+
+def save_trades(trades, path: Path):
+    """Write closed trades as JSON records, formatting and rounding whole columns at once."""
+    # ClosedTrade uses __slots__ (no instance __dict__): read fields as row tuples
+    df = pd.DataFrame(list(map(attrgetter(*TRADE_COLUMNS), trades)), columns=TRADE_COLUMNS)
+    for col in ('entry_date', 'exit_date'):
+        df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%d')
+    df = df.round(TRADE_ROUNDING)
+
+    if orjson is not None:
+        # orjson writes NaN (trades without indicator fields) as null
+        path.write_bytes(orjson.dumps(df.to_dict('records'), option=orjson.OPT_INDENT_2))
+    else:
+        df.to_json(path, orient='records', indent=2)
+
+
+def save_equity_curve(equity_curve: pd.DataFrame, path: Path):
+    """Write the equity curve as Parquet, or as CSV when pyarrow is missing."""
+    path = path.with_suffix(f".{EQUITY_FORMAT}")
+    if EQUITY_FORMAT == "parquet":
+        equity_curve.to_parquet(path, index=False, compression='zstd')
+    else:
+        equity_curve.to_csv(path, index=False, date_format='%Y-%m-%d')
+
+
+def build_detectors():
+    """Strategy name -> detector, configured as in the live screener."""
+    return {
+        'trend_following': SignalDetector(
+            adx_threshold=settings.ADX_THRESHOLD,
+            profit_target=settings.PROFIT_TARGET,
+            sma_period=settings.SMA_PERIOD,
+            volume_filter_enabled=settings.VOLUME_FILTER_ENABLED,
+            volume_multiplier=settings.VOLUME_MULTIPLIER
+        ),
+        'mean_reversion': MeanReversionDetector(
+            rsi_threshold=settings.RSI_THRESHOLD,
+            profit_target=settings.MEAN_REVERSION_PROFIT_TARGET,
+            stop_loss=settings.MEAN_REVERSION_STOP_LOSS,
+            time_limit=settings.MEAN_REVERSION_TIME_LIMIT,
+            bb_period=settings.BB_PERIOD,
+            bb_std_dev=settings.BB_STD_DEV,
+            rsi_period=settings.RSI_PERIOD,
+            volume_filter_enabled=settings.VOLUME_FILTER_ENABLED,
+            volume_multiplier=settings.VOLUME_MULTIPLIER
+        ),
+        'triple_trend': TripleTrendDetector(
+            fib_period=50,
+            st_factor=3.0,
+            it_alpha=0.07,
+            profit_target=settings.PROFIT_TARGET,
+            stop_loss=settings.TREND_FOLLOWING_STOP_LOSS,
+            time_limit=settings.TREND_FOLLOWING_TIME_LIMIT
+        ),
+    }
+
+
+def main():
+    """Main backtest routine."""
+    detectors = build_detectors()
+
+    today = datetime.now()
+    parser = argparse.ArgumentParser(description='Backtest all ASX strategies on shared data')
+    parser.add_argument('--start', default=(today - timedelta(days=365)).strftime('%Y-%m-%d'),
+                        help='Backtest start date (default: one year ago)')
+    parser.add_argument('--end', default=today.strftime('%Y-%m-%d'),
+                        help='Backtest end date (default: today)')
+    parser.add_argument('--capital', type=float, default=100000.0, help='Initial capital')
+    parser.add_argument('--strategies', nargs='+', choices=list(detectors), default=list(detectors),
+                        help='Strategies to run (default: all)')
+    args = parser.parse_args()
+
+    stocks = load_stock_list()
+    stock_data = load_all_stocks([s['ticker'] for s in stocks])
+    print(f"Loaded {len(stock_data)}/{len(stocks)} stocks with at least {MIN_DATA_ROWS} rows")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    for name in args.strategies:
+        print("\n" + "=" * 60)
+        print(f"STRATEGY: {name}")
+        print("=" * 60)
+
+        backtester = Backtester(detectors[name], args.start, args.end, initial_capital=args.capital)
+        results = backtester.run(stock_data)
+        metrics = PerformanceMetrics(results.trades, results.equity_curve, results.initial_capital)
+        metrics.print_summary()
+
+        with open(OUTPUT_DIR / f"backtest_{name}_metrics.json", 'w') as f:
+            json.dump(metrics.to_dict(), f, indent=2, default=str)
+        save_trades(results.trades, OUTPUT_DIR / f"backtest_{name}_trades.json")
+        save_equity_curve(results.equity_curve, OUTPUT_DIR / f"backtest_{name}_equity")
+
+    print(f"\nResults saved to: {OUTPUT_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,13 +16,26 @@ Usage:
 
 import sys
 import os
+import runpy
 import subprocess
 import signal
+import threading
 import time
 import webbrowser
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
+# Exit status bits and forex budget of the screener pipeline
+from backend.app.services.pipeline_status import (
+    FOREX_FAILED as PIPELINE_FOREX_FAILED,
+    FOREX_TIMED_OUT as PIPELINE_FOREX_TIMED_OUT,
+    FOREX_TIMEOUT as PIPELINE_FOREX_TIMEOUT,
+    STOCKS_FAILED as PIPELINE_STOCKS_FAILED,
+)
+
 
 # ============================================================
 # CONFIGURATION
@@ -34,8 +47,18 @@ BACKEND_PORT = 8000
 FRONTEND_PORT = 5173
 BACKEND_HEALTH_URL = f"http://localhost:{BACKEND_PORT}/health"
 FRONTEND_URL = f"http://localhost:{FRONTEND_PORT}"
+SIGNALS_FILE = PROJECT_ROOT / 'data' / 'processed' / 'signals.json'
+STOCK_LIST_SOURCE = PROJECT_ROOT / 'data' / 'metadata' / 'asx300_source.json'
+BACKEND_DIR = PROJECT_ROOT / 'backend'
+VENV_DIR = BACKEND_DIR / 'venv'
+# Interpreter of the backend venv, used for every child process
+if sys.platform == 'win32':
+    VENV_PYTHON = VENV_DIR / 'Scripts' / 'python.exe'
+else:
+    VENV_PYTHON = VENV_DIR / 'bin' / 'python3'
 HEALTH_CHECK_TIMEOUT = 240  # seconds
-HEALTH_CHECK_INTERVAL = 1  # seconds
+HEALTH_CHECK_INTERVAL = 1  # seconds, max delay between probes
+HEALTH_CHECK_MIN_INTERVAL = 0.05  # seconds, first retry delay
 
 
 # ============================================================
@@ -44,6 +67,7 @@ HEALTH_CHECK_INTERVAL = 1  # seconds
 
 backend_process = None
 frontend_process = None
+output_threads = []  # Threads forwarding the servers' output
 
 
 # ============================================================
@@ -106,15 +130,9 @@ def check_prerequisites():
     errors = []
 
     # Check backend venv
-    venv_dir = PROJECT_ROOT / 'backend' / 'venv'
-    if sys.platform == 'win32':
-        venv_python = venv_dir / 'Scripts' / 'python.exe'
-    else:
-        venv_python = venv_dir / 'bin' / 'python3'
-
-    if not venv_python.exists():
+    if not VENV_PYTHON.exists():
         errors.append(
-            f"Backend virtual environment not found at: {venv_dir}\n"
+            f"Backend virtual environment not found at: {VENV_DIR}\n"
             f"  To create it, run:\n"
             f"    cd backend\n"
             f"    python3 -m venv venv\n"
@@ -160,19 +178,89 @@ def get_active_tickers():
     except Exception:
         return set()
 
+@dataclass
+class StartupState:
+    """
+    One sweep of the stock data: the active tickers and the mtime of every
+    raw CSV that belongs to them.
+    """
+    tickers: Set[str]
+    mtimes: Dict[Path, float]
+
+    @classmethod
+    def scan(cls):
+        """Load the stock list once and scan data/raw once."""
+        data_dir = PROJECT_ROOT / 'data' / 'raw'
+        tickers = get_active_tickers()
+
+        # scandir gives names and file types without a Path or stat per entry;
+        # only the relevant files are stat'ed, once each
+        mtimes = {}
+        if data_dir.exists():
+            with os.scandir(data_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.csv') or not entry.is_file():
+                        continue
+                    if tickers and entry.name[:-4] not in tickers:
+                        continue
+                    mtimes[data_dir / entry.name] = entry.stat().st_mtime
+        return cls(tickers, mtimes)
+
+    @property
+    def files(self) -> List[Path]:
+        return list(self.mtimes)
+
+    @property
+    def oldest_mtime(self) -> Optional[float]:
+        return min(self.mtimes.values(), default=None)
+
+    @property
+    def newest_mtime(self) -> Optional[float]:
+        return max(self.mtimes.values(), default=None)
+
+
+# Shared by every startup step; reset whenever the stock list or the raw
+# data may have changed
+_startup_state: Optional[StartupState] = None
+
+
+def get_startup_state() -> StartupState:
+    """The current StartupState, scanning only if it was reset."""
+    global _startup_state
+    if _startup_state is None:
+        _startup_state = StartupState.scan()
+    return _startup_state
+
+
+def reset_startup_state():
+    """Forget the last scan, e.g. after a download rewrote data/raw."""
+    global _startup_state
+    _startup_state = None
+
+
 def get_relevant_csv_files():
     """Get CSV files in raw data directory that belong to the active stock list."""
-    data_dir = PROJECT_ROOT / 'data' / 'raw'
-    if not data_dir.exists():
-        return []
-    
-    active_tickers = get_active_tickers()
-    csv_files = list(data_dir.glob('*.csv'))
-    
-    if not active_tickers:
-        return csv_files
-        
-    return [f for f in csv_files if f.stem in active_tickers]
+    return get_startup_state().files
+
+def signals_up_to_date():
+    """
+    Check whether the stock signals were generated after their inputs last changed.
+
+    The inputs are the relevant raw CSVs and the ASX 300 source list that
+    stock_list.json is generated from.
+    """
+    if not SIGNALS_FILE.exists():
+        return False
+    try:
+        state = get_startup_state()
+        if not state.files:
+            return False
+        inputs_mtime = state.newest_mtime
+        if STOCK_LIST_SOURCE.exists():
+            inputs_mtime = max(inputs_mtime, STOCK_LIST_SOURCE.stat().st_mtime)
+        return SIGNALS_FILE.stat().st_mtime >= inputs_mtime
+    except OSError:
+        return False
 
 def check_data_freshness():
     """
@@ -186,14 +274,13 @@ def check_data_freshness():
     Returns:
         bool: True if data needs updating, False otherwise
     """
-    relevant_files = get_relevant_csv_files()
-    if not relevant_files:
-        return True
-
     # Check age of oldest relevant file
     try:
-        oldest_file = min(relevant_files, key=lambda f: f.stat().st_mtime)
-        age_seconds = time.time() - oldest_file.stat().st_mtime
+        state = get_startup_state()
+        if not state.files:
+            return True
+
+        age_seconds = time.time() - state.oldest_mtime
         age_days = age_seconds / 86400
 
         return age_days > DATA_FRESHNESS_DAYS
@@ -210,16 +297,10 @@ def download_forex_data():
     if not forex_script.exists():
         return
 
-    # Get venv python path
-    if sys.platform == 'win32':
-        venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'Scripts' / 'python.exe'
-    else:
-        venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'bin' / 'python3'
-
     try:
         print_info("Updating forex/commodity data (Incremental)...")
         subprocess.run(
-            [str(venv_python), str(forex_script)],
+            [str(VENV_PYTHON), str(forex_script)],
             cwd=str(PROJECT_ROOT),
             check=True,
             timeout=120,
@@ -242,16 +323,10 @@ def download_data():
         print_error(f"Download script not found: {download_script}")
         sys.exit(1)
 
-    # Get venv python path
-    if sys.platform == 'win32':
-        venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'Scripts' / 'python.exe'
-    else:
-        venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'bin' / 'python3'
-
     try:
         # 1. Download Stocks
         subprocess.run(
-            [str(venv_python), str(download_script)],
+            [str(VENV_PYTHON), str(download_script)],
             cwd=str(PROJECT_ROOT),
             check=True,
             timeout=480,
@@ -269,66 +344,95 @@ def download_data():
     except KeyboardInterrupt:
         print_warning("\nData download interrupted")
         sys.exit(1)
+    finally:
+        reset_startup_state()
 
 
 # ============================================================
 # BACKEND SERVER MANAGEMENT
 # ============================================================
 
-def run_screener():
+def run_screener(stocks=True):
     """
     Run the stock and forex screeners to generate fresh signals.
+
+    Both screeners run in one app.services.run_startup_pipeline process, so
+    the backend stack is imported once. With stocks=False only the forex
+    refresh runs.
     """
-    # Get venv python path
-    if sys.platform == 'win32':
-        venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'Scripts' / 'python.exe'
-    else:
-        venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'bin' / 'python3'
-        
-    # --- STOCK SCREENER ---
-    print_info("Running stock screener to generate fresh signals...")
-    
-    # Update stock list from our ASX 300 source
-    print_info("Updating ASX 300 stock list...")
-    list_generator = PROJECT_ROOT / 'scripts' / 'generate_asx300_list.py'
-    try:
-        subprocess.run([str(venv_python), str(list_generator)], check=True)
-    except Exception as e:
-        print_warning(f"Could not update stock list: {e}")
+    skip_stocks = True
+    if stocks:
+        # --- STOCK SCREENER ---
+        print_info("Running stock screener to generate fresh signals...")
+
+        # Update stock list from our ASX 300 source
+        print_info("Updating ASX 300 stock list...")
+        list_generator = PROJECT_ROOT / 'scripts' / 'generate_asx300_list.py'
+        try:
+            # The generator only needs the standard library, so run it in this
+            # interpreter rather than paying for another Python start-up
+            runpy.run_path(str(list_generator), run_name='__main__')
+        except Exception as e:
+            print_warning(f"Could not update stock list: {e}")
+        finally:
+            reset_startup_state()
 
-    try:
-        # Run the screener module as a module (-m), not a script
-        env = os.environ.copy()
-        env['PYTHONPATH'] = str(PROJECT_ROOT / 'backend')
-        
-        subprocess.run(
-            [str(venv_python), '-m', 'app.services.screener'],
-            cwd=str(PROJECT_ROOT / 'backend'),
-            env=env,
-            check=True
-        )
-        print_success("Stock screener completed successfully")
-    except Exception as e:
-        print_error(f"Stock screener failed: {e}")
+        # Signals only change when the stock data or the stock list does
+        skip_stocks = signals_up_to_date()
+        if skip_stocks:
+            print_info("Stock signals are newer than the stock data - skipping stock screener")
 
     # --- FOREX SCREENER ---
     print_info("Running forex/commodity screener (with auto-trade check)...")
+
+    cmd = [str(VENV_PYTHON), '-m', 'app.services.run_startup_pipeline', '--forex-mode', 'dynamic']
+    if skip_stocks:
+        cmd.append('--skip-stocks')
+    env = os.environ.copy()
+    env['PYTHONPATH'] = str(BACKEND_DIR)
     try:
-        trigger_script = PROJECT_ROOT / 'scripts' / 'trigger_forex_refresh.py'
-        
-        if trigger_script.exists():
-            cmd = [str(venv_python), str(trigger_script), "dynamic"]
-            env = os.environ.copy()
-            env['PYTHONPATH'] = str(PROJECT_ROOT / 'backend')
-
-            subprocess.run(cmd, cwd=str(PROJECT_ROOT / 'backend'), env=env, check=True, timeout=300)
-            print_success("Forex refresh and auto-trade check completed")
-        else:
-            print_warning(f"Forex screener script not found: {trigger_script} — skipping")
-    except subprocess.TimeoutExpired:
-        print_warning("Forex screener timed out after 300s — continuing...")
+        status = subprocess.run(cmd, cwd=str(BACKEND_DIR), env=env).returncode
     except Exception as e:
-        print_error(f"Forex refresh task failed: {e}")
+        print_error(f"Screener pipeline failed to start: {e}")
+        return
+
+    known_bits = PIPELINE_STOCKS_FAILED | PIPELINE_FOREX_FAILED | PIPELINE_FOREX_TIMED_OUT
+    if status < 0 or status & ~known_bits:
+        print_error(f"Screener pipeline failed (exit code {status})")
+        return
+
+    if not skip_stocks:
+        if status & PIPELINE_STOCKS_FAILED:
+            print_error("Stock screener failed")
+        else:
+            print_success("Stock screener completed successfully")
+
+    if status & PIPELINE_FOREX_TIMED_OUT:
+        print_warning(f"Forex screener timed out after {PIPELINE_FOREX_TIMEOUT}s — continuing...")
+    elif status & PIPELINE_FOREX_FAILED:
+        print_error("Forex refresh task failed")
+    else:
+        print_success("Forex refresh and auto-trade check completed")
+
+def _forward_output(process, name):
+    """
+    Copy a server's combined stdout/stderr to our stdout, one prefixed line
+    at a time, from a daemon thread.
+
+    The child writes into its own pipe, so it never blocks on the terminal
+    directly and the two servers' lines don't interleave mid-line.
+    """
+    prefix = f"[{name}] "
+
+    def _pump():
+        for line in process.stdout:
+            sys.stdout.write(prefix + line)
+            sys.stdout.flush()
+
+    thread = threading.Thread(target=_pump, name=f"{name}-output", daemon=True)
+    thread.start()
+    output_threads.append(thread)
+
 
 def start_backend():
     """
@@ -338,16 +442,8 @@ def start_backend():
     """
     global backend_process
 
-    backend_dir = PROJECT_ROOT / 'backend'
-
-    # Get venv python path
-    if sys.platform == 'win32':
-        venv_python = backend_dir / 'venv' / 'Scripts' / 'python.exe'
-    else:
-        venv_python = backend_dir / 'venv' / 'bin' / 'python3'
-
     cmd = [
-        str(venv_python),
+        str(VENV_PYTHON),
         '-u', # Force unbuffered stdout
         '-m', 'uvicorn',
         'app.main:app',
@@ -358,12 +454,14 @@ def start_backend():
     try:
         backend_process = subprocess.Popen(
             cmd,
-            cwd=str(backend_dir),
-            stdout=sys.stdout, # Pipe directly to console
-            stderr=sys.stderr, # Pipe directly to console
+            cwd=str(BACKEND_DIR),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            bufsize=0 # Unbuffered
+            errors='replace',
+            bufsize=1 # Line buffered
         )
+        _forward_output(backend_process, 'backend')
         print_info(f"Backend server starting on port {BACKEND_PORT}...")
 
     except Exception as e:
@@ -371,36 +469,48 @@ def start_backend():
         sys.exit(1)
 
 
-def wait_for_backend():
+def _wait_http(url, label, process=None, timeout=HEALTH_CHECK_TIMEOUT):
     """
-    Wait for backend to be ready by polling the health endpoint.
+    Poll url until it answers 200 or timeout seconds have passed.
 
-    Polls /health endpoint until successful response or timeout.
+    Backs off exponentially from HEALTH_CHECK_MIN_INTERVAL up to
+    HEALTH_CHECK_INTERVAL, so a server that comes up quickly is noticed
+    within tens of milliseconds. Gives up early if process has exited.
+    Returns True once ready, False otherwise. Prints nothing, so several
+    probes can run at once.
     """
     import urllib.request
     import urllib.error
     start_time = time.time()
-    attempt = 0
+    delay = HEALTH_CHECK_MIN_INTERVAL
 
     while True:
-        elapsed = time.time() - start_time
-        if elapsed > HEALTH_CHECK_TIMEOUT:
-            print_error(f"Backend failed to start within {HEALTH_CHECK_TIMEOUT} seconds")
-            if backend_process:
-                backend_process.terminate()
-            sys.exit(1)
-
         try:
-            with urllib.request.urlopen(BACKEND_HEALTH_URL, timeout=2) as response:
+            with urllib.request.urlopen(url, timeout=2) as response:
                 if response.status == 200:
-                    print_success(f"Backend ready on http://localhost:{BACKEND_PORT}")
-                    break
+                    return True
         except (urllib.error.URLError, OSError):
             pass
 
-        attempt += 1
-        print(f"  Waiting for backend... ({attempt}/{HEALTH_CHECK_TIMEOUT})", end='\r')
-        time.sleep(HEALTH_CHECK_INTERVAL)
+        if process is not None and process.poll() is not None:
+            return False
+
+        elapsed = time.time() - start_time
+        if elapsed > timeout:
+            return False
+
+        time.sleep(min(delay, max(timeout - elapsed, 0)))
+        delay = min(delay * 2, HEALTH_CHECK_INTERVAL)
+
+
+def wait_for_backend():
+    """
+    Wait for backend to be ready by polling the health endpoint.
+
+    Polls /health endpoint until successful response or timeout.
+    Returns True once it answers, False if it exited or timed out.
+    """
+    return _wait_http(BACKEND_HEALTH_URL, 'backend', backend_process)
 
 
 # ============================================================
@@ -423,11 +533,13 @@ def start_frontend():
         frontend_process = subprocess.Popen(
             cmd,
             cwd=str(frontend_dir),
-            stdout=sys.stdout,
-            stderr=sys.stderr,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            bufsize=0
+            errors='replace',
+            bufsize=1
         )
+        _forward_output(frontend_process, 'frontend')
         print_info(f"Frontend server starting on port {FRONTEND_PORT}...")
 
     except Exception as e:
@@ -442,33 +554,9 @@ def wait_for_frontend():
     Wait for frontend to be ready.
 
     Polls the frontend URL until successful response or timeout.
+    Returns True once it answers, False if it exited or timed out.
     """
-    import urllib.request
-    import urllib.error
-    start_time = time.time()
-    attempt = 0
-
-    while True:
-        elapsed = time.time() - start_time
-        if elapsed > HEALTH_CHECK_TIMEOUT:
-            print_error(f"Frontend failed to start within {HEALTH_CHECK_TIMEOUT} seconds")
-            if frontend_process:
-                frontend_process.terminate()
-            if backend_process:
-                backend_process.terminate()
-            sys.exit(1)
-
-        try:
-            with urllib.request.urlopen(FRONTEND_URL, timeout=2) as response:
-                if response.status == 200:
-                    print_success(f"Frontend ready on {FRONTEND_URL}")
-                    break
-        except (urllib.error.URLError, OSError):
-            pass
-
-        attempt += 1
-        print(f"  Waiting for frontend... ({attempt}/{HEALTH_CHECK_TIMEOUT})", end='\r')
-        time.sleep(HEALTH_CHECK_INTERVAL)
+    return _wait_http(FRONTEND_URL, 'frontend', frontend_process)
 
 
 # ============================================================
@@ -479,17 +567,21 @@ def open_browser():
     """
     Open the default browser to the frontend URL.
 
-    Waits 2 seconds for servers to stabilize before opening.
+    Runs in a daemon thread that waits 2 seconds for servers to stabilize,
+    so the startup summary is printed without waiting on the browser.
     """
-    time.sleep(2)  # Give servers time to stabilize
+    def _open():
+        time.sleep(2)  # Give servers time to stabilize
 
-    try:
-        print_info(f"Opening browser to {FRONTEND_URL}...")
-        webbrowser.open(FRONTEND_URL)
-        print_success("Browser opened")
-    except Exception as e:
-        print_warning(f"Could not open browser automatically: {e}")
-        print_info(f"Please open manually: {FRONTEND_URL}")
+        try:
+            print_info(f"Opening browser to {FRONTEND_URL}...")
+            webbrowser.open(FRONTEND_URL)
+            print_success("Browser opened")
+        except Exception as e:
+            print_warning(f"Could not open browser automatically: {e}")
+            print_info(f"Please open manually: {FRONTEND_URL}")
+
+    threading.Thread(target=_open, daemon=True).start()
 
 
 # ============================================================
@@ -523,6 +615,10 @@ def signal_handler(signum, frame):
         except subprocess.TimeoutExpired:
             frontend_process.kill()
 
+    # Let the last lines the servers wrote reach the terminal
+    for thread in output_threads:
+        thread.join(timeout=1)
+
     print_success("All servers stopped")
     print("  Goodbye!\n")
     sys.exit(0)
@@ -537,13 +633,12 @@ def print_startup_summary():
     Print final startup summary with all relevant information.
     """
     # Get data stats
-    relevant_files = get_relevant_csv_files()
-    csv_count = len(relevant_files)
+    state = get_startup_state()
+    csv_count = len(state.files)
 
     # Get last update time
     if csv_count > 0:
-        oldest_file = min(relevant_files, key=lambda f: f.stat().st_mtime)
-        age_seconds = time.time() - oldest_file.stat().st_mtime
+        age_seconds = time.time() - state.oldest_mtime
         age_days = int(age_seconds / 86400)
         data_age = f"{age_days} day{'s' if age_days != 1 else ''} ago"
     else:
@@ -610,14 +705,14 @@ def main():
         run_forex = False
 
     if scan_stocks:
-        relevant_files = get_relevant_csv_files()
+        state = get_startup_state()
+        relevant_files = state.files
         if not relevant_files:
             print_warning("No active stock data found. Performing full initial download...")
         else:
             now = time.time()
-            stale = [f for f in relevant_files if (now - f.stat().st_mtime) / 86400 > 1]
-            newest_file = max(relevant_files, key=lambda f: f.stat().st_mtime)
-            newest_age = int((now - newest_file.stat().st_mtime) / 86400)
+            stale = [f for f, mtime in state.mtimes.items() if (now - mtime) / 86400 > 1]
+            newest_age = int((now - state.newest_mtime) / 86400)
             if stale:
                 print_info(f"{len(stale)} of {len(relevant_files)} stock files need updating (newest is {newest_age}d old)...")
             else:
@@ -633,42 +728,47 @@ def main():
     if scan_stocks:
         run_screener()
     elif run_forex:
-        print_info("Running forex screener (with auto-trade check)...")
-        if sys.platform == 'win32':
-            venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'Scripts' / 'python.exe'
-        else:
-            venv_python = PROJECT_ROOT / 'backend' / 'venv' / 'bin' / 'python3'
-        try:
-            trigger_script = PROJECT_ROOT / 'scripts' / 'trigger_forex_refresh.py'
-            if trigger_script.exists():
-                env = os.environ.copy()
-                env['PYTHONPATH'] = str(PROJECT_ROOT / 'backend')
-                subprocess.run(
-                    [str(venv_python), str(trigger_script), "dynamic"],
-                    cwd=str(PROJECT_ROOT / 'backend'),
-                    env=env,
-                    check=True,
-                    timeout=300,
-                )
-                print_success("Forex refresh and auto-trade check completed")
-            else:
-                print_warning(f"Forex screener script not found: {trigger_script} — skipping")
-        except subprocess.TimeoutExpired:
-            print_warning("Forex screener timed out after 300s — continuing...")
-        except Exception as e:
-            print_error(f"Forex refresh task failed: {e}")
+        run_screener(stocks=False)
     else:
         print_info("Skipping forex screener.")
 
     # Step 3: Start backend
     print("\n3. Starting backend server...")
     start_backend()
-    wait_for_backend()
 
     # Step 4: Start frontend
     print("\n4. Starting frontend server...")
     start_frontend()
-    wait_for_frontend()
+
+    # Both servers boot in parallel; each probe runs on its own thread while
+    # this one prints a single progress line and handles the outcome
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = {
+            executor.submit(wait_for_backend): ('Backend', backend_process, f"http://localhost:{BACKEND_PORT}"),
+            executor.submit(wait_for_frontend): ('Frontend', frontend_process, FRONTEND_URL),
+        }
+        while pending:
+            done, _ = wait(pending, timeout=HEALTH_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+            if done:
+                print(' ' * 60, end='\r')
+            for future in done:
+                name, process, url = pending.pop(future)
+                if future.result():
+                    print_success(f"{name} ready on {url}")
+                    continue
+                if process and process.poll() is not None:
+                    print_error(f"{name} exited with code {process.returncode} before becoming ready")
+                else:
+                    print_error(f"{name} failed to start within {HEALTH_CHECK_TIMEOUT} seconds")
+                for server in (backend_process, frontend_process):
+                    if server:
+                        server.terminate()
+                sys.exit(1)
+            if pending:
+                waiting = ' and '.join(name.lower() for name, _, _ in pending.values())
+                elapsed = int(time.time() - start_time)
+                print(f"  Waiting for {waiting}... ({elapsed}s/{HEALTH_CHECK_TIMEOUT}s)", end='\r')
 
     # Step 5: Open browser
     print("\n5. Opening browser...")